@@ -10,13 +10,26 @@ logging.getLogger("httpx").setLevel(logging.WARNING)
 
 import uvicorn
 
-from config import APPLICATION_PORT
+from config import APPLICATION_PORT, APPLICATION_WORKERS, SESSION_STORE_BACKEND
 
 if __name__ == "__main__":
-    uvicorn.run(
-        "src.api.main:app",
-        host="0.0.0.0",
-        port=APPLICATION_PORT,
-        reload=True,
-        reload_excludes=[".venv/*", "__pycache__/*", ".mypy_cache/*"],
-    )
+    if APPLICATION_WORKERS > 1:
+        # sessions must be visible to every worker
+        if SESSION_STORE_BACKEND == "memory":
+            raise SystemExit(
+                "APPLICATION_WORKERS > 1 requires SESSION_STORE_BACKEND=sqlite or redis"
+            )
+        uvicorn.run(
+            "src.api.main:app",
+            host="0.0.0.0",
+            port=APPLICATION_PORT,
+            workers=APPLICATION_WORKERS,
+        )
+    else:
+        uvicorn.run(
+            "src.api.main:app",
+            host="0.0.0.0",
+            port=APPLICATION_PORT,
+            reload=True,
+            reload_excludes=[".venv/*", "__pycache__/*", ".mypy_cache/*"],
+        )
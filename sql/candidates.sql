@@ -34,11 +34,13 @@ CREATE TABLE candidates (
 
   resume_file_name TEXT,
   parsed_resume TEXT,
+  resume_hash TEXT,
   specialized_technical_skills JSONB,
   current_project TEXT,
   other_notable_projects JSONB,
   potential_flags JSONB,
   resume_notes TEXT,
+  resume_summary_key TEXT,
   interview_transcript TEXT,
   scorecard JSONB,
   evaluation_summary TEXT,
@@ -51,4 +53,92 @@ CREATE TABLE candidates (
   -- Timestamps
   created_at TIMESTAMPTZ DEFAULT now(),
   updated_at TIMESTAMPTZ DEFAULT now()
-);
\ No newline at end of file
+);
+-- Content hash (storage ETag or sha256) of the file parsed_resume was extracted from.
+ALTER TABLE candidates ADD COLUMN IF NOT EXISTS resume_hash TEXT;
+
+-- Memo key (resume hash, resume prompt hash, model) the stored resume summary was generated for.
+ALTER TABLE candidates ADD COLUMN IF NOT EXISTS resume_summary_key TEXT;
+
+-- Lookups used when matching Calendly invitees to existing candidates.
+-- Phone numbers are stored normalized to E.164; emails are matched case-insensitively.
+-- Existing duplicate phones/emails must be merged before these can be created.
+CREATE UNIQUE INDEX IF NOT EXISTS candidates_phone_key
+  ON candidates (phone)
+  WHERE phone IS NOT NULL AND phone <> '';
+
+CREATE UNIQUE INDEX IF NOT EXISTS candidates_email_key
+  ON candidates (lower(email))
+  WHERE email IS NOT NULL AND email <> '';
+
+-- Resolve (by phone, then email) or create a candidate in a single round trip.
+-- Returns the candidate_id.
+CREATE OR REPLACE FUNCTION upsert_candidate_from_calendly(
+  p_name TEXT,
+  p_email TEXT,
+  p_phone TEXT,
+  p_status TEXT,
+  p_scheduled_time TIMESTAMPTZ DEFAULT NULL
+) RETURNS UUID
+LANGUAGE plpgsql
+AS $$
+DECLARE
+  v_candidate_id UUID;
+BEGIN
+  LOOP
+    SELECT candidate_id INTO v_candidate_id
+      FROM candidates
+     WHERE p_phone IS NOT NULL AND p_phone <> '' AND phone = p_phone
+     LIMIT 1;
+
+    IF v_candidate_id IS NULL THEN
+      SELECT candidate_id INTO v_candidate_id
+        FROM candidates
+       WHERE p_email IS NOT NULL AND p_email <> '' AND lower(email) = lower(p_email)
+       LIMIT 1;
+    END IF;
+
+    IF v_candidate_id IS NOT NULL THEN
+      BEGIN
+        -- an identifier held by another candidate (phone matched this one,
+        -- email matched someone else) is not taken over, the stored one stays
+        UPDATE candidates c
+           SET name = p_name,
+               email = CASE
+                 WHEN p_email IS NULL OR p_email = '' OR EXISTS (
+                   SELECT 1 FROM candidates o
+                    WHERE lower(o.email) = lower(p_email)
+                      AND o.candidate_id <> v_candidate_id
+                 ) THEN c.email
+                 ELSE p_email
+               END,
+               phone = CASE
+                 WHEN p_phone IS NULL OR p_phone = '' OR EXISTS (
+                   SELECT 1 FROM candidates o
+                    WHERE o.phone = p_phone
+                      AND o.candidate_id <> v_candidate_id
+                 ) THEN c.phone
+                 ELSE p_phone
+               END,
+               status = p_status,
+               scheduled_time = COALESCE(p_scheduled_time, c.scheduled_time),
+               updated_at = now()
+         WHERE c.candidate_id = v_candidate_id;
+        RETURN v_candidate_id;
+      EXCEPTION WHEN unique_violation THEN
+        -- a concurrent booking took the identifier after the check, retry
+      END;
+      CONTINUE;
+    END IF;
+
+    BEGIN
+      INSERT INTO candidates (name, email, phone, status, scheduled_time)
+      VALUES (p_name, p_email, p_phone, p_status, p_scheduled_time)
+      RETURNING candidate_id INTO v_candidate_id;
+      RETURN v_candidate_id;
+    EXCEPTION WHEN unique_violation THEN
+      -- a concurrent booking inserted the same phone/email first, match it instead
+    END;
+  END LOOP;
+END;
+$$;
@@ -0,0 +1,48 @@
+-- Checks for upsert_candidate_from_calendly. Run against a database with
+-- candidates.sql applied:
+--   psql "$SUPABASE_DB_URL" -v ON_ERROR_STOP=1 -f sql/tests/upsert_candidate_from_calendly.sql
+-- Everything runs in a transaction that is rolled back.
+BEGIN;
+
+DO $$
+DECLARE
+  v_a UUID;
+  v_b UUID;
+  v_id UUID;
+  v_row candidates%ROWTYPE;
+BEGIN
+  v_a := upsert_candidate_from_calendly('A', 'a@example.com', '+15550000001', 'SCHEDULED');
+  v_b := upsert_candidate_from_calendly('B', 'b@example.com', '+15550000002', 'SCHEDULED');
+  ASSERT v_a <> v_b, 'distinct invitees create distinct candidates';
+
+  -- same invitee, email case differs
+  v_id := upsert_candidate_from_calendly('A', 'A@Example.com', '+15550000001', 'SCHEDULED');
+  ASSERT v_id = v_a, 'a repeated booking matches the existing candidate';
+
+  -- phone matches A, email belongs to B
+  v_id := upsert_candidate_from_calendly('A2', 'b@example.com', '+15550000001', 'RESCHEDULED');
+  ASSERT v_id = v_a, 'the phone match wins';
+  SELECT * INTO v_row FROM candidates WHERE candidate_id = v_a;
+  ASSERT lower(v_row.email) = 'a@example.com', 'B''s email is not taken over';
+  ASSERT v_row.name = 'A2' AND v_row.status = 'RESCHEDULED', 'the rest is updated';
+  SELECT * INTO v_row FROM candidates WHERE candidate_id = v_b;
+  ASSERT v_row.email = 'b@example.com', 'B keeps its email';
+
+  -- email matches B, phone belongs to A
+  v_id := upsert_candidate_from_calendly('B', 'b@example.com', '+15550000001', 'SCHEDULED');
+  ASSERT v_id = v_a, 'the phone match wins over the email match';
+
+  -- new phone for B, matched by email
+  v_id := upsert_candidate_from_calendly('B', 'b@example.com', '+15550000003', 'SCHEDULED');
+  ASSERT v_id = v_b, 'B is matched by email';
+  SELECT * INTO v_row FROM candidates WHERE candidate_id = v_b;
+  ASSERT v_row.phone = '+15550000003', 'a free phone number is taken';
+
+  -- no phone given, the stored one stays
+  v_id := upsert_candidate_from_calendly('B', 'b@example.com', '', 'CANCELED');
+  SELECT * INTO v_row FROM candidates WHERE candidate_id = v_b;
+  ASSERT v_id = v_b AND v_row.phone = '+15550000003', 'an empty phone is not written';
+END;
+$$;
+
+ROLLBACK;
@@ -1,17 +1,134 @@
+"""
+LLM cost attribution from a local pricing table.
+
+Prices ship with the code in `llm_pricing.json` (USD per 1M tokens, versioned
+by its "version" field). `refresh_pricing` can optionally pull newer prices
+from tokonomics in the background and saves them to LLM_PRICING_CACHE_PATH,
+which overrides the bundled table on the next start. `compute_llm_cost` itself
+is a dictionary lookup and never does I/O.
+"""
+
+import asyncio
+import json
+import logging
+import os
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Dict, Iterable
+
 from pydantic_ai.usage import Usage
-from tokonomics import calculate_pydantic_cost
 
+from config import LLM_PRICING_CACHE_PATH, LLM_PRICING_REFRESH_HOURS
 from models.llm_cost import LLMCost
 
+logger = logging.getLogger(__name__)
+
+BUNDLED_PRICING_PATH = os.path.join(os.path.dirname(__file__), "llm_pricing.json")
+
+TOKENS_PER_UNIT = 1_000_000
+
+
+def load_pricing() -> Dict[str, Dict[str, float]]:
+    with open(BUNDLED_PRICING_PATH, encoding="utf-8") as f:
+        bundled = json.load(f)
+    models = dict(bundled["models"])
+
+    try:
+        with open(LLM_PRICING_CACHE_PATH, encoding="utf-8") as f:
+            refreshed = json.load(f)
+        for model, prices in refreshed["models"].items():
+            models[model] = {**models.get(model, {}), **prices}
+        logger.info(f"Loaded refreshed LLM pricing from {refreshed.get('version')}")
+    except FileNotFoundError:
+        pass
+    except (json.JSONDecodeError, KeyError) as e:
+        logger.warning(
+            f"Ignoring unreadable pricing cache {LLM_PRICING_CACHE_PATH}: {e}"
+        )
+
+    return models
+
+
+PRICING = load_pricing()
+
 
-async def compute_llm_cost(usage: Usage, model: str) -> LLMCost:
+@lru_cache(maxsize=64)
+def normalize_model_name(model: str) -> str:
+    """'openai:gpt-4o-mini' -> 'gpt-4o-mini'"""
+    return model.split(":", 1)[-1].strip().lower()
 
-    costs = await calculate_pydantic_cost(model=model, usage=usage)
-    if not costs:
-        raise ValueError(f"Could not calculate cost for model: {model}")
+
+def compute_llm_cost(usage: Usage, model: str) -> LLMCost:
+    """
+    Cost of `usage` at `model`'s prices. A model missing from the pricing table
+    is costed at zero with a warning, a missing price must never keep an
+    interview from being saved.
+    """
+    prices = PRICING.get(normalize_model_name(model or ""))
+    if not prices:
+        logger.warning(f"No pricing for model {model}, recording its cost as 0")
+        return LLMCost(prompt_cost=0.0, completion_cost=0.0, total_cost=0.0)
+
+    request_tokens = usage.request_tokens or 0
+    cached_tokens = min((usage.details or {}).get("cached_tokens", 0), request_tokens)
+    cached_price = prices.get("cached_input", prices["input"])
+
+    prompt_cost = (
+        (request_tokens - cached_tokens) * prices["input"]
+        + cached_tokens * cached_price
+    ) / TOKENS_PER_UNIT
+    completion_cost = (usage.response_tokens or 0) * prices["output"] / TOKENS_PER_UNIT
 
     return LLMCost(
-        prompt_cost=costs.prompt_cost,
-        completion_cost=costs.completion_cost,
-        total_cost=costs.total_cost,
+        prompt_cost=prompt_cost,
+        completion_cost=completion_cost,
+        total_cost=prompt_cost + completion_cost,
     )
+
+
+async def refresh_pricing(models: Iterable[str]):
+    """
+    Fetch current prices for `models` from tokonomics and save them as the
+    local pricing override. Models it cannot price keep their current entry.
+    """
+    from tokonomics import get_model_costs
+
+    refreshed = {}
+    for model in {normalize_model_name(m) for m in models if m}:
+        costs = await get_model_costs(model)
+        if not costs:
+            logger.warning(f"No remote pricing for {model}, keeping local price")
+            continue
+        refreshed[model] = {
+            "input": costs["input_cost_per_token"] * TOKENS_PER_UNIT,
+            "output": costs["output_cost_per_token"] * TOKENS_PER_UNIT,
+        }
+
+    if not refreshed:
+        return
+
+    # swap in a new dict so concurrent lookups never see a partial update
+    global PRICING
+    PRICING = {
+        **PRICING,
+        **{m: {**PRICING.get(m, {}), **p} for m, p in refreshed.items()},
+    }
+
+    os.makedirs(os.path.dirname(LLM_PRICING_CACHE_PATH) or ".", exist_ok=True)
+    tmp_path = f"{LLM_PRICING_CACHE_PATH}.{os.getpid()}.tmp"
+    version = datetime.now(timezone.utc).isoformat(timespec="seconds")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump({"version": version, "models": refreshed}, f, indent=2)
+    os.replace(tmp_path, LLM_PRICING_CACHE_PATH)
+    logger.info(f"Refreshed LLM pricing for {sorted(refreshed)}")
+
+
+async def refresh_pricing_periodically(models: Iterable[str]):
+    """Background loop started by the app lifespan when enabled."""
+    models = list(models)
+    while True:
+        try:
+            await refresh_pricing(models)
+        except Exception as e:
+            logger.warning(f"LLM pricing refresh failed, keeping local prices: {e}")
+        await asyncio.sleep(LLM_PRICING_REFRESH_HOURS * 3600)
@@ -3,7 +3,6 @@ from pydantic_ai import Agent, RunContext
 
 from agents.agent_config import EVALUATION_AGENT_PROMPT
 from config import EVALUATION_LLM_MODEL, OPENAI_KEY
-from db.candidate_repository import update_candidate_by_id
 from models.agent_dependencies import AgentDependencies
 from models.candidate import CandidateEvaluation
 
@@ -26,9 +25,8 @@ async def update_candidate_evaluation_in_db(
 
     candidate = ctx.deps.candidate
 
+    # recorded on the candidate, the caller persists it with its other updates
     candidate.evaluation = candidate_evaluation
     candidate.status = "EVALUATION_GENERATED"
 
-    response = update_candidate_by_id(candidate=candidate)
-
-    return response
+    return "Evaluation recorded"
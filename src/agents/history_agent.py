@@ -0,0 +1,20 @@
+import logfire
+from pydantic_ai import Agent
+
+from agents.agent_config import HISTORY_SUMMARY_PROMPT
+from config import INTERVIEW_LLM_MODEL, OPENAI_KEY
+
+# Configure logging
+logfire.configure(send_to_logfire="if-token-present")
+
+model = INTERVIEW_LLM_MODEL
+openai_key = OPENAI_KEY
+
+# same model as the interviewer, its cost is accounted as interview cost
+history_agent = Agent(
+    model=model,
+    system_prompt=HISTORY_SUMMARY_PROMPT,
+    temperature=0.3,
+    output_type=str,
+    instrument=True,
+)
@@ -4,7 +4,7 @@ from pydantic_ai import Agent, RunContext
 from agents.agent_config import RESUME_AGENT_PROMPT
 from config import OPENAI_KEY, RESUME_LLM_MODEL
 from models.agent_dependencies import AgentDependencies
-from tools.resume_parser import parse_resume_from_url
+from services.resume import load_resume_text
 
 # Configure logging
 logfire.configure(send_to_logfire="if-token-present")
@@ -26,8 +26,4 @@ resume_agent = Agent(
 async def fetch_candidate_resume(ctx: RunContext[AgentDependencies]) -> str:
 
     candidate = ctx.deps.candidate
-    resume_url = candidate.profile.resume_url
-    parsed_resume = parse_resume_from_url(resume_url)
-    candidate.parsed_resume = parsed_resume
-
-    return parsed_resume
+    return await load_resume_text(candidate)
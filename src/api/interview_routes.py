@@ -1,12 +1,13 @@
 import asyncio
 import json
 import logging
-import re
+import time
 from datetime import datetime, timezone
-from typing import List
+from typing import List, Optional
 
 from fastapi import APIRouter, BackgroundTasks, HTTPException, Request
-from fastapi.responses import StreamingResponse
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from pydantic import ValidationError
 from pydantic_ai.usage import Usage
 
 from agents.agent_cost import compute_llm_cost
@@ -14,84 +15,101 @@ from agents.evaluation_agent import evaluation_agent
 from agents.interview_agent import interview_agent
 from config import (
     CALENDLY_MEETING_URL,
-    CANDIDATE_ID_TESTING,
     EVALUATION_LLM_MODEL,
+    INTERVIEW_FILLER_ENABLED,
     INTERVIEW_LLM_MODEL,
-    RESUME_LLM_MODEL,
+    INTERVIEW_STREAMING_ENABLED,
 )
-from db.candidate_repository import get_candidate_by_id, update_candidate_by_id
+from db.async_candidate_repository import (
+    ensure_candidate_field,
+    get_candidate_by_id,
+    update_candidate_by_id,
+)
+from db.candidate_cache import cache_candidate, get_cached_candidate
+from db.job_queue import post_interview_queue
+from db.session_store import encode_session, session_store
 from models.agent_dependencies import AgentDependencies
+from models.interviewer_turn import InterviewerTurn, TurnOutcome
 from models.llm_cost import AgentLLMCost
-from models.session_state import SessionState, session_store
+from models.session_state import SessionState
 from models.vapi_request import VAPIRequest
+from services.filler import filler_prompt_note, pick_filler
+from services.history import (
+    build_agent_history,
+    compact_session_history,
+    needs_compaction,
+    record_interrupted_turn,
+    record_spoken_reply,
+    record_turn_input_tokens,
+)
 from services.interview import run_interview
+from services.post_interview import hang_up_call
+from services.scripted_phases import scripted_turn
 from tools.calendly_handler import dispatch_event, extract_event_id
 from tools.scheduler import (
     cancel_interview,
+    remove_interview_jobs,
     schedule_interview,
     scheduler,
-    start_scheduler,
 )
-from tools.vapi_client import end_vapi_call, get_vapi_call
+from tools.vapi_client import get_vapi_call, vapi_client
+from utils.json_stream import JsonStringFieldStream, sanitize_llm_json
+from utils.metrics import (
+    CHAT_STAGE_SECONDS,
+    registry,
+    track_agent_run,
+)
+from utils.tts import normalize_for_tts, tts_normalizer
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
-start_scheduler()
 
 
-def parse_agent_output(raw_output: str):
-    try:
-        response = json.loads(raw_output)
-        agent_response = response.get("agent_response", "").strip()
-        turn_outcome = response.get("turn_outcome", "").strip().upper()
-        turn_outcome_reasoning = response.get("turn_outcome_reasoning", "").strip()
-
-        valid_outcomes = {
-            "NORMAL",
-            "WRAP_UP",
-            "GATEKEEPER_FAILURE_ALREADY_INTERVIEWED",
-            "GATEKEEPER_FAILURE_INOFFICE_NOTPOSSIBLE",
-            "CANDIDATE_REQUESTING_END_CALL",
-        }
-
-        if not agent_response:
-            agent_response = "I couldn't quite get that, please repeat what you said.."
-
-        if turn_outcome not in valid_outcomes:
-            turn_outcome = "NORMAL"
-
-        if not turn_outcome_reasoning:
-            turn_outcome_reasoning = "NO_TURN_OUTCOME_REASONING_PROVIDED"
-
-        should_end = turn_outcome in {
-            "GATEKEEPER_FAILURE_ALREADY_INTERVIEWED",
-            "GATEKEEPER_FAILURE_INOFFICE_NOTPOSSIBLE",
-            "CANDIDATE_REQUESTING_END_CALL",
-            "WRAP_UP",
-        }
-
-        # Override final agent response if it's a known terminal state
-        if turn_outcome == "GATEKEEPER_FAILURE_ALREADY_INTERVIEWED":
-            agent_response = (
-                "I appreciate you letting me know. Since you've already interviewed with the client, "
-                "I don't want to duplicate efforts. Thank you for your time today—I'll close us out here."
-            )
-        elif turn_outcome == "GATEKEEPER_FAILURE_INOFFICE_NOTPOSSIBLE":
-            agent_response = (
-                "Thanks for being upfront. Client has a strict three-day in-office policy, "
-                "so this role wouldn't be a fit. I'll wrap up our call now, and we'll keep you in mind "
-                "for other opportunities. Take care!"
-            )
+def parse_interviewer_turn(raw_output: str) -> InterviewerTurn:
+    """
+    Validate the interview agent's JSON envelope into an InterviewerTurn.
 
-        return agent_response, turn_outcome, turn_outcome_reasoning, should_end
+    Well-formed output is validated directly. Output wrapped in code fences or
+    with trailing commas is sanitized first, and output that is cut off or not
+    JSON at all still yields whatever reply can be recovered, so a malformed
+    envelope never costs the candidate a repeated turn.
+    """
+    try:
+        return InterviewerTurn.model_validate_json(raw_output)
+    except ValidationError:
+        pass
 
-    except json.JSONDecodeError:
-        return (
-            "I couldn't quite get that, please repeat what you said..",
-            "NORMAL",
-            False,
+    try:
+        return InterviewerTurn.model_validate_json(sanitize_llm_json(raw_output))
+    except ValidationError:
+        logger.warning(f"Interviewer output is not a valid envelope: {raw_output!r}")
+
+    reply_stream = JsonStringFieldStream("agent_response")
+    agent_response = reply_stream.feed(raw_output)
+    if not agent_response and "{" not in raw_output:
+        # plain text instead of the envelope, speak it as is
+        agent_response = raw_output
+    return InterviewerTurn(agent_response=agent_response)
+
+
+def parse_agent_output(raw_output: str) -> InterviewerTurn:
+    turn = parse_interviewer_turn(raw_output)
+
+    # Override final agent response if it's a known terminal state
+    if turn.turn_outcome == TurnOutcome.GATEKEEPER_FAILURE_ALREADY_INTERVIEWED:
+        turn.agent_response = (
+            "I appreciate you letting me know. Since you've already interviewed with the client, "
+            "I don't want to duplicate efforts. Thank you for your time today—I'll close us out here."
         )
+    elif turn.turn_outcome == TurnOutcome.GATEKEEPER_FAILURE_INOFFICE_NOTPOSSIBLE:
+        turn.agent_response = (
+            "Thanks for being upfront. Client has a strict three-day in-office policy, "
+            "so this role wouldn't be a fit. I'll wrap up our call now, and we'll keep you in mind "
+            "for other opportunities. Take care!"
+        )
+
+    return turn
 
 
 @router.get("/healthz")
@@ -119,13 +137,21 @@ async def calendly_webhook(request: Request):
     logger.info(f"Incoming Calendly event_type: {event_type} event: {event}")
 
     try:
-        result = dispatch_event(event_type, payload)
+        result = await dispatch_event(event_type, payload)
         candidate_id = result["candidate_id"]
 
+        # the job store is queried and written synchronously, keep it off the loop
         if event_type == "invitee.created":
-            schedule_interview(candidate_id, event, result["scheduled_time"])
+            scheduled = await asyncio.to_thread(
+                schedule_interview, candidate_id, event, result["scheduled_time"]
+            )
+            return {
+                "status": result["status"],
+                "candidate_id": candidate_id,
+                "over_capacity": scheduled["over_capacity"],
+            }
         elif event_type == "invitee.canceled":
-            cancel_interview(candidate_id, event)
+            await asyncio.to_thread(cancel_interview, candidate_id, event)
 
         return {"status": result["status"], "candidate_id": candidate_id}
 
@@ -156,23 +182,28 @@ async def vapi_webhook(request: Request, background_tasks: BackgroundTasks):
 async def start_interview(candidate_id: str):
     return await run_interview(candidate_id)
 
+
 @router.post("/evaluate/{candidate_id}")
 async def evaluate_interview(candidate_id: str):
     logger.info(f"[ADHOC_RUN] Starting evaluation for candidate: {candidate_id}")
-    candidate = get_candidate_by_id(candidate_id)
+    candidate = await get_candidate_by_id(
+        candidate_id, field_groups=("profile", "transcript")
+    )
     deps = AgentDependencies(candidate=candidate)
     full_transcript = candidate.interview_transcript
     logger.info(f"Transcript: {full_transcript}")
     evaluation_agent_usage = Usage()
     try:
-        result = await evaluation_agent.run(
-            user_prompt=full_transcript, usage=evaluation_agent_usage, deps=deps
-        )
-        logger.info(f"[ADHOC_RUN] Evaluation results: {candidate.evaluation}")
+        with track_agent_run("evaluation", EVALUATION_LLM_MODEL):
+            await evaluation_agent.run(
+                user_prompt=full_transcript, usage=evaluation_agent_usage, deps=deps
+            )
+        evaluation = await ensure_candidate_field(candidate, "evaluation")
+        logger.info(f"[ADHOC_RUN] Evaluation results: {evaluation}")
     except Exception as e:
         logger.error(f"[ADHOC_RUN] [Error] running evaluation_agent: {e}")
-    
-    evaluation_agent_cost = await compute_llm_cost(
+
+    evaluation_agent_cost = compute_llm_cost(
         evaluation_agent_usage, EVALUATION_LLM_MODEL
     )
 
@@ -185,29 +216,23 @@ async def evaluate_interview(candidate_id: str):
     candidate.llm_cost = total_llm_cost
     candidate.agent_llm_cost = agent_llm_cost
     logger.info(f"[ADHOC_RUN] Total interview cost {total_llm_cost}")
-    update_candidate_by_id(candidate=candidate)
+    await update_candidate_by_id(candidate=candidate)
 
     return {"status": "ok"}
 
 
-
-@router.post("/chat/completions")
-async def vapi_chat_completions(req: VAPIRequest, background_tasks: BackgroundTasks):
+async def start_turn(req: VAPIRequest) -> tuple[SessionState, str]:
+    """Load the call's session, record the candidate's words and build the prompt."""
     session_id = str(req.call.id)
     candidate_response = req.messages[-1].content
 
-    # only for testing
-    if session_id in session_store:
-        session = session_store[session_id]
-    else:
-        call_data = await get_vapi_call(req.call.id)
-        session = create_session_from_call_data(call_data)
+    with CHAT_STAGE_SECONDS.time(stage="session_lookup"):
+        session = await session_store.get(session_id)
+    if not session:
+        with CHAT_STAGE_SECONDS.time(stage="rehydrate"):
+            session = await rehydrate_session(req)
 
-    now = datetime.now(timezone.utc)
     deps = session.agent_dependencies
-    agent = session.agent
-    history = session.message_history
-    interview_agent_usage = session.interview_agent_usage
 
     logger.info(f"[{session_id}] role: candidate, content: {candidate_response}")
 
@@ -221,56 +246,96 @@ async def vapi_chat_completions(req: VAPIRequest, background_tasks: BackgroundTa
 
     prompt = ""
 
-    if not history:
+    if not session.message_history:
         prompt += candidate_intro + "\n"
 
     prompt += f'Candidate: "{candidate_response}"'
+    return session, prompt
+
+
+@router.post("/chat/completions")
+async def vapi_chat_completions(req: VAPIRequest, background_tasks: BackgroundTasks):
+    turn_started = time.perf_counter()
+
+    if INTERVIEW_FILLER_ENABLED and INTERVIEW_STREAMING_ENABLED and req.stream:
+        # the filler goes out before the session is even looked up
+        return StreamingResponse(
+            reply_after_filler(req, background_tasks, turn_started),
+            media_type="text/event-stream",
+            headers={
+                "Cache-Control": "no-cache",
+                "Connection": "keep-alive",
+            },
+        )
+
+    session_id = str(req.call.id)
+    session, prompt = await start_turn(req)
+
+    line = scripted_turn(session, req.messages[-1].content, prompt)
+    if line:
+        return StreamingResponse(
+            speak_scripted_line(req, session, line, turn_started),
+            media_type="text/event-stream",
+            headers={
+                "Cache-Control": "no-cache",
+                "Connection": "keep-alive",
+            },
+        )
+
+    deps = session.agent_dependencies
+    agent = session.agent
+    history = session.message_history
+    interview_agent_usage = session.interview_agent_usage
+
+    if INTERVIEW_STREAMING_ENABLED and req.stream:
+        return StreamingResponse(
+            stream_agent_reply(req, session, prompt, background_tasks, turn_started),
+            media_type="text/event-stream",
+            headers={
+                "Cache-Control": "no-cache",
+                "Connection": "keep-alive",
+            },
+        )
 
     # --- Run interview agent ---
-    response = await agent.run(
-        user_prompt=prompt,
-        deps=deps,
-        usage=interview_agent_usage,
-        message_history=history,
-    )
+    request_tokens_before = interview_agent_usage.request_tokens or 0
+    with (
+        CHAT_STAGE_SECONDS.time(stage="agent_run"),
+        track_agent_run("interview", INTERVIEW_LLM_MODEL),
+    ):
+        response = await agent.run(
+            user_prompt=prompt,
+            deps=deps,
+            usage=interview_agent_usage,
+            message_history=build_agent_history(session),
+        )
     raw_output = response.output
+    input_tokens = record_turn_input_tokens(session, request_tokens_before)
 
-    agent_response, turn_outcome, turn_outcome_reasoning, should_end = (
-        parse_agent_output(raw_output)
-    )
+    turn = parse_agent_output(raw_output)
 
-    tts_reply = normalize_for_tts(agent_response)
+    tts_reply = normalize_for_tts(turn.agent_response)
     logger.info(
-        f"[{session_id}] role: interviewer, turn_outcome: {turn_outcome}, turn_outcome_reasoning: {turn_outcome_reasoning}, content: {tts_reply}"
+        f"[{session_id}] role: interviewer, turn_outcome: {turn.turn_outcome.value}, turn_outcome_reasoning: {turn.turn_outcome_reasoning}, input_tokens: {input_tokens}, content: {tts_reply}"
     )
     # Record interviewer turn
-    session.transcript.append({"role": "interviewer", "content": agent_response})
+    session.transcript.append({"role": "interviewer", "content": turn.agent_response})
 
-    session.message_history = response.all_messages()
-
-    # Prepare the streaming response
-    final_response = {
-        "id": f"chatcmpl-{session_id}",
-        "object": "chat.completion.chunk",
-        "created": int(req.timestamp / 1000),
-        "model": INTERVIEW_LLM_MODEL,
-        "choices": [
-            {
-                "delta": {"content": tts_reply},
-                "index": 0,
-                "finish_reason": "stop",
-            }
-        ],
-    }
+    # the agent may have seen a compacted history, keep the full one
+    session.message_history = [*history, *response.new_messages()]
 
     async def stream():
-        yield f"data: {json.dumps(final_response)}\n\n"
+        yield completion_chunk(req, tts_reply, finish_reason="stop")
         yield "data: [DONE]\n\n"
+        CHAT_STAGE_SECONDS.observe(time.perf_counter() - turn_started, stage="turn")
         # If interview is over, schedule post-call tasks
         # session_end_call helps to end the call only once
-        if should_end and not session.end_call:
+        if turn.turn_outcome.ends_call and not session.end_call:
             session.end_call = True
             background_tasks.add_task(post_interview_tasks, session_id, True)
+        await save_turn_session(session_id, session)
+        if not session.end_call and needs_compaction(session):
+            background_tasks.add_task(compact_session_history, session_id)
 
     return StreamingResponse(
         stream(),
@@ -282,10 +347,231 @@ async def vapi_chat_completions(req: VAPIRequest, background_tasks: BackgroundTa
     )
 
 
+async def reply_after_filler(
+    req: VAPIRequest, background_tasks: BackgroundTasks, turn_started: float
+):
+    """
+    Speak a short acknowledgment right away, then stream the agent's reply
+    behind it. The agent is told about the filler and the recorded history
+    carries it, so the reply does not open with a second one.
+
+    The response has started once the filler is out, so a failure after it
+    (no session, agent error) is logged and ends the stream normally.
+    """
+    session_id = str(req.call.id)
+    filler = pick_filler(req.messages[-1].content)
+    yield completion_chunk(req, f"{filler} ")
+    CHAT_STAGE_SECONDS.observe(time.perf_counter() - turn_started, stage="filler")
+
+    done = False
+    try:
+        session, prompt = await start_turn(req)
+
+        line = scripted_turn(session, req.messages[-1].content, prompt, filler=filler)
+        if line:
+            reply = speak_scripted_line(req, session, line, turn_started)
+        else:
+            prompt += f"\n{filler_prompt_note(filler)}"
+            reply = stream_agent_reply(
+                req, session, prompt, background_tasks, turn_started, filler=filler
+            )
+
+        async for chunk in reply:
+            done = done or chunk == "data: [DONE]\n\n"
+            yield chunk
+    except Exception:
+        logger.exception(f"[{session_id}] [Error] turn failed after the filler")
+        if not done:
+            yield completion_chunk(req, finish_reason="stop")
+            yield "data: [DONE]\n\n"
+
+
+async def speak_scripted_line(
+    req: VAPIRequest, session: SessionState, line: str, turn_started: float
+):
+    """A scripted opening line, see services/scripted_phases.py."""
+    try:
+        yield completion_chunk(req, normalize_for_tts(line))
+        yield completion_chunk(req, finish_reason="stop")
+        yield "data: [DONE]\n\n"
+        CHAT_STAGE_SECONDS.observe(time.perf_counter() - turn_started, stage="turn")
+    finally:
+        # shielded, a disconnect cancels the response task while it runs
+        await asyncio.shield(save_turn_session(str(req.call.id), session))
+
+
+async def stream_agent_reply(
+    req: VAPIRequest,
+    session: SessionState,
+    prompt: str,
+    background_tasks: BackgroundTasks,
+    turn_started: float,
+    filler: str = "",
+):
+    """
+    Streaming variant of the interviewer turn.
+
+    Runs the interview agent in streaming mode and forwards the `agent_response`
+    field of its JSON envelope to VAPI as it is generated, one
+    `chat.completion.chunk` per word-aligned delta. `turn_outcome` and
+    `turn_outcome_reasoning` are resolved from the full output once the stream
+    has finished. A `filler` already spoken is prepended in the transcript and
+    message history.
+    """
+    session_id = str(req.call.id)
+    reply_stream = JsonStringFieldStream("agent_response")
+    tts_stream = tts_normalizer.stream()
+    spoken = []
+    history = session.message_history
+    request_tokens_before = session.interview_agent_usage.request_tokens or 0
+    recorded = False
+
+    try:
+        with (
+            CHAT_STAGE_SECONDS.time(stage="agent_run"),
+            track_agent_run("interview", INTERVIEW_LLM_MODEL),
+        ):
+            async with session.agent.run_stream(
+                user_prompt=prompt,
+                deps=session.agent_dependencies,
+                usage=session.interview_agent_usage,
+                message_history=build_agent_history(session),
+            ) as response:
+                async for delta in response.stream_text(delta=True, debounce_by=None):
+                    # held back until no lexicon term can be cut in half
+                    ready, tts_ready = tts_stream.feed(reply_stream.feed(delta))
+                    if ready:
+                        if not spoken:
+                            CHAT_STAGE_SECONDS.observe(
+                                time.perf_counter() - turn_started, stage="first_chunk"
+                            )
+                        spoken.append(ready)
+                        yield completion_chunk(req, tts_ready)
+
+                # the agent may have seen a compacted history, keep the full one
+                session.message_history = [*history, *response.new_messages()]
+
+        input_tokens = record_turn_input_tokens(session, request_tokens_before)
+
+        pending, tts_pending = tts_stream.flush()
+        if pending:
+            if not spoken:
+                CHAT_STAGE_SECONDS.observe(
+                    time.perf_counter() - turn_started, stage="first_chunk"
+                )
+            spoken.append(pending)
+            yield completion_chunk(req, tts_pending)
+
+        turn = parse_agent_output(reply_stream.raw)
+
+        spoken_reply = "".join(spoken).strip()
+        if not spoken_reply:
+            # output was not the expected JSON envelope, fall back to the parsed reply
+            spoken_reply = turn.agent_response
+            spoken.append(spoken_reply)
+            yield completion_chunk(req, normalize_for_tts(turn.agent_response))
+
+        if filler:
+            spoken_reply = f"{filler} {spoken_reply}"
+            session.message_history = record_spoken_reply(
+                session.message_history, turn, spoken_reply
+            )
+
+        # Terminal-state overrides from parse_agent_output cannot be applied to text
+        # that has already been spoken, so the transcript records what was streamed.
+        logger.info(
+            f"[{session_id}] role: interviewer, turn_outcome: {turn.turn_outcome.value}, turn_outcome_reasoning: {turn.turn_outcome_reasoning}, input_tokens: {input_tokens}, content: {spoken_reply}"
+        )
+        session.transcript.append({"role": "interviewer", "content": spoken_reply})
+        recorded = True
+
+        if turn.turn_outcome.ends_call and not session.end_call:
+            session.end_call = True
+            background_tasks.add_task(post_interview_tasks, session_id, True)
+        if not session.end_call and needs_compaction(session):
+            background_tasks.add_task(compact_session_history, session_id)
+
+        yield completion_chunk(req, finish_reason="stop")
+        yield "data: [DONE]\n\n"
+        CHAT_STAGE_SECONDS.observe(time.perf_counter() - turn_started, stage="turn")
+    finally:
+        if not recorded:
+            # cut off by a barge-in, a hang-up or an error: keep what the
+            # candidate said and heard so the next turn does not lose it
+            spoken_reply = " ".join(filter(None, [filler, "".join(spoken).strip()]))
+            logger.info(
+                f"[{session_id}] role: interviewer, interrupted, content: {spoken_reply}"
+            )
+            session.message_history = record_interrupted_turn(
+                history, prompt, spoken_reply
+            )
+            if spoken_reply:
+                session.transcript.append(
+                    {"role": "interviewer", "content": spoken_reply}
+                )
+        # shielded, a disconnect cancels the response task while it runs
+        await asyncio.shield(save_turn_session(session_id, session))
+
+
+async def save_turn_session(session_id: str, session: SessionState):
+    """
+    Put the session back after a turn. If the call ended while the turn ran,
+    `post_interview_tasks` has already queued and deleted the session, and
+    the put would bring it back as a live call, so it is deleted again.
+    Checking after the put also catches an end that races with it.
+    """
+    await session_store.put(session_id, session)
+    if await post_interview_queue.has_job(session_id):
+        logger.info(f"[{session_id}] Call ended during the turn, dropping its session")
+        await session_store.delete(session_id)
+
+
+def completion_chunk(
+    req: VAPIRequest, content: Optional[str] = None, finish_reason: Optional[str] = None
+) -> str:
+    """Serialize one OpenAI-style `chat.completion.chunk` SSE event."""
+    chunk = {
+        "id": f"chatcmpl-{req.call.id}",
+        "object": "chat.completion.chunk",
+        "created": int(req.timestamp / 1000),
+        "model": INTERVIEW_LLM_MODEL,
+        "choices": [
+            {
+                "delta": {"content": content} if content is not None else {},
+                "index": 0,
+                "finish_reason": finish_reason,
+            }
+        ],
+    }
+    return f"data: {json.dumps(chunk)}\n\n"
+
+
+@router.get("/sessions/stats")
+async def session_store_stats():
+    return await session_store.stats()
+
+
+@router.get("/vapi/stats")
+def vapi_client_stats():
+    return vapi_client.stats()
+
+
+@router.get("/jobs/post-interview/stats")
+async def post_interview_queue_stats():
+    return await post_interview_queue.stats()
+
+
+@router.get("/metrics")
+def metrics():
+    return PlainTextResponse(
+        registry.render(), media_type="text/plain; version=0.0.4; charset=utf-8"
+    )
+
+
 @router.get("/scheduled-interviews", response_model=List[dict])
 def list_scheduled_jobs():
     jobs_info = []
-    for job in scheduler.get_jobs():
+    for job in scheduler.get_jobs(jobstore="default"):
         jobs_info.append(
             {
                 "job_id": job.id,
@@ -300,120 +586,100 @@ def list_scheduled_jobs():
 
 @router.delete("/scheduled-interviews/{job_id}")
 def delete_scheduled_job(job_id: str):
-    job = scheduler.get_job(job_id)
-    if not job:
+    if job_id.endswith("_prewarm"):
+        found = scheduler.get_job(job_id) is not None
+        if found:
+            scheduler.remove_job(job_id)
+    else:
+        # an interview takes its resume pre-warm job with it
+        found = any(remove_interview_jobs(job_id))
+    if not found:
         raise HTTPException(
             status_code=404, detail=f"No scheduled job with id: {job_id}"
         )
 
-    scheduler.remove_job(job_id)
     return {"message": f"Job {job_id} successfully deleted"}
 
 
 async def post_interview_tasks(session_id: str, end_call: bool = True):
     """
     Background task to run after the HTTP response is sent.
-    1. Hang up the VAPI call
-    2. Build transcript, update candidate, run evaluation
+
+    Queues the evaluation and final write on the durable post-interview queue,
+    where a bounded worker pool picks it up, then hangs up the VAPI call.
+    Queueing is idempotent by call id, so a call reported as ended twice is
+    processed once. The session is deleted once queued, the job payload holds
+    its own copy and the call no longer counts as active.
     """
-    session = session_store.get(session_id)
+    session = await session_store.get(session_id)
     if not session:
-        logger.error(f"[Error] no session for {session_id}")
+        if await post_interview_queue.has_job(session_id):
+            logger.info(f"[{session_id}] Post-interview job already queued")
+        else:
+            logger.error(f"[Error] no session for {session_id}")
         return
 
-    control_url = session.control_url
+    queued = await post_interview_queue.enqueue(session_id, encode_session(session))
+    if not queued:
+        logger.info(f"[{session_id}] Post-interview job already queued")
+    await session_store.delete(session_id)
+
     # only end_call if not initiated by caller
     if end_call:
-        try:
-            logger.info(f"[{session_id}] Waiting 30s before ending call...")
-            await asyncio.sleep(30)
-            await end_vapi_call(call_id=session_id, control_url=control_url)
-            logger.info(f"Ended call: {session_id}")
-        except Exception as e:
-            logger.error(f"Error ending call {session_id}: {e}")
-
-    deps = session.agent_dependencies
-    evaluation_agent_usage = session.evaluation_agent_usage
-    candidate = deps.candidate
-
-    # 3) Build full transcript
-    full_transcript = "\n".join(
-        f"{turn['role']}: {turn['content']}" for turn in session.transcript
-    )
-
-    # 4) Update candidate record
-    candidate.interview_transcript = full_transcript
-    candidate.status = "INTERVIEW_COMPLETE"
-    update_candidate_by_id(candidate=candidate)
-
-    # 5) Run the evaluation agent
-    # Since this is sync, spin up a fresh loop
-    try:
-        result = await evaluation_agent.run(
-            user_prompt=full_transcript, usage=evaluation_agent_usage, deps=deps
-        )
-        logger.info(f"[{session_id}] Evaluation results: {candidate.evaluation}")
-    except Exception as e:
-        logger.error(f"[{session_id}] [Error] running evaluation_agent: {e}")
+        await hang_up_call(session_id, session.control_url)
 
-    resume_agent_cost = await compute_llm_cost(
-        session.resume_agent_usage, RESUME_LLM_MODEL
-    )
-    interview_agent_cost = await compute_llm_cost(
-        session.interview_agent_usage, INTERVIEW_LLM_MODEL
-    )
-    evaluation_agent_cost = await compute_llm_cost(
-        session.evaluation_agent_usage, EVALUATION_LLM_MODEL
-    )
-
-    agent_llm_cost = AgentLLMCost(
-        resume_agent=resume_agent_cost,
-        interview_agent=interview_agent_cost,
-        evaluation_agent=evaluation_agent_cost,
-    )
 
-    total_llm_cost = agent_llm_cost.total_llm_cost()
+async def rehydrate_session(req: VAPIRequest) -> SessionState:
+    """
+    Rebuild a session that is not in `session_store` (e.g. after a restart).
 
-    candidate.llm_cost = total_llm_cost
-    candidate.agent_llm_cost = agent_llm_cost
-    logger.info(f"[{session_id}] Total interview cost {total_llm_cost}")
-    update_candidate_by_id(candidate=candidate)
+    The candidate id and controlUrl are taken from the call object VAPI sends
+    with every turn, and the candidate from the local cache populated by
+    `run_interview`. The VAPI API is only queried when the request lacks that
+    metadata, and Supabase only when the candidate is not cached.
 
+    Raises 410 if the call's interview already ended (its session is deleted
+    once the post-interview job is queued).
 
-def normalize_for_tts(text: str) -> str:
-    """
-    Replace tokens that TTS mispronounces:
-      - C#   → CSharp
-      - BIGO1 → BIG O 1
-    (Adjust replacements as needed for other terms.)
+    Side effect: stores the new session in `session_store` under its call_id.
     """
-    replacements = {
-        r"(?<!\w)C#(?!\w)": "CSharp",
-        r"(?<!\w)BIGO1(?!\w)": "BIG O 1",
-        r"(?<!\w)SQL(?!\w)": "S Q L",
-    }
-    for pattern, repl in replacements.items():
-        text = re.sub(pattern, repl, text, flags=re.IGNORECASE)
-    return text
+    call_id = str(req.call.id)
+    candidate_id = req.candidate_id
+    control_url = req.call.control_url
 
+    # a turn arriving while the call is being hung up must not start over
+    if await post_interview_queue.has_job(call_id):
+        logger.info(f"[{call_id}] Interview already ended, not rehydrating")
+        raise HTTPException(
+            status_code=410, detail=f"Interview for call {call_id} has ended"
+        )
 
-# called during an adhoc test
-def create_session_from_call_data(call_data: dict) -> SessionState:
-    """
-    Given the JSON response from GET https://api.vapi.ai/call/{call_id},
-    extract the controlUrl and initialize a new SessionState.
+    if not candidate_id or not control_url:
+        logger.info(f"[{call_id}] Call metadata incomplete, fetching call from VAPI")
+        call_data = await get_vapi_call(req.call.id)
+        control_url = control_url or call_data.get("monitor", {}).get("controlUrl")
+        candidate_id = candidate_id or (
+            call_data.get("assistantOverrides", {})
+            .get("metadata", {})
+            .get("candidate_id")
+        )
 
-    Side effect: stores the new session in `session_store` under its call_id.
-    """
-    call_id = call_data["id"]
-    control_url = call_data["monitor"]["controlUrl"]
+    if not candidate_id:
+        logger.error(f"[{call_id}] No candidate_id in call metadata")
+        raise HTTPException(
+            status_code=404, detail=f"No candidate associated with call {call_id}"
+        )
 
-    candidate = get_candidate_by_id(CANDIDATE_ID_TESTING)
-    deps = AgentDependencies(candidate=candidate)
+    candidate = get_cached_candidate(candidate_id)
+    if candidate:
+        logger.info(f"[{call_id}] Rehydrating session from cached candidate")
+    else:
+        candidate = await get_candidate_by_id(candidate_id)
+        cache_candidate(candidate)
 
     session = SessionState(
         agent=interview_agent,
-        agent_dependencies=deps,
+        agent_dependencies=AgentDependencies(candidate=candidate),
         resume_agent_usage=Usage(),
         interview_agent_usage=Usage(),
         evaluation_agent_usage=Usage(),
@@ -423,5 +689,5 @@ def create_session_from_call_data(call_data: dict) -> SessionState:
         transcript=[],
     )
 
-    session_store[call_id] = session
+    await session_store.put(call_id, session)
     return session
@@ -1,9 +1,25 @@
+import asyncio
 import logging
+import time
+from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 
+from agents.agent_cost import refresh_pricing_periodically
 from api.interview_routes import router as interview_router
+from config import (
+    EVALUATION_LLM_MODEL,
+    INTERVIEW_LLM_MODEL,
+    LLM_PRICING_REFRESH_HOURS,
+    RESUME_LLM_MODEL,
+)
+from db.job_queue import post_interview_queue
+from services.post_interview import run_post_interview_job
+from tools.resume_parser import shutdown_resume_process_pool
+from tools.scheduler import shutdown_scheduler, start_scheduler
+from tools.vapi_client import vapi_client
+from utils.metrics import HTTP_REQUEST_SECONDS
 
 logging.basicConfig(
     level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s"
@@ -12,7 +28,30 @@ logging.basicConfig(
 # Silence noisy httpx logs
 logging.getLogger("httpx").setLevel(logging.WARNING)
 
-app = FastAPI(title="Recruiter Voice Agent")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # shared VAPI connection pool for the lifetime of the app
+    await vapi_client.start()
+    await post_interview_queue.start(run_post_interview_job)
+    start_scheduler()
+    pricing_refresh = None
+    if LLM_PRICING_REFRESH_HOURS > 0:
+        pricing_refresh = asyncio.create_task(
+            refresh_pricing_periodically(
+                [RESUME_LLM_MODEL, INTERVIEW_LLM_MODEL, EVALUATION_LLM_MODEL]
+            )
+        )
+    yield
+    if pricing_refresh:
+        pricing_refresh.cancel()
+    shutdown_scheduler()
+    await post_interview_queue.aclose()
+    await vapi_client.aclose()
+    shutdown_resume_process_pool()
+
+
+app = FastAPI(title="Recruiter Voice Agent", lifespan=lifespan)
 
 # Optional CORS setup for local testing or webhooks
 app.add_middleware(
@@ -23,5 +62,25 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+
+@app.middleware("http")
+async def record_request_latency(request: Request, call_next):
+    started = time.perf_counter()
+    status = "500"
+    try:
+        response = await call_next(request)
+        status = str(response.status_code)
+        return response
+    finally:
+        # label by route template so path parameters don't explode the series
+        route = request.scope.get("route")
+        HTTP_REQUEST_SECONDS.observe(
+            time.perf_counter() - started,
+            method=request.method,
+            route=getattr(route, "path", "unmatched"),
+            status=status,
+        )
+
+
 # Register route groups
 app.include_router(interview_router, prefix="/interview")
@@ -9,12 +9,53 @@ SUPABASE_KEY = os.getenv("SUPABASE_KEY")
 SUPABASE_DB_URL = os.getenv("SUPABASE_DB_URL")
 SUPABASE_DB = os.getenv("SUPABASE_DB")
 SUPABASE_RESUME_BUCKET = os.getenv("SUPABASE_RESUME_BUCKET")
+DB_MAX_WORKERS = int(os.getenv("DB_MAX_WORKERS", "8"))
+RESUME_SIGNED_URL_EXPIRES_IN = int(os.getenv("RESUME_SIGNED_URL_EXPIRES_IN", "3600"))
+RESUME_SIGNED_URL_REFRESH_MARGIN = int(
+    os.getenv("RESUME_SIGNED_URL_REFRESH_MARGIN", "300")
+)
+RESUME_MAX_BYTES = int(os.getenv("RESUME_MAX_BYTES", str(10 * 1024 * 1024)))
+RESUME_DOWNLOAD_TIMEOUT_SECONDS = float(
+    os.getenv("RESUME_DOWNLOAD_TIMEOUT_SECONDS", "30")
+)
+RESUME_PARSER_MAX_WORKERS = int(os.getenv("RESUME_PARSER_MAX_WORKERS", "2"))
+RESUME_TEXT_CACHE_DIR = os.getenv("RESUME_TEXT_CACHE_DIR", ".cache/resume_text")
+RESUME_SUMMARY_CACHE_DIR = os.getenv(
+    "RESUME_SUMMARY_CACHE_DIR", ".cache/resume_summary"
+)
 
 RESUME_LLM_MODEL = os.getenv("RESUME_LLM_MODEL")
 INTERVIEW_LLM_MODEL = os.getenv("INTERVIEW_LLM_MODEL")
 EVALUATION_LLM_MODEL = os.getenv("EVALUATION_LLM_MODEL")
+INTERVIEW_STREAMING_ENABLED = (
+    os.getenv("INTERVIEW_STREAMING_ENABLED", "false").lower() == "true"
+)
+# speak a short local acknowledgment before each streamed reply, only applies
+# when INTERVIEW_STREAMING_ENABLED is set too
+INTERVIEW_FILLER_ENABLED = (
+    os.getenv("INTERVIEW_FILLER_ENABLED", "false").lower() == "true"
+)
+# serve the scripted opening turns (intro, gatekeeper questions) from templates
+INTERVIEW_SCRIPTED_PHASES_ENABLED = (
+    os.getenv("INTERVIEW_SCRIPTED_PHASES_ENABLED", "false").lower() == "true"
+)
 OPENAI_KEY = os.getenv("OPENAI_API_KEY")
 
+# extra TTS pronunciation terms, added to or overriding utils/tts_lexicon.json
+TTS_LEXICON_PATH = os.getenv("TTS_LEXICON_PATH", "")
+
+# local override of agents/llm_pricing.json, written by the optional refresh
+LLM_PRICING_CACHE_PATH = os.getenv("LLM_PRICING_CACHE_PATH", ".cache/llm_pricing.json")
+# hours between pricing refreshes from tokonomics, 0 keeps the bundled prices
+LLM_PRICING_REFRESH_HOURS = float(os.getenv("LLM_PRICING_REFRESH_HOURS", "0"))
+
+# interview turns kept verbatim once older turns are folded into a summary
+HISTORY_KEEP_TURNS = int(os.getenv("HISTORY_KEEP_TURNS", "6"))
+# per-turn input tokens above which history is compacted, per-model overrides
+# as "model=tokens,model=tokens"
+HISTORY_TOKEN_BUDGET = int(os.getenv("HISTORY_TOKEN_BUDGET", "8000"))
+HISTORY_TOKEN_BUDGETS = os.getenv("HISTORY_TOKEN_BUDGETS", "")
+
 CALENDLY_MEETING_URL = os.getenv("CALENDLY_MEETING_URL")
 
 VAPI_API_KEY = os.getenv("VAPI_API_KEY")
@@ -23,6 +64,11 @@ VAPI_PHONE_NUMBER_ID = os.getenv("VAPI_PHONE_NUMBER_ID")
 VAPI_RECRUITER_ASSISTANT_ID = os.getenv("VAPI_RECRUITER_ASSISTANT_ID")
 VAPI_INTERVIEW_WEBHOOK_URL = os.getenv("VAPI_INTERVIEW_WEBHOOK_URL")
 VAPI_CALL_WEBHOOK_URL = os.getenv("VAPI_CALL_WEBHOOK_URL")
+VAPI_MAX_CONNECTIONS = int(os.getenv("VAPI_MAX_CONNECTIONS", "50"))
+VAPI_MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("VAPI_MAX_KEEPALIVE_CONNECTIONS", "20"))
+VAPI_TIMEOUT_SECONDS = float(os.getenv("VAPI_TIMEOUT_SECONDS", "10"))
+VAPI_MAX_RETRIES = int(os.getenv("VAPI_MAX_RETRIES", "3"))
+VAPI_RETRY_BACKOFF_SECONDS = float(os.getenv("VAPI_RETRY_BACKOFF_SECONDS", "0.25"))
 
 COMPANY_NAME = os.getenv("COMPANY_NAME")
 COMPANY_DESCRIPTION = os.getenv("COMPANY_DESCRIPTION")
@@ -34,10 +80,60 @@ ROLE_STACK = os.getenv("ROLE_STACK")
 ROLE_LOCATION = os.getenv("ROLE_LOCATION")
 ROLE_SCHEDULE = os.getenv("ROLE_SCHEDULE")
 INTERVIEW_DURATION = os.getenv("INTERVIEW_DURATION")
+# the interviewer persona the agent speaks as
+INTERVIEWER_NAME = os.getenv("INTERVIEWER_NAME", "Tom Lanigan")
 
 APSCHEDULER_DB_NAME = os.getenv("APSCHEDULER_DB_NAME")
+# post-interview job queue, Postgres via SUPABASE_DB_URL or e.g. sqlite:///jobs.db
+JOB_QUEUE_DB_URL = os.getenv("JOB_QUEUE_DB_URL") or SUPABASE_DB_URL
+# concurrent post-interview jobs (evaluations) per application worker
+JOB_QUEUE_WORKERS = int(os.getenv("JOB_QUEUE_WORKERS", "2"))
+JOB_QUEUE_MAX_ATTEMPTS = int(os.getenv("JOB_QUEUE_MAX_ATTEMPTS", "5"))
+JOB_QUEUE_RETRY_BACKOFF_SECONDS = float(
+    os.getenv("JOB_QUEUE_RETRY_BACKOFF_SECONDS", "30")
+)
+# a running job is retried once its worker has held it this long
+JOB_QUEUE_LEASE_SECONDS = float(os.getenv("JOB_QUEUE_LEASE_SECONDS", "900"))
+JOB_QUEUE_POLL_INTERVAL_SECONDS = float(
+    os.getenv("JOB_QUEUE_POLL_INTERVAL_SECONDS", "5")
+)
+# minutes before the slot the resume is summarized, 0 disables pre-warming
+RESUME_PREWARM_MINUTES = int(os.getenv("RESUME_PREWARM_MINUTES", "15"))
+# resume pre-warm LLM runs in flight at once
+RESUME_PREWARM_MAX_CONCURRENCY = int(os.getenv("RESUME_PREWARM_MAX_CONCURRENCY", "2"))
+# live interviews (outbound calls and their LLM sessions) across all workers;
+# scheduled interviews over the cap wait for a call to end
+INTERVIEW_MAX_ACTIVE_CALLS = int(os.getenv("INTERVIEW_MAX_ACTIVE_CALLS", "10"))
+# minimum spacing between two outbound dials
+INTERVIEW_DIAL_STAGGER_SECONDS = float(os.getenv("INTERVIEW_DIAL_STAGGER_SECONDS", "2"))
+INTERVIEW_CAPACITY_POLL_SECONDS = float(
+    os.getenv("INTERVIEW_CAPACITY_POLL_SECONDS", "5")
+)
+# booking-time capacity: interviews overlapping one slot, the lowest of
+# INTERVIEW_MAX_ACTIVE_CALLS, the VAPI concurrent call limit and the calls the
+# interview model's requests-per-minute limit sustains
+INTERVIEW_SLOT_MINUTES = int(os.getenv("INTERVIEW_SLOT_MINUTES", "30"))
+VAPI_MAX_CONCURRENT_CALLS = int(os.getenv("VAPI_MAX_CONCURRENT_CALLS", "10"))
+INTERVIEW_LLM_RPM_LIMIT = int(os.getenv("INTERVIEW_LLM_RPM_LIMIT", "500"))
+# interview agent requests per live call per minute, roughly one per turn
+INTERVIEW_LLM_REQUESTS_PER_CALL_MINUTE = float(
+    os.getenv("INTERVIEW_LLM_REQUESTS_PER_CALL_MINUTE", "6")
+)
+# bookings over capacity start up to this much after their slot
+BOOKING_OVERFLOW_JITTER_SECONDS = float(
+    os.getenv("BOOKING_OVERFLOW_JITTER_SECONDS", "120")
+)
+
+SESSION_STORE_BACKEND = os.getenv("SESSION_STORE_BACKEND", "memory").lower()
+SESSION_STORE_MAX_SESSIONS = int(os.getenv("SESSION_STORE_MAX_SESSIONS", "200"))
+SESSION_IDLE_TIMEOUT_SECONDS = int(os.getenv("SESSION_IDLE_TIMEOUT_SECONDS", "3600"))
+SESSION_STORE_SQLITE_PATH = os.getenv("SESSION_STORE_SQLITE_PATH", "sessions.db")
+SESSION_STORE_REDIS_URL = os.getenv("SESSION_STORE_REDIS_URL")
+CANDIDATE_CACHE_TTL_SECONDS = int(os.getenv("CANDIDATE_CACHE_TTL_SECONDS", "7200"))
 
 APPLICATION_BASE_URL = os.getenv("APPLICATION_BASE_URL")
 APPLICATION_PORT = int(os.getenv("APPLICATION_PORT"))
+APPLICATION_WORKERS = int(os.getenv("APPLICATION_WORKERS", "1"))
+SCHEDULER_LOCK_PATH = os.getenv("SCHEDULER_LOCK_PATH", "scheduler.lock")
 
 CANDIDATE_ID_TESTING = os.getenv("CANDIDATE_ID_TESTING")
@@ -0,0 +1,91 @@
+"""
+Async facade over `db.candidate_repository`.
+
+The Supabase client is synchronous, so every call is offloaded to a small,
+bounded thread pool. Async routes, services and agent tools must use these
+functions so a database round trip never stalls live /chat/completions turns.
+"""
+
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Callable, Optional, TypeVar
+
+from config import DB_MAX_WORKERS
+from db import candidate_repository
+from models.candidate import Candidate
+from utils.metrics import REPOSITORY_CALL_SECONDS
+
+T = TypeVar("T")
+
+_db_executor = ThreadPoolExecutor(
+    max_workers=DB_MAX_WORKERS, thread_name_prefix="candidate-db"
+)
+
+
+async def run_in_db_executor(func: Callable[..., T], *args, **kwargs) -> T:
+    loop = asyncio.get_running_loop()
+    # includes time queued for a free worker
+    with REPOSITORY_CALL_SECONDS.time(operation=func.__name__):
+        return await loop.run_in_executor(
+            _db_executor, functools.partial(func, *args, **kwargs)
+        )
+
+
+async def get_candidate_by_id(
+    candidate_id: str,
+    field_groups: tuple[str, ...] = candidate_repository.DEFAULT_FIELD_GROUPS,
+) -> Candidate:
+    return await run_in_db_executor(
+        candidate_repository.get_candidate_by_id, candidate_id, field_groups
+    )
+
+
+async def update_candidate_by_id(candidate: Candidate) -> str | None:
+    return await run_in_db_executor(
+        candidate_repository.update_candidate_by_id, candidate=candidate
+    )
+
+
+async def upsert_candidate_from_calendly(
+    name: str,
+    email: str,
+    phone: str,
+    scheduled_time: Optional[datetime],
+    status: str = "INTERVIEW_SCHEDULED",
+) -> str:
+    return await run_in_db_executor(
+        candidate_repository.upsert_candidate_from_calendly,
+        name=name,
+        email=email,
+        phone=phone,
+        scheduled_time=scheduled_time,
+        status=status,
+    )
+
+
+async def get_candidate_field(candidate_id: str, field: str):
+    return await run_in_db_executor(
+        candidate_repository.load_candidate_field, candidate_id, field
+    )
+
+
+async def ensure_candidate_field(candidate: Candidate, field: str):
+    """The candidate's `field`, fetched and set on it first if not loaded."""
+    if not candidate.is_loaded(field):
+        value = await get_candidate_field(candidate.profile.candidate_id, field)
+        candidate.set_loaded(field, value)
+    return getattr(candidate, field)
+
+
+async def get_resume_etag(resume_file_name: str) -> str | None:
+    return await run_in_db_executor(
+        candidate_repository.get_resume_etag, resume_file_name
+    )
+
+
+async def generate_signed_resume_url(resume_file_name: str) -> str | None:
+    return await run_in_db_executor(
+        candidate_repository.generate_signed_resume_url, resume_file_name
+    )
@@ -0,0 +1,41 @@
+import time
+from typing import Optional
+
+from config import CANDIDATE_CACHE_TTL_SECONDS
+from models.candidate import Candidate
+
+# candidate_id -> (candidate, cached at)
+_candidate_cache: dict[str, tuple[Candidate, float]] = {}
+
+
+def cache_candidate(candidate: Candidate):
+    """
+    Keep a copy of a candidate loaded for an upcoming call, so a cold
+    /chat/completions turn can rebuild its session without a Supabase read.
+    """
+    _purge_expired()
+    _candidate_cache[candidate.profile.candidate_id] = (
+        candidate.model_copy(deep=True),
+        time.monotonic(),
+    )
+
+
+def get_cached_candidate(candidate_id: str) -> Optional[Candidate]:
+    entry = _candidate_cache.get(candidate_id)
+    if not entry:
+        return None
+
+    candidate, cached_at = entry
+    if time.monotonic() - cached_at > CANDIDATE_CACHE_TTL_SECONDS:
+        _candidate_cache.pop(candidate_id, None)
+        return None
+
+    # callers mutate the candidate during the interview
+    return candidate.model_copy(deep=True)
+
+
+def _purge_expired():
+    now = time.monotonic()
+    for candidate_id, (_, cached_at) in list(_candidate_cache.items()):
+        if now - cached_at > CANDIDATE_CACHE_TTL_SECONDS:
+            del _candidate_cache[candidate_id]
@@ -1,11 +1,18 @@
 import logging
-import uuid
+import time
 from datetime import datetime, timezone
 from typing import Optional
 
 from supabase import create_client
 
-from config import SUPABASE_DB, SUPABASE_KEY, SUPABASE_RESUME_BUCKET, SUPABASE_URL
+from config import (
+    RESUME_SIGNED_URL_EXPIRES_IN,
+    RESUME_SIGNED_URL_REFRESH_MARGIN,
+    SUPABASE_DB,
+    SUPABASE_KEY,
+    SUPABASE_RESUME_BUCKET,
+    SUPABASE_URL,
+)
 from models.candidate import (
     Candidate,
     CandidateEvaluation,
@@ -13,18 +20,80 @@ from models.candidate import (
     ResumeSummary,
     Scorecard,
 )
+from models.llm_cost import AgentLLMCost
 
 logger = logging.getLogger(__name__)
 supabase = create_client(SUPABASE_URL, SUPABASE_KEY)
 
+# resume_file_name -> (signed url, expires at)
+_signed_resume_url_cache: dict[str, tuple[str, float]] = {}
+
+
+# Column groups that can be loaded independently. "profile" is always loaded;
+# the candidate fields of groups left out stay unloaded until fetched with
+# load_candidate_field.
+FIELD_GROUPS = {
+    "profile": [
+        *(k for k in CandidateProfile.model_fields.keys() if k != "resume_url"),
+        "status",
+        "resume_hash",
+    ],
+    "summary": [*ResumeSummary.model_fields.keys(), "resume_summary_key"],
+    "evaluation": ["scorecard", "evaluation_summary", "recommendation"],
+    "transcript": ["interview_transcript"],
+    "parsed_resume": ["parsed_resume"],
+    "cost": ["llm_cost", "agent_llm_cost"],
+}
+
+# Candidate field -> column group it is built from
+CANDIDATE_FIELD_GROUPS = {
+    "resume_summary": "summary",
+    "resume_summary_key": "summary",
+    "evaluation": "evaluation",
+    "interview_transcript": "transcript",
+    "parsed_resume": "parsed_resume",
+    "llm_cost": "cost",
+    "agent_llm_cost": "cost",
+}
+
+# enough for the per-turn candidate intro
+DEFAULT_FIELD_GROUPS = ("profile", "summary")
+
 
 def get_candidate_by_id(
     candidate_id: str,
+    field_groups: tuple[str, ...] = DEFAULT_FIELD_GROUPS,
 ) -> Candidate:
 
+    groups = {"profile", *field_groups}
+    data = select_candidate_columns(
+        candidate_id, [c for g in FIELD_GROUPS if g in groups for c in FIELD_GROUPS[g]]
+    )
+
+    # resume_url is signed on demand, see generate_signed_resume_url
+    profile = CandidateProfile(
+        **{k: data.get(k) for k in CandidateProfile.model_fields.keys()}
+    )
+
+    loaded = {
+        field: build_candidate_field(field, data)
+        for field, group in CANDIDATE_FIELD_GROUPS.items()
+        if group in groups
+    }
+
+    return Candidate.with_unloaded_fields(
+        unloaded_fields=[f for f in CANDIDATE_FIELD_GROUPS if f not in loaded],
+        profile=profile,
+        status=data.get("status"),
+        resume_hash=data.get("resume_hash"),
+        **loaded,
+    )
+
+
+def select_candidate_columns(candidate_id: str, columns: list[str]) -> dict:
     result = (
         supabase.table(SUPABASE_DB)
-        .select("*")
+        .select(",".join(columns))
         .eq("candidate_id", candidate_id)
         .single()
         .execute()
@@ -34,80 +103,103 @@ def get_candidate_by_id(
     if not data:
         raise ValueError(f"No candidate found with ID: {candidate_id}")
 
-    profile = CandidateProfile(
-        **{k: data.get(k) for k in CandidateProfile.model_fields.keys()}
-    )
+    return data
+
+
+def load_candidate_field(candidate_id: str, field: str):
+    group = CANDIDATE_FIELD_GROUPS[field]
+    logger.info(f"Loading {group} for candidate {candidate_id}")
+    data = select_candidate_columns(candidate_id, FIELD_GROUPS[group])
+    return build_candidate_field(field, data)
+
+
+def build_candidate_field(field: str, data: dict):
+    if field == "resume_summary":
+        return (
+            ResumeSummary(
+                experience_summary=data.get("experience_summary"),
+                core_technical_skills=data.get("core_technical_skills") or [],
+                specialized_technical_skills=data.get("specialized_technical_skills")
+                or [],
+                current_project=data.get("current_project"),
+                other_notable_projects=data.get("other_notable_projects") or [],
+                education_certification=data.get("education_certification"),
+                potential_flags=data.get("potential_flags") or [],
+                resume_notes=data.get("resume_notes"),
+            )
+            if data.get("experience_summary")
+            else None
+        )
 
-    if profile.resume_file_name:
-        resume_signed_url = generate_signed_resume_url(profile.resume_file_name)
-        if resume_signed_url:
-            profile.resume_url = resume_signed_url
-
-    resume_summary = (
-        ResumeSummary(
-            experience_summary=data.get("experience_summary"),
-            core_technical_skills=data.get("core_technical_skills") or [],
-            specialized_technical_skills=data.get("specialized_technical_skills") or [],
-            current_project=data.get("current_project"),
-            other_notable_projects=data.get("other_notable_projects") or [],
-            education_certification=data.get("education_certification"),
-            potential_flags=data.get("potential_flags") or [],
-            resume_notes=data.get("resume_notes"),
+    if field == "evaluation":
+        return (
+            CandidateEvaluation(
+                scorecard=Scorecard(**data["scorecard"]),
+                summary=data.get("evaluation_summary"),
+                recommendation=data.get("recommendation"),
+            )
+            if data.get("scorecard")
+            else None
         )
-        if data.get("experience_summary")
-        else None
-    )
 
-    evaluation = (
-        CandidateEvaluation(
-            scorecard=Scorecard(**data["scorecard"]),
-            summary=data.get("evaluation_summary"),
-            recommendation=data.get("recommendation"),
+    if field == "agent_llm_cost":
+        return (
+            AgentLLMCost(**data["agent_llm_cost"])
+            if data.get("agent_llm_cost")
+            else None
         )
-        if data.get("scorecard")
-        else None
-    )
 
-    return Candidate(
-        profile=profile,
-        resume_summary=resume_summary,
-        evaluation=evaluation,
-        interview_transcript=data.get("interview_transcript"),
-        status=data.get("status"),
-    )
+    return data.get(field)
 
 
 # update_candidate_by_id
-def update_candidate_by_id(candidate: Candidate) -> str:
+def update_candidate_by_id(candidate: Candidate) -> str | None:
+    """
+    Write only the fields assigned since the candidate was loaded (or last
+    written), then mark them clean. Returns None without a round trip when
+    nothing changed.
+    """
+    dirty = candidate.dirty_fields
     data = {}
 
-    if candidate.parsed_resume:
+    if "parsed_resume" in dirty and candidate.parsed_resume:
         data["parsed_resume"] = clean_null_bytes(candidate.parsed_resume)
 
-    if candidate.resume_summary:
+    if "resume_hash" in dirty and candidate.resume_hash:
+        data["resume_hash"] = candidate.resume_hash
+
+    if "resume_summary" in dirty and candidate.resume_summary:
         raw_summary = candidate.resume_summary.model_dump(exclude_none=True)
         cleaned_summary = {k: clean_null_bytes(v) for k, v in raw_summary.items()}
         data.update(cleaned_summary)
 
-    if candidate.evaluation:
+    if "resume_summary_key" in dirty and candidate.resume_summary_key:
+        data["resume_summary_key"] = candidate.resume_summary_key
+
+    if "evaluation" in dirty and candidate.evaluation:
         data["scorecard"] = candidate.evaluation.scorecard.model_dump()
         data["evaluation_summary"] = candidate.evaluation.summary
         data["recommendation"] = candidate.evaluation.recommendation
 
-    if candidate.interview_transcript:
+    if "interview_transcript" in dirty and candidate.interview_transcript:
         data["interview_transcript"] = candidate.interview_transcript
 
-    if candidate.llm_cost:
+    if "llm_cost" in dirty and candidate.llm_cost:
         data["llm_cost"] = candidate.llm_cost
+
+    if "agent_llm_cost" in dirty and candidate.agent_llm_cost:
         data["agent_llm_cost"] = candidate.agent_llm_cost.model_dump()
 
-    if candidate.status:
+    if "status" in dirty and candidate.status:
         data["status"] = candidate.status
 
-    data["updated_at"] = datetime.now(timezone.utc).isoformat()
-
     if not data:
-        raise ValueError("No fields to update.")
+        logger.info(
+            f"No changes to write for candidate {candidate.profile.candidate_id}"
+        )
+        return None
+
+    data["updated_at"] = datetime.now(timezone.utc).isoformat()
 
     response = (
         supabase.table(SUPABASE_DB)
@@ -116,6 +208,9 @@ def update_candidate_by_id(candidate: Candidate) -> str:
         .execute()
     )
 
+    # only the snapshot taken above, fields assigned meanwhile stay dirty
+    candidate.mark_clean(dirty)
+
     return response
 
 
@@ -139,70 +234,74 @@ def upsert_candidate_from_calendly(
     scheduled_time: Optional[datetime],
     status: str = "INTERVIEW_SCHEDULED",
 ) -> str:
-    candidate_id = None
-
-    if phone:
-        result = (
-            supabase.table(SUPABASE_DB)
-            .select("candidate_id")
-            .eq("phone", phone)
-            .execute()
-        )
-        if result.data:
-            candidate_id = result.data[0]["candidate_id"]
-
-    if not candidate_id and email:
-        result = (
-            supabase.table(SUPABASE_DB)
-            .select("candidate_id")
-            .eq("email", email)
-            .execute()
-        )
-        if result.data:
-            candidate_id = result.data[0]["candidate_id"]
-
-    data = {
-        "name": name,
-        "email": email,
-        "phone": phone,
-        "status": status,
-        "updated_at": datetime.now(timezone.utc).isoformat(),
-    }
+    """
+    Match the invitee by phone, then email, and update it, or insert a new
+    candidate. Runs server-side in the `upsert_candidate_from_calendly` SQL
+    function (sql/candidates.sql) so it takes a single round trip.
+    """
+    result = supabase.rpc(
+        "upsert_candidate_from_calendly",
+        {
+            "p_name": name,
+            "p_email": email,
+            "p_phone": phone,
+            "p_status": status,
+            "p_scheduled_time": scheduled_time.isoformat() if scheduled_time else None,
+        },
+    ).execute()
+
+    return result.data
+
 
-    if scheduled_time:
-        data["scheduled_time"] = scheduled_time.isoformat()
+def generate_signed_resume_url(resume_file_name: str) -> str | None:
+    """
+    Return a signed URL for the resume, reusing a cached one until shortly
+    before it expires. Signing fails for a missing object, so no separate
+    existence check (bucket listing) is needed.
+    """
+    now = time.monotonic()
+    cached = _signed_resume_url_cache.get(resume_file_name)
+    if cached and cached[1] - RESUME_SIGNED_URL_REFRESH_MARGIN > now:
+        return cached[0]
 
-    if candidate_id:
-        supabase.table(SUPABASE_DB).update(data).eq(
-            "candidate_id", candidate_id
-        ).execute()
-    else:
-        candidate_id = str(uuid.uuid4())
-        data["candidate_id"] = candidate_id
-        data["created_at"] = datetime.now(timezone.utc).isoformat()
-        supabase.table(SUPABASE_DB).insert(data).execute()
+    bucket = supabase.storage.from_(SUPABASE_RESUME_BUCKET)
 
-    return candidate_id
+    try:
+        response = bucket.create_signed_url(
+            resume_file_name, expires_in=RESUME_SIGNED_URL_EXPIRES_IN
+        )
+    except Exception as e:
+        logger.warning(
+            f"Resume file not found or not signable: {resume_file_name} ({e})"
+        )
+        _signed_resume_url_cache.pop(resume_file_name, None)
+        return None
 
+    signed_url = response.get("signedUrl")
+    if signed_url:
+        _signed_resume_url_cache[resume_file_name] = (
+            signed_url,
+            now + RESUME_SIGNED_URL_EXPIRES_IN,
+        )
+    return signed_url
 
-def generate_signed_resume_url(resume_file_name: str) -> str | None:
 
+def get_resume_etag(resume_file_name: str) -> str | None:
+    """
+    Storage ETag of the resume object; changes whenever the file content does.
+    A metadata lookup only, the file itself is not downloaded.
+    """
     bucket = supabase.storage.from_(SUPABASE_RESUME_BUCKET)
-    folder = "/".join(resume_file_name.split("/")[:-1])
-    file_name = resume_file_name.split("/")[-1]
 
     try:
-        files = bucket.list(path=folder or "")
-        if any(f["name"] == file_name for f in files):
-            response = bucket.create_signed_url(resume_file_name, expires_in=3600)
-            return response.get("signedUrl")
-        else:
-            logger.warning(f"Resume file not found: {resume_file_name}")
-            return None
+        info = bucket.info(resume_file_name)
     except Exception as e:
-        logger.error(f"Error checking or signing resume file: {e}")
+        logger.warning(f"Could not read resume metadata {resume_file_name}: {e}")
         return None
 
+    etag = info.get("etag") or (info.get("metadata") or {}).get("eTag")
+    return etag.strip('"') if etag else None
+
 
 def clean_null_bytes(value):
     if isinstance(value, str):
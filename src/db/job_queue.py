@@ -0,0 +1,299 @@
+"""
+Durable job queue backed by a SQL table (Postgres via SUPABASE_DB_URL, or
+SQLite locally), used for post-interview work.
+
+Jobs are keyed by an idempotency key (the VAPI call id), so enqueueing the
+same call twice is a no-op. Each process runs a fixed number of async workers
+that claim jobs with an optimistic compare-and-set update, which is safe
+across processes without row locks. Failed jobs are retried with jittered
+exponential backoff; a job whose worker died is picked up again once its
+lease expires.
+"""
+
+import asyncio
+import logging
+import random
+import time
+from typing import Awaitable, Callable, List, Optional
+
+from sqlalchemy import (
+    Column,
+    Float,
+    Integer,
+    LargeBinary,
+    MetaData,
+    String,
+    Table,
+    Text,
+    and_,
+    create_engine,
+    func,
+    or_,
+    select,
+)
+from sqlalchemy.exc import IntegrityError
+
+from config import (
+    JOB_QUEUE_DB_URL,
+    JOB_QUEUE_LEASE_SECONDS,
+    JOB_QUEUE_MAX_ATTEMPTS,
+    JOB_QUEUE_POLL_INTERVAL_SECONDS,
+    JOB_QUEUE_RETRY_BACKOFF_SECONDS,
+    JOB_QUEUE_WORKERS,
+)
+from utils.metrics import JOB_QUEUE_JOBS, JOB_QUEUE_WAIT_SECONDS
+
+logger = logging.getLogger(__name__)
+
+JobHandler = Callable[[str, bytes], Awaitable[None]]
+
+
+class JobQueue:
+    def __init__(
+        self,
+        name: str,
+        url: str,
+        workers: int,
+        max_attempts: int,
+        retry_backoff_seconds: float,
+        lease_seconds: float,
+        poll_interval_seconds: float,
+    ):
+        self.name = name
+        self.workers = workers
+        self.max_attempts = max_attempts
+        self.retry_backoff_seconds = retry_backoff_seconds
+        self.lease_seconds = lease_seconds
+        self.poll_interval_seconds = poll_interval_seconds
+
+        self.engine = create_engine(url, pool_pre_ping=True)
+        self.metadata = MetaData()
+        self.jobs = Table(
+            f"{name}_jobs",
+            self.metadata,
+            Column("job_id", String(255), primary_key=True),
+            Column("payload", LargeBinary, nullable=False),
+            Column("status", String(16), nullable=False, index=True),
+            Column("attempts", Integer, nullable=False),
+            # epoch seconds
+            Column("run_at", Float, nullable=False, index=True),
+            Column("locked_at", Float),
+            Column("last_error", Text),
+            Column("created_at", Float, nullable=False),
+            Column("updated_at", Float, nullable=False),
+        )
+
+        self._handler: Optional[JobHandler] = None
+        self._tasks: List[asyncio.Task] = []
+        # bumped on every enqueue; a worker only sleeps if it has not moved
+        # since the worker last looked for a job
+        self._enqueued = 0
+        self._wakeup: Optional[asyncio.Condition] = None
+
+    async def start(self, handler: JobHandler):
+        if self._tasks:
+            return
+        await asyncio.to_thread(self.metadata.create_all, self.engine)
+        self._handler = handler
+        self._wakeup = asyncio.Condition()
+        self._tasks = [
+            asyncio.create_task(self._work(i), name=f"{self.name}-worker-{i}")
+            for i in range(self.workers)
+        ]
+        logger.info(f"[JobQueue] {self.name} started with {self.workers} workers")
+
+    async def aclose(self):
+        # a job interrupted here stays "running" and is retried after its lease
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def enqueue(self, job_id: str, payload: bytes) -> bool:
+        """Queue a job, returns False if a job with this id already exists."""
+        queued = await asyncio.to_thread(self._insert, job_id, payload)
+        if queued and self._wakeup:
+            async with self._wakeup:
+                self._enqueued += 1
+                self._wakeup.notify()
+        return queued
+
+    async def has_job(self, job_id: str) -> bool:
+        """True if a job with this id was ever queued, whatever its status."""
+        return await asyncio.to_thread(self._exists, job_id)
+
+    async def stats(self) -> dict:
+        counts = await asyncio.to_thread(self._count_by_status)
+        return {"queue": self.name, "workers": len(self._tasks), **counts}
+
+    async def _work(self, worker: int):
+        while True:
+            # read before claiming, so an enqueue during the claim is not missed
+            enqueued = self._enqueued
+            try:
+                job = await asyncio.to_thread(self._claim)
+            except Exception:
+                logger.exception(f"[JobQueue] {self.name} could not claim a job")
+                job = None
+
+            if job is None:
+                await self._wait_for_enqueue(enqueued)
+                continue
+
+            job_id, payload, attempts = job
+            try:
+                await self._handler(job_id, payload)
+            except Exception as e:
+                logger.exception(
+                    f"[JobQueue] {self.name} job {job_id} failed (attempt {attempts})"
+                )
+                await asyncio.to_thread(self._fail, job_id, attempts, repr(e))
+            else:
+                await asyncio.to_thread(self._complete, job_id)
+                JOB_QUEUE_JOBS.inc(queue=self.name, outcome="done")
+
+    async def _wait_for_enqueue(self, enqueued: int):
+        """Sleep until a job is enqueued after `enqueued` was read, or a poll."""
+        async with self._wakeup:
+            try:
+                await asyncio.wait_for(
+                    self._wakeup.wait_for(lambda: self._enqueued != enqueued),
+                    timeout=self.poll_interval_seconds,
+                )
+            except asyncio.TimeoutError:
+                pass
+
+    def _insert(self, job_id: str, payload: bytes) -> bool:
+        now = time.time()
+        try:
+            with self.engine.begin() as conn:
+                conn.execute(
+                    self.jobs.insert().values(
+                        job_id=job_id,
+                        payload=payload,
+                        status="pending",
+                        attempts=0,
+                        run_at=now,
+                        created_at=now,
+                        updated_at=now,
+                    )
+                )
+        except IntegrityError:
+            return False
+        return True
+
+    def _claim(self) -> Optional[tuple[str, bytes, int]]:
+        now = time.time()
+        jobs = self.jobs
+        claimable = or_(
+            and_(jobs.c.status == "pending", jobs.c.run_at <= now),
+            and_(
+                jobs.c.status == "running",
+                jobs.c.locked_at < now - self.lease_seconds,
+            ),
+        )
+
+        with self.engine.begin() as conn:
+            candidates = conn.execute(
+                select(
+                    jobs.c.job_id,
+                    jobs.c.status,
+                    jobs.c.locked_at,
+                    jobs.c.attempts,
+                    jobs.c.run_at,
+                )
+                .where(claimable)
+                .order_by(jobs.c.run_at)
+                .limit(self.workers)
+            ).all()
+
+        for job_id, status, locked_at, attempts, run_at in candidates:
+            # only one worker wins the compare-and-set on (status, locked_at)
+            with self.engine.begin() as conn:
+                claimed = conn.execute(
+                    jobs.update()
+                    .where(
+                        jobs.c.job_id == job_id,
+                        jobs.c.status == status,
+                        (
+                            jobs.c.locked_at.is_(None)
+                            if locked_at is None
+                            else jobs.c.locked_at == locked_at
+                        ),
+                    )
+                    .values(
+                        status="running",
+                        locked_at=now,
+                        attempts=attempts + 1,
+                        updated_at=now,
+                    )
+                ).rowcount
+                if not claimed:
+                    continue
+                payload = conn.execute(
+                    select(jobs.c.payload).where(jobs.c.job_id == job_id)
+                ).scalar_one()
+
+            JOB_QUEUE_WAIT_SECONDS.observe(max(now - run_at, 0.0), queue=self.name)
+            return job_id, payload, attempts + 1
+
+        return None
+
+    def _complete(self, job_id: str):
+        with self.engine.begin() as conn:
+            # the payload is not needed once done, the row stays for idempotency
+            conn.execute(
+                self.jobs.update()
+                .where(self.jobs.c.job_id == job_id)
+                .values(status="done", payload=b"", updated_at=time.time())
+            )
+
+    def _fail(self, job_id: str, attempts: int, error: str):
+        now = time.time()
+        if attempts >= self.max_attempts:
+            values = {"status": "failed"}
+            JOB_QUEUE_JOBS.inc(queue=self.name, outcome="failed")
+            logger.error(
+                f"[JobQueue] {self.name} job {job_id} gave up after {attempts} attempts"
+            )
+        else:
+            backoff = self.retry_backoff_seconds * 2 ** (attempts - 1)
+            values = {
+                "status": "pending",
+                "run_at": now + random.uniform(backoff / 2, backoff),
+            }
+            JOB_QUEUE_JOBS.inc(queue=self.name, outcome="retry")
+
+        with self.engine.begin() as conn:
+            conn.execute(
+                self.jobs.update()
+                .where(self.jobs.c.job_id == job_id)
+                .values(last_error=error, updated_at=now, **values)
+            )
+
+    def _exists(self, job_id: str) -> bool:
+        with self.engine.connect() as conn:
+            return (
+                conn.execute(
+                    select(self.jobs.c.job_id).where(self.jobs.c.job_id == job_id)
+                ).first()
+                is not None
+            )
+
+    def _count_by_status(self) -> dict:
+        with self.engine.connect() as conn:
+            rows = conn.execute(
+                select(self.jobs.c.status, func.count()).group_by(self.jobs.c.status)
+            ).all()
+        return {status: count for status, count in rows}
+
+
+post_interview_queue = JobQueue(
+    name="post_interview",
+    url=JOB_QUEUE_DB_URL,
+    workers=JOB_QUEUE_WORKERS,
+    max_attempts=JOB_QUEUE_MAX_ATTEMPTS,
+    retry_backoff_seconds=JOB_QUEUE_RETRY_BACKOFF_SECONDS,
+    lease_seconds=JOB_QUEUE_LEASE_SECONDS,
+    poll_interval_seconds=JOB_QUEUE_POLL_INTERVAL_SECONDS,
+)
@@ -0,0 +1,329 @@
+import asyncio
+import logging
+import sqlite3
+import threading
+import time
+import zlib
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Optional
+
+from agents.interview_agent import interview_agent
+from config import (
+    SESSION_IDLE_TIMEOUT_SECONDS,
+    SESSION_STORE_BACKEND,
+    SESSION_STORE_MAX_SESSIONS,
+    SESSION_STORE_REDIS_URL,
+    SESSION_STORE_SQLITE_PATH,
+)
+from models.session_state import SessionState
+
+logger = logging.getLogger(__name__)
+
+
+def encode_session(session: SessionState) -> bytes:
+    return zlib.compress(session.to_json())
+
+
+def decode_session(raw: bytes) -> SessionState:
+    return SessionState.from_json(zlib.decompress(raw), agent=interview_agent)
+
+
+class SessionStore(ABC):
+    """
+    Keeps live interview sessions keyed by VAPI call id.
+
+    Sessions returned by `get` may be copies, so callers must `put` a session
+    back after mutating it.
+    """
+
+    def __init__(self, idle_timeout_seconds: float):
+        self.idle_timeout_seconds = idle_timeout_seconds
+        self.hits = 0
+        self.misses = 0
+        self.expirations = 0
+
+    @abstractmethod
+    async def get(self, session_id: str) -> Optional[SessionState]: ...
+
+    @abstractmethod
+    async def put(self, session_id: str, session: SessionState) -> None: ...
+
+    @abstractmethod
+    async def delete(self, session_id: str) -> None: ...
+
+    @abstractmethod
+    async def count(self) -> int:
+        """
+        Number of live sessions, i.e. interviews in progress. Sessions are
+        deleted when their call ends, see `post_interview_tasks`.
+        """
+
+    @abstractmethod
+    async def stats(self) -> dict: ...
+
+    def _base_stats(self) -> dict:
+        return {
+            "backend": type(self).__name__,
+            "idle_timeout_seconds": self.idle_timeout_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "expirations": self.expirations,
+        }
+
+
+class InMemorySessionStore(SessionStore):
+    """
+    Process-local LRU store. Sessions idle for longer than the timeout are
+    dropped, and the least recently used ended session is evicted once
+    `max_sessions` is reached. Live sessions are never evicted: with every
+    session live the store grows past `max_sessions` and logs an error.
+    """
+
+    def __init__(self, max_sessions: int, idle_timeout_seconds: float):
+        super().__init__(idle_timeout_seconds)
+        self.max_sessions = max_sessions
+        self.evictions = 0
+        self.over_capacity_puts = 0
+        # session_id -> (session, last access); oldest access first
+        self._sessions: OrderedDict[str, tuple[SessionState, float]] = OrderedDict()
+
+    def _purge_expired(self, now: float):
+        while self._sessions:
+            session_id, (_, last_access) = next(iter(self._sessions.items()))
+            if now - last_access <= self.idle_timeout_seconds:
+                break
+            del self._sessions[session_id]
+            self.expirations += 1
+            logger.info(f"[SessionStore] Expired idle session {session_id}")
+
+    async def get(self, session_id: str) -> Optional[SessionState]:
+        now = time.monotonic()
+        self._purge_expired(now)
+
+        entry = self._sessions.get(session_id)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self._sessions[session_id] = (entry[0], now)
+        self._sessions.move_to_end(session_id)
+        return entry[0]
+
+    async def put(self, session_id: str, session: SessionState) -> None:
+        now = time.monotonic()
+        self._purge_expired(now)
+
+        self._sessions[session_id] = (session, now)
+        self._sessions.move_to_end(session_id)
+
+        if len(self._sessions) <= self.max_sessions:
+            return
+
+        ended = [sid for sid, (kept, _) in self._sessions.items() if kept.end_call]
+        for evicted_id in ended[: len(self._sessions) - self.max_sessions]:
+            del self._sessions[evicted_id]
+            self.evictions += 1
+            logger.warning(
+                f"[SessionStore] Evicted ended session {evicted_id}, store is at capacity ({self.max_sessions})"
+            )
+
+        if len(self._sessions) > self.max_sessions:
+            self.over_capacity_puts += 1
+            logger.error(
+                f"[SessionStore] {len(self._sessions)} live sessions exceed max_sessions ({self.max_sessions}), keeping all of them"
+            )
+
+    async def delete(self, session_id: str) -> None:
+        self._sessions.pop(session_id, None)
+
+    async def count(self) -> int:
+        self._purge_expired(time.monotonic())
+        return len(self._sessions)
+
+    async def stats(self) -> dict:
+        self._purge_expired(time.monotonic())
+        return {
+            **self._base_stats(),
+            "size": len(self._sessions),
+            "max_sessions": self.max_sessions,
+            "occupancy": round(len(self._sessions) / self.max_sessions, 4),
+            "evictions": self.evictions,
+            "over_capacity_puts": self.over_capacity_puts,
+        }
+
+
+class SQLiteSessionStore(SessionStore):
+    """
+    Durable local store backed by a SQLite file. Sessions survive restarts and
+    are purged once idle past the timeout. Queries run in a worker thread so
+    they never block the event loop.
+
+    The file is shared by every process on the host, so it also serves as a
+    local stand-in for Redis when running several uvicorn workers.
+    """
+
+    def __init__(self, path: str, idle_timeout_seconds: float):
+        super().__init__(idle_timeout_seconds)
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS sessions (
+                session_id TEXT PRIMARY KEY,
+                data BLOB NOT NULL,
+                last_access REAL NOT NULL
+            )
+            """)
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_sessions_last_access ON sessions (last_access)"
+        )
+        self._conn.commit()
+
+    def _execute(self, sql: str, params: tuple = ()) -> list:
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+            self._conn.commit()
+            return rows
+
+    def _purge_expired(self):
+        cutoff = time.time() - self.idle_timeout_seconds
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM sessions WHERE last_access < ?", (cutoff,)
+            )
+            self._conn.commit()
+        self.expirations += cursor.rowcount
+
+    def _get(self, session_id: str) -> Optional[bytes]:
+        cutoff = time.time() - self.idle_timeout_seconds
+        rows = self._execute(
+            "SELECT data FROM sessions WHERE session_id = ? AND last_access >= ?",
+            (session_id, cutoff),
+        )
+        if not rows:
+            return None
+        self._execute(
+            "UPDATE sessions SET last_access = ? WHERE session_id = ?",
+            (time.time(), session_id),
+        )
+        return rows[0][0]
+
+    def _put(self, session_id: str, data: bytes):
+        self._execute(
+            "INSERT OR REPLACE INTO sessions (session_id, data, last_access) VALUES (?, ?, ?)",
+            (session_id, data, time.time()),
+        )
+        self._purge_expired()
+
+    def _count(self) -> int:
+        cutoff = time.time() - self.idle_timeout_seconds
+        return self._execute(
+            "SELECT COUNT(*) FROM sessions WHERE last_access >= ?", (cutoff,)
+        )[0][0]
+
+    def _stats(self) -> dict:
+        self._purge_expired()
+        size, total_bytes = self._execute(
+            "SELECT COUNT(*), COALESCE(SUM(LENGTH(data)), 0) FROM sessions"
+        )[0]
+        return {"size": size, "total_bytes": total_bytes, "path": self.path}
+
+    async def get(self, session_id: str) -> Optional[SessionState]:
+        raw = await asyncio.to_thread(self._get, session_id)
+        if raw is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return decode_session(raw)
+
+    async def put(self, session_id: str, session: SessionState) -> None:
+        await asyncio.to_thread(self._put, session_id, encode_session(session))
+
+    async def delete(self, session_id: str) -> None:
+        await asyncio.to_thread(
+            self._execute, "DELETE FROM sessions WHERE session_id = ?", (session_id,)
+        )
+
+    async def count(self) -> int:
+        return await asyncio.to_thread(self._count)
+
+    async def stats(self) -> dict:
+        return {**self._base_stats(), **await asyncio.to_thread(self._stats)}
+
+
+class RedisSessionStore(SessionStore):
+    """
+    Out-of-process store shared by every worker and host. Each session is one
+    compressed key whose TTL is the idle timeout, refreshed on every access.
+    """
+
+    key_prefix = "recruiter-agent:session:"
+
+    def __init__(self, url: str, idle_timeout_seconds: float):
+        try:
+            from redis import asyncio as redis
+        except ImportError as e:
+            raise ImportError(
+                "SESSION_STORE_BACKEND=redis requires the `redis` package"
+            ) from e
+
+        super().__init__(idle_timeout_seconds)
+        self._redis = redis.from_url(url)
+
+    def _key(self, session_id: str) -> str:
+        return f"{self.key_prefix}{session_id}"
+
+    async def get(self, session_id: str) -> Optional[SessionState]:
+        raw = await self._redis.getex(
+            self._key(session_id), ex=int(self.idle_timeout_seconds)
+        )
+        if raw is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return decode_session(raw)
+
+    async def put(self, session_id: str, session: SessionState) -> None:
+        await self._redis.set(
+            self._key(session_id),
+            encode_session(session),
+            ex=int(self.idle_timeout_seconds),
+        )
+
+    async def delete(self, session_id: str) -> None:
+        await self._redis.delete(self._key(session_id))
+
+    async def count(self) -> int:
+        size = 0
+        async for _ in self._redis.scan_iter(match=f"{self.key_prefix}*"):
+            size += 1
+        return size
+
+    async def stats(self) -> dict:
+        return {**self._base_stats(), "size": await self.count()}
+
+
+def create_session_store() -> SessionStore:
+    if SESSION_STORE_BACKEND == "memory":
+        return InMemorySessionStore(
+            max_sessions=SESSION_STORE_MAX_SESSIONS,
+            idle_timeout_seconds=SESSION_IDLE_TIMEOUT_SECONDS,
+        )
+    if SESSION_STORE_BACKEND == "sqlite":
+        return SQLiteSessionStore(
+            path=SESSION_STORE_SQLITE_PATH,
+            idle_timeout_seconds=SESSION_IDLE_TIMEOUT_SECONDS,
+        )
+    if SESSION_STORE_BACKEND == "redis":
+        return RedisSessionStore(
+            url=SESSION_STORE_REDIS_URL,
+            idle_timeout_seconds=SESSION_IDLE_TIMEOUT_SECONDS,
+        )
+    raise ValueError(f"Unsupported SESSION_STORE_BACKEND: {SESSION_STORE_BACKEND}")
+
+
+# Session store for multiple callers
+session_store: SessionStore = create_session_store()
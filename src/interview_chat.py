@@ -4,11 +4,10 @@ from typing import List
 from pydantic_ai.messages import ModelMessage
 
 from agents.interview_agent import interview_agent
-from agents.resume_agent import resume_agent
 from config import CANDIDATE_ID_TESTING
 from db.candidate_repository import get_candidate_by_id
 from models.agent_dependencies import AgentDependencies
-from tools.resume_parser import parse_resume_summary
+from services.resume_summary import summarize_resume
 
 
 async def main():
@@ -17,17 +16,10 @@ async def main():
 
     agent_deps = AgentDependencies(candidate=candidate)
 
-    resume_agent_message = "analyze the resume for the candidate"
-
-    resume_agent_response = await resume_agent.run(
-        resume_agent_message, deps=agent_deps
-    )
-
-    resume_summary = parse_resume_summary(resume_agent_response.output)
+    resume_summary = await summarize_resume(candidate)
 
     print(f"Resume summary: {resume_summary}")
 
-    candidate.resume_summary = resume_summary
     candidate.status = "RESUME_SUMMARY_GENERATED"
 
     candidate_exp_summary = f"Candidate profile: {candidate.profile}\nResume summary: {candidate.resume_summary}"
@@ -6,11 +6,10 @@ from pydantic_ai.messages import ModelMessage
 
 from agents.evaluation_agent import evaluation_agent
 from agents.interview_agent import interview_agent
-from agents.resume_agent import resume_agent
-from config import CANDIDATE_ID_TESTING, INTERVIEW_LLM_MODEL, CLIENT_NAME
-from db.candidate_repository import get_candidate_by_id
+from config import CANDIDATE_ID_TESTING, CLIENT_NAME, INTERVIEW_LLM_MODEL
+from db.candidate_repository import get_candidate_by_id, update_candidate_by_id
 from models.agent_dependencies import AgentDependencies
-from tools.resume_parser import parse_resume_summary
+from services.resume_summary import summarize_resume
 
 # Simulated candidate agent prompt template
 CANDIDATE_PROMPT_TEMPLATE = """
@@ -49,16 +48,10 @@ async def simulate_interview(personality: str, skill: str):
     candidate = get_candidate_by_id(candidate_id=CANDIDATE_ID_TESTING)
 
     agent_deps = AgentDependencies(candidate=candidate)
-    resume_agent_message = "analyze the resume for the candidate"
 
-    resume_agent_response = await resume_agent.run(
-        resume_agent_message, deps=agent_deps
-    )
-
-    resume_summary = parse_resume_summary(resume_agent_response.output)
+    resume_summary = await summarize_resume(candidate)
     print(f"Resume summary: {resume_summary}")
 
-    candidate.resume_summary = resume_summary
     candidate.status = "RESUME_SUMMARY_GENERATED"
 
     interviewer_message_history: List[ModelMessage] = []
@@ -136,6 +129,7 @@ async def simulate_interview(personality: str, skill: str):
     )
 
     candidate.status = "EVALUATION_GENERATED"
+    update_candidate_by_id(candidate=candidate)
 
     print(f"Evaluation results {evaluation_response.output}")
 
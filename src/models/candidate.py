@@ -1,6 +1,6 @@
-from typing import List, Literal, Optional
+from typing import Any, Iterable, List, Literal, Optional, Set
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 from models.llm_cost import AgentLLMCost
 
@@ -50,9 +50,48 @@ class Cost(BaseModel):
 class Candidate(BaseModel):
     profile: CandidateProfile
     parsed_resume: Optional[str] = None
+    resume_hash: Optional[str] = None
     resume_summary: Optional[ResumeSummary] = None
+    resume_summary_key: Optional[str] = None
     interview_transcript: Optional[str] = None
     evaluation: Optional[CandidateEvaluation] = None
     status: Optional[str] = None
     agent_llm_cost: Optional[AgentLLMCost] = None
     llm_cost: Optional[float] = None
+
+    # fields assigned since the candidate was loaded or last written
+    _dirty_fields: Set[str] = PrivateAttr(default_factory=set)
+
+    @classmethod
+    def with_unloaded_fields(cls, unloaded_fields: List[str], **data) -> "Candidate":
+        """
+        Build a candidate without the `unloaded_fields`. Reading one raises
+        AttributeError until it is fetched (see `get_candidate_field`) and set
+        with `set_loaded`; unloaded fields are left out of `model_dump`.
+        """
+        candidate = cls(**data)
+        for name in unloaded_fields:
+            candidate.__dict__.pop(name, None)
+        return candidate
+
+    def is_loaded(self, name: str) -> bool:
+        return name in self.__dict__
+
+    def set_loaded(self, name: str, value: Any):
+        """Set a field to its stored value without marking it dirty."""
+        self.__dict__[name] = value
+
+    @property
+    def dirty_fields(self) -> Set[str]:
+        return set(self._dirty_fields)
+
+    def mark_dirty(self, fields: Iterable[str]):
+        self._dirty_fields.update(fields)
+
+    def mark_clean(self, fields: Iterable[str]):
+        self._dirty_fields.difference_update(fields)
+
+    def __setattr__(self, name: str, value: Any):
+        super().__setattr__(name, value)
+        if name in type(self).model_fields:
+            self._dirty_fields.add(name)
@@ -0,0 +1,43 @@
+from enum import Enum
+
+from pydantic import BaseModel, field_validator
+
+FALLBACK_AGENT_RESPONSE = "I couldn't quite get that, please repeat what you said.."
+
+
+class TurnOutcome(str, Enum):
+    NORMAL = "NORMAL"
+    WRAP_UP = "WRAP_UP"
+    GATEKEEPER_FAILURE_ALREADY_INTERVIEWED = "GATEKEEPER_FAILURE_ALREADY_INTERVIEWED"
+    GATEKEEPER_FAILURE_INOFFICE_NOTPOSSIBLE = "GATEKEEPER_FAILURE_INOFFICE_NOTPOSSIBLE"
+    CANDIDATE_REQUESTING_END_CALL = "CANDIDATE_REQUESTING_END_CALL"
+
+    @property
+    def ends_call(self) -> bool:
+        return self is not TurnOutcome.NORMAL
+
+
+class InterviewerTurn(BaseModel):
+    """The JSON envelope the interview agent answers every turn with."""
+
+    agent_response: str = FALLBACK_AGENT_RESPONSE
+    turn_outcome: TurnOutcome = TurnOutcome.NORMAL
+    turn_outcome_reasoning: str = "NO_TURN_OUTCOME_REASONING_PROVIDED"
+
+    @field_validator("agent_response", mode="before")
+    @classmethod
+    def default_empty_response(cls, value):
+        value = str(value or "").strip()
+        return value or FALLBACK_AGENT_RESPONSE
+
+    @field_validator("turn_outcome", mode="before")
+    @classmethod
+    def default_unknown_outcome(cls, value):
+        value = str(value or "").strip().upper()
+        return value if value in TurnOutcome.__members__ else TurnOutcome.NORMAL
+
+    @field_validator("turn_outcome_reasoning", mode="before")
+    @classmethod
+    def default_empty_reasoning(cls, value):
+        value = str(value or "").strip()
+        return value or "NO_TURN_OUTCOME_REASONING_PROVIDED"
@@ -1,11 +1,14 @@
-from dataclasses import dataclass, field
+import json
+from dataclasses import asdict, dataclass, field
 from datetime import datetime
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
-from pydantic_ai.messages import ModelMessage
+from pydantic_ai.messages import ModelMessage, ModelMessagesTypeAdapter
 from pydantic_ai.usage import Usage
 
 from models.agent_dependencies import AgentDependencies
+from models.candidate import Candidate
+from models.llm_cost import LLMCost
 
 
 @dataclass
@@ -20,7 +23,87 @@ class SessionState:
     control_url: str
     transcript: List[Dict[str, str]] = field(default_factory=list)
     end_call: bool = False
+    # set when the resume was summarized by the pre-warm job, outside this session
+    resume_agent_cost: Optional[LLMCost] = None
+    # rolling summary of the turns after the intro that are no longer sent
+    # verbatim, see services/history.py
+    history_summary: str = ""
+    summarized_turns: int = 0
+    history_agent_usage: Usage = field(default_factory=Usage)
+    # input tokens of each interviewer turn
+    turn_input_tokens: List[int] = field(default_factory=list)
+    # scripted opening phase awaiting the candidate's answer, None once the
+    # interview agent has taken over, see services/scripted_phases.py
+    scripted_phase: Optional[str] = None
 
+    def to_json(self) -> bytes:
+        """
+        Serialize everything except the agent, which is a process-local object
+        and is supplied again by `from_json`, and the candidate's parsed resume,
+        which is not needed during the call once it is persisted. Candidate
+        fields that were never loaded stay unloaded on decode.
+        """
+        candidate = self.agent_dependencies.candidate
+        excluded = (
+            set() if "parsed_resume" in candidate.dirty_fields else {"parsed_resume"}
+        )
+        unloaded = {
+            name for name in Candidate.model_fields if not candidate.is_loaded(name)
+        }
+        data = {
+            "candidate": candidate.model_dump(mode="json", exclude=excluded),
+            "candidate_unloaded_fields": sorted(unloaded | excluded),
+            "candidate_dirty_fields": sorted(candidate.dirty_fields),
+            "resume_agent_usage": asdict(self.resume_agent_usage),
+            "interview_agent_usage": asdict(self.interview_agent_usage),
+            "evaluation_agent_usage": asdict(self.evaluation_agent_usage),
+            "message_history": ModelMessagesTypeAdapter.dump_python(
+                self.message_history, mode="json"
+            ),
+            "start_time": self.start_time.isoformat(),
+            "control_url": self.control_url,
+            "transcript": self.transcript,
+            "end_call": self.end_call,
+            "resume_agent_cost": (
+                self.resume_agent_cost.model_dump() if self.resume_agent_cost else None
+            ),
+            "history_summary": self.history_summary,
+            "summarized_turns": self.summarized_turns,
+            "history_agent_usage": asdict(self.history_agent_usage),
+            "turn_input_tokens": self.turn_input_tokens,
+            "scripted_phase": self.scripted_phase,
+        }
+        return json.dumps(data, separators=(",", ":")).encode("utf-8")
 
-# Session store for multiple callers
-session_store: dict[str, SessionState] = {}
+    @classmethod
+    def from_json(cls, raw: bytes, agent: Any) -> "SessionState":
+        data = json.loads(raw)
+        candidate = Candidate.with_unloaded_fields(
+            data.get("candidate_unloaded_fields", ["parsed_resume"]),
+            **data["candidate"],
+        )
+        candidate.mark_dirty(data.get("candidate_dirty_fields", []))
+        return cls(
+            agent=agent,
+            agent_dependencies=AgentDependencies(candidate=candidate),
+            resume_agent_usage=Usage(**data["resume_agent_usage"]),
+            interview_agent_usage=Usage(**data["interview_agent_usage"]),
+            evaluation_agent_usage=Usage(**data["evaluation_agent_usage"]),
+            message_history=ModelMessagesTypeAdapter.validate_python(
+                data["message_history"]
+            ),
+            start_time=datetime.fromisoformat(data["start_time"]),
+            control_url=data["control_url"],
+            transcript=data["transcript"],
+            end_call=data["end_call"],
+            resume_agent_cost=(
+                LLMCost(**data["resume_agent_cost"])
+                if data.get("resume_agent_cost")
+                else None
+            ),
+            history_summary=data.get("history_summary", ""),
+            summarized_turns=data.get("summarized_turns", 0),
+            history_agent_usage=Usage(**data.get("history_agent_usage", {})),
+            turn_input_tokens=data.get("turn_input_tokens", []),
+            scripted_phase=data.get("scripted_phase"),
+        )
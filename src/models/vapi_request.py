@@ -1,6 +1,6 @@
-from typing import List
+from typing import List, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 
 class Message(BaseModel):
@@ -11,6 +11,13 @@ class Message(BaseModel):
 class Call(BaseModel):
     id: str
     type: str
+    monitor: Optional[dict] = None
+    assistant_overrides: Optional[dict] = Field(None, alias="assistantOverrides")
+    metadata: Optional[dict] = None
+
+    @property
+    def control_url(self) -> Optional[str]:
+        return (self.monitor or {}).get("controlUrl")
 
 
 class VAPIRequest(BaseModel):
@@ -22,3 +29,18 @@ class VAPIRequest(BaseModel):
     metadata: dict
     timestamp: int
     stream: bool
+
+    @property
+    def candidate_id(self) -> Optional[str]:
+        """
+        `start_vapi_call` puts the candidate id into assistantOverrides.metadata;
+        VAPI echoes it back on the call object and the request metadata.
+        """
+        for metadata in (
+            (self.call.assistant_overrides or {}).get("metadata"),
+            self.call.metadata,
+            self.metadata,
+        ):
+            if metadata and metadata.get("candidate_id"):
+                return metadata["candidate_id"]
+        return None
@@ -0,0 +1,94 @@
+"""
+Admission control for outbound interview calls.
+
+Every live interview holds a VAPI call and an interview agent session, so
+scheduled interviews are only dialed while fewer than SLOT_CAPACITY sessions
+are live. Interviews due while at the cap wait in line (first due,
+first dialed) and dials are spaced INTERVIEW_DIAL_STAGGER_SECONDS apart, so a
+burst of interviews booked on the same slot does not hit VAPI and the LLM at
+once.
+
+The same limit is applied when an interview is booked, see
+`tools.scheduler.admit_booking`.
+"""
+
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+
+from config import (
+    INTERVIEW_CAPACITY_POLL_SECONDS,
+    INTERVIEW_DIAL_STAGGER_SECONDS,
+    INTERVIEW_LLM_REQUESTS_PER_CALL_MINUTE,
+    INTERVIEW_LLM_RPM_LIMIT,
+    INTERVIEW_MAX_ACTIVE_CALLS,
+    VAPI_MAX_CONCURRENT_CALLS,
+)
+from db.session_store import session_store
+from utils.metrics import INTERVIEW_CAPACITY_WAIT_SECONDS
+
+logger = logging.getLogger(__name__)
+
+
+def slot_capacity() -> int:
+    """
+    Interviews that can overlap while turns stay fast: bounded by our own cap,
+    the VAPI concurrent call limit and the interview model's rate limit.
+    """
+    llm_calls = int(INTERVIEW_LLM_RPM_LIMIT / INTERVIEW_LLM_REQUESTS_PER_CALL_MINUTE)
+    return max(1, min(INTERVIEW_MAX_ACTIVE_CALLS, VAPI_MAX_CONCURRENT_CALLS, llm_calls))
+
+
+SLOT_CAPACITY = slot_capacity()
+
+
+class CallCapacity:
+    def __init__(
+        self, max_active_calls: int, stagger_seconds: float, poll_seconds: float
+    ):
+        self.max_active_calls = max_active_calls
+        self.stagger_seconds = stagger_seconds
+        self.poll_seconds = poll_seconds
+        # dials started by this process whose session is not stored yet
+        self._dialing = 0
+        self._last_dial = 0.0
+        # waiters are admitted one at a time, in arrival order
+        self._admission = asyncio.Lock()
+
+    async def active_calls(self) -> int:
+        # sessions live in the shared store, so this counts every worker's calls;
+        # a call's session is deleted once its post-interview job is queued
+        return await session_store.count() + self._dialing
+
+    @asynccontextmanager
+    async def slot(self, candidate_id: str):
+        """Wait for a free call slot, held while the call is being set up."""
+        started = time.monotonic()
+
+        async with self._admission:
+            while (active := await self.active_calls()) >= self.max_active_calls:
+                logger.info(
+                    f"[Capacity] {active} calls active, interview for {candidate_id} waiting"
+                )
+                await asyncio.sleep(self.poll_seconds)
+
+            delay = self._last_dial + self.stagger_seconds - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+            self._dialing += 1
+            self._last_dial = time.monotonic()
+
+        INTERVIEW_CAPACITY_WAIT_SECONDS.observe(time.monotonic() - started)
+        try:
+            yield
+        finally:
+            self._dialing -= 1
+
+
+call_capacity = CallCapacity(
+    max_active_calls=SLOT_CAPACITY,
+    stagger_seconds=INTERVIEW_DIAL_STAGGER_SECONDS,
+    poll_seconds=INTERVIEW_CAPACITY_POLL_SECONDS,
+)
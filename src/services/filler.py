@@ -0,0 +1,39 @@
+"""
+Short acknowledgments spoken the moment a candidate turn arrives, while the
+session is looked up and the interview agent is still thinking. They are
+picked from a local pool by the shape of the candidate's utterance, without
+an LLM call.
+"""
+
+import random
+
+FILLERS = {
+    # the candidate asked something, or did not catch the last question
+    "question": ["Sure.", "Good question.", "Right, so…"],
+    # yes / no and other one or two word replies
+    "short": ["Okay.", "Got it.", "Alright."],
+    "answer": ["Got it.", "Okay, so…", "Thanks, that helps.", "Alright, thanks."],
+}
+
+SHORT_REPLY_WORDS = 3
+
+
+def filler_kind(utterance: str) -> str:
+    text = utterance.strip()
+    if text.endswith("?"):
+        return "question"
+    if len(text.split()) <= SHORT_REPLY_WORDS:
+        return "short"
+    return "answer"
+
+
+def pick_filler(utterance: str) -> str:
+    return random.choice(FILLERS[filler_kind(utterance)])
+
+
+def filler_prompt_note(filler: str) -> str:
+    # keeps the agent from opening with a second acknowledgment
+    return (
+        f'(You have already said "{filler}" to the candidate this turn. '
+        "Continue from there without another acknowledgment.)"
+    )
@@ -0,0 +1,214 @@
+import json
+import logging
+from dataclasses import replace
+from typing import List
+
+from pydantic_ai.messages import (
+    ModelMessage,
+    ModelRequest,
+    ModelResponse,
+    SystemPromptPart,
+    TextPart,
+    UserPromptPart,
+)
+from pydantic_ai.usage import Usage
+
+from agents.agent_config import INTERVIEW_AGENT_PROMPT
+from agents.history_agent import history_agent
+from config import (
+    HISTORY_KEEP_TURNS,
+    HISTORY_TOKEN_BUDGET,
+    HISTORY_TOKEN_BUDGETS,
+    INTERVIEW_LLM_MODEL,
+)
+from db.session_store import session_store
+from models.interviewer_turn import InterviewerTurn
+from models.session_state import SessionState
+from utils.metrics import track_agent_run
+
+logger = logging.getLogger(__name__)
+
+# model -> per-turn input token budget
+TOKEN_BUDGETS = {
+    model.strip(): int(budget)
+    for model, _, budget in (
+        item.rpartition("=") for item in HISTORY_TOKEN_BUDGETS.split(",") if item
+    )
+}
+
+# sessions with a summarization in flight, at most one per session
+_compacting: set[str] = set()
+
+
+def token_budget(model: str) -> int:
+    return TOKEN_BUDGETS.get(model, HISTORY_TOKEN_BUDGET)
+
+
+def split_turns(messages: List[ModelMessage]) -> List[List[ModelMessage]]:
+    """
+    Group the message history into turns, each starting at the request that
+    carries the candidate's words. The first turn also holds the system prompt
+    and the candidate intro.
+    """
+    turns = []
+    for message in messages:
+        starts_turn = isinstance(message, ModelRequest) and any(
+            isinstance(part, UserPromptPart) for part in message.parts
+        )
+        if starts_turn or not turns:
+            turns.append([])
+        turns[-1].append(message)
+    return turns
+
+
+def build_agent_history(session: SessionState) -> List[ModelMessage]:
+    """
+    The history sent to the interview agent: the first turn (system prompt and
+    candidate intro) and the turns not yet summarized verbatim, with the
+    rolling summary standing in for the turns in between.
+    """
+    if not session.history_summary:
+        return session.message_history
+
+    first_turn, *turns = split_turns(session.message_history)
+    kept = turns[session.summarized_turns :]
+    summary_part = SystemPromptPart(
+        content=f"Summary of the interview so far:\n{session.history_summary}"
+    )
+
+    if kept:
+        request, *rest = kept[0]
+        kept[0] = [replace(request, parts=[summary_part, *request.parts]), *rest]
+    else:
+        kept = [[ModelRequest(parts=[summary_part])]]
+
+    return [message for turn in [first_turn, *kept] for message in turn]
+
+
+def record_spoken_reply(
+    messages: List[ModelMessage], turn: InterviewerTurn, spoken: str
+) -> List[ModelMessage]:
+    """
+    Rewrite the agent's reply in the last response to what was actually
+    spoken (e.g. with a filler in front), so later turns see the real
+    conversation and the agent does not repeat itself.
+    """
+    *earlier, last = messages
+    if not isinstance(last, ModelResponse):
+        return messages
+
+    envelope = turn.model_copy(update={"agent_response": spoken}).model_dump_json()
+    parts = [
+        replace(part, content=envelope) if isinstance(part, TextPart) else part
+        for part in last.parts
+    ]
+    return [*earlier, replace(last, parts=parts)]
+
+
+def record_interrupted_turn(
+    messages: List[ModelMessage], prompt: str, spoken: str
+) -> List[ModelMessage]:
+    """
+    Add a turn whose reply was cut off while streaming (barge-in, hang-up):
+    the candidate's prompt and the part of the reply that was spoken, which
+    is all the candidate heard of it.
+    """
+    parts = [UserPromptPart(content=prompt)]
+    if not messages:
+        # the agent only adds its system prompt to a run without history
+        parts.insert(0, SystemPromptPart(content=INTERVIEW_AGENT_PROMPT))
+
+    recorded = [*messages, ModelRequest(parts=parts)]
+    if spoken:
+        envelope = InterviewerTurn(
+            agent_response=spoken, turn_outcome_reasoning="INTERRUPTED"
+        ).model_dump_json()
+        recorded.append(ModelResponse(parts=[TextPart(content=envelope)]))
+    return recorded
+
+
+def record_turn_input_tokens(session: SessionState, request_tokens_before: int) -> int:
+    tokens = (session.interview_agent_usage.request_tokens or 0) - request_tokens_before
+    session.turn_input_tokens.append(tokens)
+    return tokens
+
+
+def needs_compaction(session: SessionState, model: str = INTERVIEW_LLM_MODEL) -> bool:
+    """
+    True once the last turn went over the model's token budget and there are
+    turns beyond the last HISTORY_KEEP_TURNS left to fold into the summary.
+    """
+    if not session.turn_input_tokens:
+        return False
+    if session.turn_input_tokens[-1] <= token_budget(model):
+        return False
+
+    foldable = len(split_turns(session.message_history)) - 1 - HISTORY_KEEP_TURNS
+    return foldable > session.summarized_turns
+
+
+def render_turns(turns: List[List[ModelMessage]]) -> str:
+    lines = []
+    for message in (m for turn in turns for m in turn):
+        for part in message.parts:
+            if isinstance(part, UserPromptPart):
+                lines.append(str(part.content))
+            elif isinstance(part, TextPart):
+                lines.append(f"Interviewer: {spoken_reply(part.content)}")
+    return "\n".join(lines)
+
+
+def spoken_reply(content: str) -> str:
+    # interviewer output is a JSON envelope, only the spoken reply matters here
+    try:
+        return json.loads(content).get("agent_response", content)
+    except (json.JSONDecodeError, AttributeError):
+        return content
+
+
+async def compact_session_history(session_id: str):
+    """
+    Fold the turns older than the last HISTORY_KEEP_TURNS into the session's
+    rolling summary. Runs as a background task between turns; a turn that
+    starts meanwhile simply uses the previous summary.
+    """
+    if session_id in _compacting:
+        return
+    _compacting.add(session_id)
+
+    try:
+        session = await session_store.get(session_id)
+        if not session:
+            return
+
+        turns = split_turns(session.message_history)[1:]
+        summarized_turns = session.summarized_turns
+        fold_until = len(turns) - HISTORY_KEEP_TURNS
+        if fold_until <= summarized_turns:
+            return
+
+        prompt = (
+            f"Summary so far:\n{session.history_summary or '(none)'}\n\n"
+            f"New turns:\n{render_turns(turns[summarized_turns:fold_until])}"
+        )
+        usage = Usage()
+        with track_agent_run("history", INTERVIEW_LLM_MODEL):
+            result = await history_agent.run(prompt, usage=usage)
+
+        # the session may have moved on while summarizing, update the latest copy
+        session = await session_store.get(session_id)
+        if not session or session.summarized_turns != summarized_turns:
+            return
+
+        session.history_summary = result.output.strip()
+        session.summarized_turns = fold_until
+        session.history_agent_usage.incr(usage)
+        await session_store.put(session_id, session)
+
+        logger.info(
+            f"[{session_id}] Compacted history, {fold_until} turns summarized, last turn input tokens {session.turn_input_tokens[-1]}"
+        )
+    except Exception:
+        logger.exception(f"[{session_id}] History compaction failed")
+    finally:
+        _compacting.discard(session_id)
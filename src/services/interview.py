@@ -3,12 +3,17 @@ from datetime import datetime, timezone
 
 from pydantic_ai.usage import Usage
 
+from agents.agent_cost import compute_llm_cost
 from agents.interview_agent import interview_agent
-from agents.resume_agent import resume_agent
-from db.candidate_repository import get_candidate_by_id, update_candidate_by_id
+from config import INTERVIEW_SCRIPTED_PHASES_ENABLED, RESUME_LLM_MODEL
+from db.async_candidate_repository import get_candidate_by_id, update_candidate_by_id
+from db.candidate_cache import cache_candidate
+from db.candidate_repository import DEFAULT_FIELD_GROUPS
+from db.session_store import session_store
 from models.agent_dependencies import AgentDependencies
-from models.session_state import SessionState, session_store
-from tools.resume_parser import parse_resume_summary
+from models.llm_cost import AgentLLMCost
+from models.session_state import SessionState
+from services.resume_summary import summarize_resume
 from tools.vapi_client import start_vapi_call
 
 logger = logging.getLogger(__name__)
@@ -27,31 +32,66 @@ def extract_first_name(full_name: str) -> str:
     )
 
 
+async def prewarm_interview(candidate_id: str):
+    """
+    Summarize the candidate's resume ahead of the interview slot, so that
+    `run_interview` only has to dial. The resume agent cost is recorded on the
+    candidate here, as the interview session will not see this run's usage.
+    """
+    candidate = await get_candidate_by_id(candidate_id)
+
+    if not candidate.profile.resume_file_name:
+        logger.info(f"[Prewarm] No resume for candidate {candidate_id}, skipping.")
+        return
+
+    resume_agent_usage = Usage()
+    resume_summary = await summarize_resume(candidate, resume_agent_usage)
+    logger.info(f"[Prewarm] Resume summary ready for candidate {candidate_id}")
+
+    # replaces any cost left over from an earlier interview
+    agent_llm_cost = AgentLLMCost(
+        resume_agent=(
+            compute_llm_cost(resume_agent_usage, RESUME_LLM_MODEL)
+            if resume_agent_usage.requests
+            else None
+        )
+    )
+    candidate.agent_llm_cost = agent_llm_cost
+    candidate.llm_cost = agent_llm_cost.total_llm_cost()
+
+    if resume_summary:
+        candidate.status = "RESUME_SUMMARY_GENERATED"
+    await update_candidate_by_id(candidate=candidate)
+
+
 async def run_interview(candidate_id: str):
-    candidate = get_candidate_by_id(candidate_id)
+    # "cost" holds the resume agent cost recorded by prewarm_interview
+    candidate = await get_candidate_by_id(
+        candidate_id, field_groups=(*DEFAULT_FIELD_GROUPS, "cost")
+    )
     first_name = extract_first_name(candidate.profile.name)
     resume_agent_usage = Usage()
-    resume_url = candidate.profile.resume_url
-    
-    if resume_url:
+    resume_agent_cost = None
+    resume_summary = None
+
+    if candidate.status == "RESUME_SUMMARY_GENERATED" and candidate.resume_summary:
+        logger.info(f"Resume summary pre-warmed for candidate {candidate_id}.")
+        prewarm_cost = candidate.agent_llm_cost
+        resume_agent_cost = prewarm_cost.resume_agent if prewarm_cost else None
+    elif candidate.profile.resume_file_name:
         logger.info(
             f"Resume available for candidate {candidate_id}. Kicking off Resume Agent."
         )
-        agent_deps = AgentDependencies(candidate=candidate)
+        try:
+            resume_summary = await summarize_resume(candidate, resume_agent_usage)
+        except ValueError as e:
+            logger.warning(f"Could not summarize resume for {candidate_id}: {e}")
 
-        resume_agent_message = "analyze the resume for the candidate"
-        resume_agent_response = await resume_agent.run(
-            resume_agent_message, deps=agent_deps, usage=resume_agent_usage
-        )
-        logger.info(f"Resume Summary output from LLM {resume_agent_response.output}")
-
-        resume_summary = parse_resume_summary(resume_agent_response.output)
+    if resume_summary:
         logger.info(f"Resume summary: {resume_summary}")
-
-        candidate.resume_summary = resume_summary
         candidate.status = "RESUME_SUMMARY_GENERATED"
-        update_candidate_by_id(candidate=candidate)
-    else:
+        await update_candidate_by_id(candidate=candidate)
+    elif not candidate.resume_summary:
         logger.info(
             f"Resume not available for candidate {candidate_id}. Kicking off Interview."
         )
@@ -66,17 +106,22 @@ async def run_interview(candidate_id: str):
     control_url = call_response["monitor"]["controlUrl"]
 
     deps = AgentDependencies(candidate=candidate)
+    cache_candidate(candidate)
 
-    session_store[call_id] = SessionState(
+    session = SessionState(
         agent=interview_agent,
         agent_dependencies=deps,
         resume_agent_usage=resume_agent_usage,
+        resume_agent_cost=resume_agent_cost,
         interview_agent_usage=Usage(),
         evaluation_agent_usage=Usage(),
         message_history=[],
         start_time=datetime.now(timezone.utc),
         control_url=control_url,
+        # "identity": the greeting above asks whether we reached the candidate
+        scripted_phase="identity" if INTERVIEW_SCRIPTED_PHASES_ENABLED else None,
     )
+    await session_store.put(call_id, session)
 
     logger.info(f"Started new session with session_id: {call_id}")
 
@@ -0,0 +1,118 @@
+import asyncio
+import logging
+
+from pydantic_ai.usage import Usage
+
+from agents.agent_cost import compute_llm_cost
+from agents.evaluation_agent import evaluation_agent
+from config import EVALUATION_LLM_MODEL, INTERVIEW_LLM_MODEL, RESUME_LLM_MODEL
+from db.async_candidate_repository import (
+    ensure_candidate_field,
+    update_candidate_by_id,
+)
+from db.session_store import decode_session
+from models.llm_cost import AgentLLMCost
+from models.session_state import SessionState
+from tools.vapi_client import end_vapi_call
+from utils.metrics import POST_INTERVIEW_STAGE_SECONDS, track_agent_run
+
+logger = logging.getLogger(__name__)
+
+
+async def run_post_interview_job(call_id: str, payload: bytes):
+    """Handler for `post_interview_queue`, the payload is the encoded session."""
+    await process_interview(call_id, decode_session(payload))
+
+
+async def process_interview(session_id: str, session: SessionState):
+    """
+    Evaluate a finished interview. The transcript is written while the
+    evaluation runs, so it is saved even if the evaluation fails; the
+    evaluation, status and costs follow in a final update. The resume/interview
+    costs are settled before the evaluation runs.
+
+    Raises when the evaluation failed, after the writes, so the queue retries
+    the job while the transcript and costs are already saved.
+    """
+    deps = session.agent_dependencies
+    candidate = deps.candidate
+
+    full_transcript = "\n".join(
+        f"{turn['role']}: {turn['content']}" for turn in session.transcript
+    )
+    candidate.interview_transcript = full_transcript
+    candidate.status = "INTERVIEW_COMPLETE"
+
+    # these agents are done, their costs don't depend on the evaluation
+    resume_agent_cost = session.resume_agent_cost or compute_llm_cost(
+        session.resume_agent_usage, RESUME_LLM_MODEL
+    )
+    # history summaries run on the interview model and count as interview cost
+    interview_usage = Usage()
+    interview_usage.incr(session.interview_agent_usage)
+    interview_usage.incr(session.history_agent_usage)
+    interview_agent_cost = compute_llm_cost(interview_usage, INTERVIEW_LLM_MODEL)
+
+    async def persist_transcript():
+        with POST_INTERVIEW_STAGE_SECONDS.time(stage="transcript"):
+            await update_candidate_by_id(candidate=candidate)
+
+    async def evaluate():
+        # the evaluation tool sets candidate.evaluation and the status
+        with (
+            POST_INTERVIEW_STAGE_SECONDS.time(stage="evaluation"),
+            track_agent_run("evaluation", EVALUATION_LLM_MODEL),
+        ):
+            await evaluation_agent.run(
+                user_prompt=full_transcript,
+                usage=session.evaluation_agent_usage,
+                deps=deps,
+            )
+        evaluation = await ensure_candidate_field(candidate, "evaluation")
+        logger.info(f"[{session_id}] Evaluation results: {evaluation}")
+
+    transcript_error, evaluation_error = await asyncio.gather(
+        persist_transcript(), evaluate(), return_exceptions=True
+    )
+    if transcript_error:
+        # still dirty, the final update writes it
+        logger.error(f"[{session_id}] [Error] saving transcript: {transcript_error}")
+    if evaluation_error:
+        logger.error(
+            f"[{session_id}] [Error] running evaluation_agent: {evaluation_error}"
+        )
+
+    agent_llm_cost = AgentLLMCost(
+        resume_agent=resume_agent_cost,
+        interview_agent=interview_agent_cost,
+        evaluation_agent=compute_llm_cost(
+            session.evaluation_agent_usage, EVALUATION_LLM_MODEL
+        ),
+    )
+
+    total_llm_cost = agent_llm_cost.total_llm_cost()
+
+    candidate.llm_cost = total_llm_cost
+    candidate.agent_llm_cost = agent_llm_cost
+    logger.info(f"[{session_id}] Total interview cost {total_llm_cost}")
+
+    # the evaluation tool can set the status while the transcript write is in
+    # flight, which then marks it clean, so write it again
+    candidate.mark_dirty(["status"])
+    with POST_INTERVIEW_STAGE_SECONDS.time(stage="persist"):
+        await update_candidate_by_id(candidate=candidate)
+
+    if evaluation_error:
+        raise evaluation_error
+
+
+async def hang_up_call(session_id: str, control_url: str):
+    try:
+        # let the closing line finish playing
+        logger.info(f"[{session_id}] Waiting 30s before ending call...")
+        await asyncio.sleep(30)
+        with POST_INTERVIEW_STAGE_SECONDS.time(stage="end_call"):
+            await end_vapi_call(call_id=session_id, control_url=control_url)
+        logger.info(f"Ended call: {session_id}")
+    except Exception as e:
+        logger.error(f"Error ending call {session_id}: {e}")
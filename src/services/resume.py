@@ -0,0 +1,103 @@
+import hashlib
+import logging
+import os
+from typing import Optional
+
+from config import RESUME_TEXT_CACHE_DIR
+from db.async_candidate_repository import (
+    generate_signed_resume_url,
+    get_candidate_field,
+    get_resume_etag,
+)
+from models.candidate import Candidate
+from tools.resume_parser import (
+    download_resume,
+    extract_resume_text_async,
+    get_file_extension,
+)
+from utils.metrics import RESUME_STAGE_SECONDS
+
+logger = logging.getLogger(__name__)
+
+
+def _cache_path(resume_hash: str) -> str:
+    return os.path.join(RESUME_TEXT_CACHE_DIR, f"{resume_hash}.txt")
+
+
+def read_cached_resume_text(resume_hash: str) -> Optional[str]:
+    try:
+        with open(_cache_path(resume_hash), encoding="utf-8") as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
+
+
+def write_cached_resume_text(resume_hash: str, text: str):
+    os.makedirs(RESUME_TEXT_CACHE_DIR, exist_ok=True)
+    path = _cache_path(resume_hash)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+
+
+async def load_resume_text(candidate: Candidate) -> str:
+    """
+    Return the candidate's extracted resume text, keyed by the content hash of
+    the resume file.
+
+    When the storage ETag matches a cached extraction (local disk first, then
+    the candidate record), neither the download nor text extraction runs.
+    Otherwise the file is downloaded, hashed, and only extracted if that hash
+    is unknown. The result is cached locally, and `parsed_resume` and
+    `resume_hash` are marked for writing when the record is out of date.
+    """
+    profile = candidate.profile
+    candidate_id = profile.candidate_id
+    resume_hash = (
+        await get_resume_etag(profile.resume_file_name)
+        if profile.resume_file_name
+        else None
+    )
+
+    if resume_hash:
+        text = read_cached_resume_text(resume_hash)
+        if text is None and candidate.resume_hash == resume_hash:
+            text = await get_candidate_field(candidate_id, "parsed_resume")
+            if text:
+                write_cached_resume_text(resume_hash, text)
+        if text is not None:
+            logger.info(f"Resume text cache hit for candidate {candidate_id}")
+            _attach_resume_text(candidate, resume_hash, text)
+            return text
+
+    resume_url = profile.resume_url or await generate_signed_resume_url(
+        profile.resume_file_name
+    )
+    if not resume_url:
+        raise ValueError(f"Resume not found for candidate {candidate_id}")
+    profile.resume_url = resume_url
+    with RESUME_STAGE_SECONDS.time(stage="download"):
+        content = await download_resume(resume_url)
+
+    resume_hash = resume_hash or hashlib.sha256(content).hexdigest()
+    text = read_cached_resume_text(resume_hash)
+    if text is None:
+        with RESUME_STAGE_SECONDS.time(stage="extract"):
+            text = await extract_resume_text_async(
+                content, get_file_extension(resume_url)
+            )
+        write_cached_resume_text(resume_hash, text)
+
+    candidate.parsed_resume = text
+    candidate.resume_hash = resume_hash
+    return text
+
+
+def _attach_resume_text(candidate: Candidate, resume_hash: str, text: str):
+    if candidate.resume_hash == resume_hash:
+        # the record already holds this extraction
+        candidate.set_loaded("parsed_resume", text)
+    else:
+        candidate.parsed_resume = text
+        candidate.resume_hash = resume_hash
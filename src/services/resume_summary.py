@@ -0,0 +1,88 @@
+import hashlib
+import logging
+import os
+from typing import Optional
+
+from pydantic_ai.usage import Usage
+
+from agents.agent_config import RESUME_AGENT_PROMPT
+from agents.resume_agent import resume_agent
+from config import RESUME_LLM_MODEL, RESUME_SUMMARY_CACHE_DIR
+from models.agent_dependencies import AgentDependencies
+from models.candidate import Candidate, ResumeSummary
+from services.resume import load_resume_text
+from tools.resume_parser import parse_resume_summary
+from utils.metrics import track_agent_run
+
+logger = logging.getLogger(__name__)
+
+RESUME_AGENT_MESSAGE = "analyze the resume for the candidate"
+
+# any edit to the prompt invalidates every memoized summary
+RESUME_AGENT_PROMPT_HASH = hashlib.sha256(RESUME_AGENT_PROMPT.encode()).hexdigest()
+
+
+def resume_summary_key(resume_hash: str) -> str:
+    return hashlib.sha256(
+        f"{resume_hash}|{RESUME_AGENT_PROMPT_HASH}|{RESUME_LLM_MODEL}".encode()
+    ).hexdigest()
+
+
+def _cache_path(key: str) -> str:
+    return os.path.join(RESUME_SUMMARY_CACHE_DIR, f"{key}.json")
+
+
+def read_cached_resume_summary(key: str) -> Optional[ResumeSummary]:
+    try:
+        with open(_cache_path(key), encoding="utf-8") as f:
+            return ResumeSummary.model_validate_json(f.read())
+    except FileNotFoundError:
+        return None
+
+
+def write_cached_resume_summary(key: str, summary: ResumeSummary):
+    os.makedirs(RESUME_SUMMARY_CACHE_DIR, exist_ok=True)
+    path = _cache_path(key)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(summary.model_dump_json())
+    os.replace(tmp_path, path)
+
+
+async def summarize_resume(
+    candidate: Candidate, usage: Optional[Usage] = None
+) -> ResumeSummary:
+    """
+    Return the candidate's resume summary, running the resume agent only when
+    no summary exists for this (resume content, RESUME_AGENT_PROMPT,
+    RESUME_LLM_MODEL) combination, either on the candidate record or in the
+    local cache. Sets `resume_summary` and `resume_summary_key` on the
+    candidate; the caller persists them.
+    """
+    candidate_id = candidate.profile.candidate_id
+
+    # cheap on a cache hit, and gives us the resume content hash
+    await load_resume_text(candidate)
+    key = resume_summary_key(candidate.resume_hash)
+
+    if candidate.resume_summary and candidate.resume_summary_key == key:
+        logger.info(f"Reusing stored resume summary for candidate {candidate_id}")
+        return candidate.resume_summary
+
+    summary = read_cached_resume_summary(key)
+    if summary:
+        logger.info(f"Resume summary cache hit for candidate {candidate_id}")
+    else:
+        agent_deps = AgentDependencies(candidate=candidate)
+        with track_agent_run("resume", RESUME_LLM_MODEL):
+            resume_agent_response = await resume_agent.run(
+                RESUME_AGENT_MESSAGE, deps=agent_deps, usage=usage
+            )
+        logger.info(f"Resume Summary output from LLM {resume_agent_response.output}")
+
+        summary = parse_resume_summary(resume_agent_response.output)
+        write_cached_resume_summary(key, summary)
+
+    candidate.resume_summary = summary
+    candidate.resume_summary_key = key
+    return summary
@@ -0,0 +1,197 @@
+"""
+Scripted opening of the interview.
+
+The first turns of INTERVIEW_AGENT_PROMPT's turn flow (time check, intro,
+client and role brief, the two gatekeeper questions) are the same on every
+call, so they are served from the pre-rendered SCRIPTED_LINES instead of an
+interview agent run. The candidate's answer to each is classified yes / no
+locally; the script only moves on when the answer is the expected one.
+Anything else (an unexpected or ambiguous answer, a question back) hands the
+turn to the interview agent, which finds the scripted turns in its message
+history exactly as if it had spoken them.
+"""
+
+import logging
+import re
+from typing import List, Optional
+
+from pydantic_ai.messages import (
+    ModelMessage,
+    ModelRequest,
+    ModelResponse,
+    SystemPromptPart,
+    TextPart,
+    UserPromptPart,
+)
+
+from agents.agent_config import INTERVIEW_AGENT_PROMPT, SCRIPTED_LINES
+from models.interviewer_turn import InterviewerTurn
+from models.session_state import SessionState
+from services.interview import extract_first_name
+from utils.metrics import SCRIPTED_TURNS
+
+logger = logging.getLogger(__name__)
+
+# phase awaiting an answer -> (answer that continues the script, next phase)
+# run_interview starts sessions at "identity", answering VAPI's greeting
+# "am I speaking with <first name>?"
+SCRIPT = {
+    "identity": ("yes", "time_check"),
+    "time_check": ("yes", "ready"),
+    "ready": ("yes", "prior_interview"),
+    "prior_interview": ("no", "schedule"),
+    "schedule": ("yes", "deep_dive"),
+}
+
+YES_PHRASES = [
+    "yes",
+    "yeah",
+    "yep",
+    "yup",
+    "ya",
+    "sure",
+    "correct",
+    "that's right",
+    "absolutely",
+    "definitely",
+    "of course",
+    "speaking",
+    "this is he",
+    "this is she",
+    "that's me",
+    "i do",
+    "i'm ready",
+    "ready",
+    "ok",
+    "okay",
+    "alright",
+    "all right",
+    "sounds good",
+    "go ahead",
+    "that works",
+    "works",
+    "that's fine",
+    "no problem",
+    "no worries",
+    "let's do it",
+]
+# explicit negatives only: a refusal like "I'm busy" is not the "no" that
+# continues past the prior interview question, it goes to the agent
+NO_PHRASES = [
+    "no",
+    "nope",
+    "nah",
+    "not really",
+    "never",
+    "not yet",
+    "i haven't",
+    "haven't",
+    "i have not",
+    "i don't",
+]
+# hedges make an otherwise clear answer ambiguous
+UNSURE_PHRASES = [
+    "not",
+    "not sure",
+    "maybe",
+    "depends",
+    "i think so",
+    "i don't think so",
+    "i guess",
+    "kind of",
+    "sort of",
+    "probably",
+    "i don't know",
+    "don't remember",
+    "i don't remember",
+    "can't remember",
+    "what",
+    "sorry",
+    "repeat",
+    "but",
+]
+# longer answers carry more than a yes or no, leave them to the agent
+MAX_CLASSIFIED_WORDS = 12
+
+_LABELS = {
+    **{phrase: "yes" for phrase in YES_PHRASES},
+    **{phrase: "no" for phrase in NO_PHRASES},
+    **{phrase: "unsure" for phrase in UNSURE_PHRASES},
+}
+# longest phrases first, so "no problem" wins over "no"
+_PHRASE_PATTERN = re.compile(
+    r"\b(?:"
+    + "|".join(re.escape(p) for p in sorted(_LABELS, key=len, reverse=True))
+    + r")\b"
+)
+
+
+def classify_yes_no(utterance: str) -> Optional[str]:
+    """'yes', 'no', or None when the answer is not a clear one of the two."""
+    text = utterance.lower().replace("’", "'").strip()
+    if not text or text.endswith("?") or len(text.split()) > MAX_CLASSIFIED_WORDS:
+        return None
+
+    labels = {_LABELS[match.group(0)] for match in _PHRASE_PATTERN.finditer(text)}
+    if len(labels) != 1 or "unsure" in labels:
+        return None
+    return labels.pop()
+
+
+def scripted_messages(
+    session: SessionState, prompt: str, line: str, phase: str
+) -> List[ModelMessage]:
+    """
+    The request / response pair an agent run would have added for this turn,
+    so the interview agent sees a consistent history once it takes over.
+    """
+    parts = [UserPromptPart(content=prompt)]
+    if not session.message_history:
+        # the agent only adds its system prompt to a run without history
+        parts.insert(0, SystemPromptPart(content=INTERVIEW_AGENT_PROMPT))
+
+    envelope = InterviewerTurn(
+        agent_response=line, turn_outcome_reasoning=f"SCRIPTED_PHASE: {phase}"
+    ).model_dump_json()
+    return [
+        ModelRequest(parts=parts),
+        ModelResponse(parts=[TextPart(content=envelope)], model_name="scripted"),
+    ]
+
+
+def scripted_turn(
+    session: SessionState, candidate_response: str, prompt: str, filler: str = ""
+) -> Optional[str]:
+    """
+    Serve the next scripted line if the session is still in the scripted
+    opening and the candidate gave the expected answer. Records the turn, with
+    any `filler` already spoken in front, in the message history and transcript
+    and returns the line to speak. Returns None (and leaves the scripted
+    opening) to let the agent answer.
+    """
+    phase = session.scripted_phase
+    if phase not in SCRIPT:
+        return None
+
+    expected, next_phase = SCRIPT[phase]
+    answer = classify_yes_no(candidate_response)
+    if answer != expected:
+        logger.info(
+            f"[Script] Handing off to the interview agent at {phase}, answer: {answer}"
+        )
+        SCRIPTED_TURNS.inc(phase=phase, outcome="handoff")
+        session.scripted_phase = None
+        return None
+
+    first_name = extract_first_name(session.agent_dependencies.candidate.profile.name)
+    line = SCRIPTED_LINES[next_phase].replace("{first_name}", first_name)
+    spoken = f"{filler} {line}" if filler else line
+
+    session.message_history = [
+        *session.message_history,
+        *scripted_messages(session, prompt, spoken, next_phase),
+    ]
+    session.transcript.append({"role": "interviewer", "content": spoken})
+    session.scripted_phase = next_phase if next_phase in SCRIPT else None
+    SCRIPTED_TURNS.inc(phase=phase, outcome="scripted")
+    return line
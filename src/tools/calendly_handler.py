@@ -2,16 +2,17 @@ import logging
 from datetime import datetime
 from urllib.parse import urlparse
 
-from db.candidate_repository import normalize_phone, upsert_candidate_from_calendly
+from db.async_candidate_repository import upsert_candidate_from_calendly
+from db.candidate_repository import normalize_phone
 
 logger = logging.getLogger(__name__)
 
 
-def dispatch_event(event_type: str, payload: dict):
+async def dispatch_event(event_type: str, payload: dict):
     if event_type == "invitee.created":
-        return handle_invitee_created(payload)
+        return await handle_invitee_created(payload)
     elif event_type == "invitee.canceled":
-        return handle_invitee_canceled(payload)
+        return await handle_invitee_canceled(payload)
     else:
         raise ValueError(f"Unhandled event type: {event_type}")
 
@@ -28,7 +29,7 @@ def extract_candidate_info(payload: dict):
     return name, email, phone
 
 
-def handle_invitee_created(payload: dict):
+async def handle_invitee_created(payload: dict):
     name, email, raw_phone = extract_candidate_info(payload)
 
     phone = normalize_phone(raw_phone) if raw_phone else None
@@ -42,7 +43,7 @@ def handle_invitee_created(payload: dict):
     logger.info(
         f"upsert_candidate_from_calendly INTERVIEW_SCHEDULED {name} {email} {phone} {scheduled_time}"
     )
-    candidate_id = upsert_candidate_from_calendly(
+    candidate_id = await upsert_candidate_from_calendly(
         name=name,
         email=email,
         phone=phone,
@@ -57,14 +58,14 @@ def handle_invitee_created(payload: dict):
     }
 
 
-def handle_invitee_canceled(payload: dict):
+async def handle_invitee_canceled(payload: dict):
     name, email, raw_phone = extract_candidate_info(payload)
     phone = normalize_phone(raw_phone) if raw_phone else None
 
     logger.info(
         f"upsert_candidate_from_calendly INTERVIEW_CANCELED {name} {email} {phone} scheduled_time None"
     )
-    candidate_id = upsert_candidate_from_calendly(
+    candidate_id = await upsert_candidate_from_calendly(
         name=name,
         email=email,
         phone=phone,
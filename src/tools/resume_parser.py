@@ -1,16 +1,23 @@
+import asyncio
 import io
 import json
 import logging
-import re
-from typing import Any
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Optional
 from urllib.parse import urlparse
 
-import requests
+import httpx
 from docx import Document
 from pdfminer.high_level import extract_text_to_fp
 from pydantic import ValidationError
 
+from config import (
+    RESUME_DOWNLOAD_TIMEOUT_SECONDS,
+    RESUME_MAX_BYTES,
+    RESUME_PARSER_MAX_WORKERS,
+)
 from models.candidate import ResumeSummary
+from utils.json_stream import sanitize_llm_json
 
 # Suppress noisy PDF parser logs
 logging.getLogger("pdfminer").setLevel(logging.ERROR)
@@ -21,23 +28,63 @@ def get_file_extension(url: str) -> str:
     return path.split(".")[-1].lower()
 
 
-def parse_resume_from_url(resume_url: str) -> str:
-    response = requests.get(resume_url)
-    if response.status_code != 200:
-        raise Exception(
-            f"Failed to fetch resume from URL: {resume_url} (status {response.status_code})"
+_resume_process_pool: Optional[ProcessPoolExecutor] = None
+
+
+def get_resume_process_pool() -> ProcessPoolExecutor:
+    global _resume_process_pool
+    if _resume_process_pool is None:
+        _resume_process_pool = ProcessPoolExecutor(
+            max_workers=RESUME_PARSER_MAX_WORKERS
         )
+    return _resume_process_pool
 
-    file_ext = get_file_extension(resume_url)
 
+def shutdown_resume_process_pool():
+    global _resume_process_pool
+    if _resume_process_pool is not None:
+        _resume_process_pool.shutdown(wait=False, cancel_futures=True)
+        _resume_process_pool = None
+
+
+async def download_resume(resume_url: str) -> bytes:
+    """
+    Stream the resume into memory, refusing files larger than RESUME_MAX_BYTES.
+    """
+    async with httpx.AsyncClient(timeout=RESUME_DOWNLOAD_TIMEOUT_SECONDS) as client:
+        async with client.stream("GET", resume_url) as response:
+            if response.status_code != 200:
+                raise Exception(
+                    f"Failed to fetch resume from URL: {resume_url} (status {response.status_code})"
+                )
+
+            content_length = int(response.headers.get("content-length") or 0)
+            if content_length > RESUME_MAX_BYTES:
+                raise ValueError(
+                    f"Resume too large: {content_length} bytes (limit {RESUME_MAX_BYTES})"
+                )
+
+            content = bytearray()
+            async for chunk in response.aiter_bytes():
+                content.extend(chunk)
+                if len(content) > RESUME_MAX_BYTES:
+                    raise ValueError(f"Resume too large: over {RESUME_MAX_BYTES} bytes")
+
+    return bytes(content)
+
+
+def extract_resume_text(content: bytes, file_ext: str) -> str:
+    """
+    CPU-bound text extraction, run in the resume process pool.
+    """
     if file_ext == "pdf":
         output = io.StringIO()
-        with io.BytesIO(response.content) as pdf_stream:
+        with io.BytesIO(content) as pdf_stream:
             extract_text_to_fp(pdf_stream, output)
         return output.getvalue()
 
     elif file_ext == "docx":
-        with io.BytesIO(response.content) as docx_stream:
+        with io.BytesIO(content) as docx_stream:
             doc = Document(docx_stream)
             return "\n".join([para.text for para in doc.paragraphs])
 
@@ -45,6 +92,26 @@ def parse_resume_from_url(resume_url: str) -> str:
         raise ValueError(f"Unsupported resume format: {file_ext}")
 
 
+async def extract_resume_text_async(content: bytes, file_ext: str) -> str:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        get_resume_process_pool(), extract_resume_text, content, file_ext
+    )
+
+
+async def parse_resume_from_url(resume_url: str) -> str:
+    """
+    Download the resume without blocking the event loop and extract its text
+    in a separate process, so a large PDF never stalls live interview turns.
+    """
+    file_ext = get_file_extension(resume_url)
+    if file_ext not in ("pdf", "docx"):
+        raise ValueError(f"Unsupported resume format: {file_ext}")
+
+    content = await download_resume(resume_url)
+    return await extract_resume_text_async(content, file_ext)
+
+
 def parse_resume_summary(json_str: str) -> ResumeSummary:
     """
     Given a JSON string from the LLM matching the ResumeSummary schema,
@@ -63,24 +130,3 @@ def parse_resume_summary(json_str: str) -> ResumeSummary:
         raise ValueError(f"ResumeSummary validation error: {ve}")
 
     return summary
-
-
-def sanitize_llm_json(raw: str) -> str:
-    """
-    1. Strip Markdown code fences (```json …```)
-    2. Extract the first {...} block
-    3. Remove any trailing commas before ] or }
-    """
-    # 1. Remove markdown fences
-    raw = re.sub(r"```(?:json)?\s*", "", raw)
-    raw = raw.replace("```", "")
-
-    # 2. Extract the first {...} substring
-    match = re.search(r"\{.*\}", raw, flags=re.DOTALL)
-    if match:
-        raw = match.group(0)
-
-    # 3. Remove trailing commas:  "item", ]  →  "item" ]
-    raw = re.sub(r",\s*(?=[}\]])", "", raw)
-
-    return raw
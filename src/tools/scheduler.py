@@ -1,24 +1,50 @@
+import asyncio
 import logging
-from datetime import datetime
+import random
+from datetime import datetime, timedelta, timezone
+from typing import Optional
 
+from apscheduler.events import EVENT_JOB_MISSED, EVENT_JOB_SUBMITTED
 from apscheduler.jobstores.base import JobLookupError
+from apscheduler.jobstores.memory import MemoryJobStore
 from apscheduler.jobstores.sqlalchemy import SQLAlchemyJobStore
 from apscheduler.schedulers.background import BackgroundScheduler
+from apscheduler.util import datetime_to_utc_timestamp
+from sqlalchemy import func, not_, select
 
-from config import APSCHEDULER_DB_NAME, SUPABASE_DB_URL
-from services.interview import run_interview
+from config import (
+    APPLICATION_WORKERS,
+    APSCHEDULER_DB_NAME,
+    BOOKING_OVERFLOW_JITTER_SECONDS,
+    INTERVIEW_SLOT_MINUTES,
+    RESUME_PREWARM_MAX_CONCURRENCY,
+    RESUME_PREWARM_MINUTES,
+    SCHEDULER_LOCK_PATH,
+    SUPABASE_DB_URL,
+)
+from services.call_capacity import SLOT_CAPACITY, call_capacity
+from services.interview import prewarm_interview, run_interview
+from utils.metrics import (
+    INTERVIEW_BOOKINGS,
+    INTERVIEW_START_LAG_SECONDS,
+    SCHEDULER_JOB_LAG_SECONDS,
+    SCHEDULER_JOBS_MISSED,
+)
 
 logger = logging.getLogger(__name__)
 
+interview_job_store = SQLAlchemyJobStore(
+    url=SUPABASE_DB_URL,
+    tablename=APSCHEDULER_DB_NAME,
+    engine_options={"pool_pre_ping": True},  # important for Supabase session pooler
+)
+
+# job store I/O stays on the scheduler's threads; the jobs hand their work to
+# the FastAPI event loop, see start_scheduler
 scheduler = BackgroundScheduler(
     jobstores={
-        "default": SQLAlchemyJobStore(
-            url=SUPABASE_DB_URL,
-            tablename=APSCHEDULER_DB_NAME,
-            engine_options={
-                "pool_pre_ping": True
-            },  # important for Supabase session pooler
-        )
+        "default": interview_job_store,
+        "local": MemoryJobStore(),
     },
     job_defaults={
         "misfire_grace_time": 300,  # Allow up to 5 minutes delay
@@ -28,54 +54,256 @@ scheduler = BackgroundScheduler(
 )
 
 
+# keeps the scheduler lock held for the lifetime of the process
+_scheduler_lock_file = None
+
+# the app's event loop, captured by start_scheduler
+_app_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def acquire_scheduler_lock() -> bool:
+    """
+    With several uvicorn workers every process imports this module, but only
+    one of them may run jobs or each interview would be dialed once per worker.
+    The first worker to take an exclusive lock on SCHEDULER_LOCK_PATH wins.
+    """
+    global _scheduler_lock_file
+    if APPLICATION_WORKERS <= 1:
+        return True
+
+    import fcntl
+
+    lock_file = open(SCHEDULER_LOCK_PATH, "w")
+    try:
+        fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BlockingIOError:
+        lock_file.close()
+        return False
+
+    _scheduler_lock_file = lock_file
+    return True
+
+
 def start_scheduler():
-    if not scheduler.running:
+    """
+    Called from the app lifespan. The running loop is captured so scheduled
+    interviews run on it and share the app's VAPI connection pool and session
+    store, while the scheduler itself polls the job store from its thread.
+    """
+    global _app_loop
+    if scheduler.running:
+        return
+
+    _app_loop = asyncio.get_running_loop()
+
+    if acquire_scheduler_lock():
+        scheduler.add_listener(record_job_lag, EVENT_JOB_SUBMITTED | EVENT_JOB_MISSED)
         scheduler.start()
+        if APPLICATION_WORKERS > 1:
+            # jobs added by other workers go straight to the job store, poll it
+            # so they are picked up without waiting for an unrelated wakeup
+            scheduler.add_job(
+                func=poll_job_store,
+                trigger="interval",
+                seconds=30,
+                id="poll_job_store",
+                jobstore="local",
+                replace_existing=True,
+            )
+        logger.info("[Scheduler] Started, this worker runs scheduled interviews")
+    else:
+        # still needed so add_job/remove_job write through to the shared store
+        scheduler.start(paused=True)
+        logger.info("[Scheduler] Started paused, another worker runs scheduled jobs")
 
 
-import asyncio
+def shutdown_scheduler():
+    if scheduler.running:
+        # jobs in flight are tasks on the app loop and are cancelled with it
+        scheduler.shutdown(wait=False)
 
 
-def trigger_interview(candidate_id: str):
-    try:
-        coro = run_interview(candidate_id)
-        try:
-            loop = asyncio.get_running_loop()
-        except RuntimeError:
-            loop = None
+def poll_job_store():
+    """No-op, running it wakes the scheduler to re-read the job store."""
+
+
+def run_on_app_loop(coro):
+    """
+    Run a job's coroutine on the app loop. The scheduler thread does not wait
+    for it, an interview queued for a call slot must not hold a thread.
+    """
+    asyncio.run_coroutine_threadsafe(coro, _app_loop)
+
+
+def job_kind(job_id: str) -> str:
+    if job_id.endswith("_prewarm"):
+        return "prewarm"
+    if job_id == "poll_job_store":
+        return job_id
+    return "interview"
+
+
+def record_job_lag(event):
+    kind = job_kind(event.job_id)
+    if event.code == EVENT_JOB_MISSED:
+        SCHEDULER_JOBS_MISSED.inc(job=kind)
+        return
+
+    now = datetime.now(timezone.utc)
+    for run_time in event.scheduled_run_times:
+        lag = (now - run_time).total_seconds()
+        SCHEDULER_JOB_LAG_SECONDS.observe(max(lag, 0.0), job=kind)
+
+
+# resume pre-warms due together are summarized a few at a time
+_prewarm_slots = asyncio.Semaphore(RESUME_PREWARM_MAX_CONCURRENCY)
+
+
+def trigger_interview(candidate_id: str, scheduled_time: Optional[str] = None):
+    run_on_app_loop(start_scheduled_interview(candidate_id, scheduled_time))
+
+
+def trigger_prewarm(candidate_id: str):
+    run_on_app_loop(prewarm_scheduled_interview(candidate_id))
+
 
-        if loop and loop.is_running():
-            asyncio.create_task(coro)
-        else:
-            asyncio.run(coro)
+async def start_scheduled_interview(
+    candidate_id: str, scheduled_time: Optional[str] = None
+):
+    try:
+        async with call_capacity.slot(candidate_id):
+            if scheduled_time:
+                lag = datetime.now(timezone.utc) - datetime.fromisoformat(
+                    scheduled_time
+                )
+                INTERVIEW_START_LAG_SECONDS.observe(max(lag.total_seconds(), 0.0))
+            await run_interview(candidate_id)
 
     except Exception:
         logger.exception(f"[Trigger Interview Error] Failed for {candidate_id}")
 
 
+async def prewarm_scheduled_interview(candidate_id: str):
+    try:
+        async with _prewarm_slots:
+            await prewarm_interview(candidate_id)
+    except Exception:
+        # run_interview summarizes the resume itself when pre-warming failed
+        logger.exception(f"[Trigger Prewarm Error] Failed for {candidate_id}")
+
+
+def slot_occupancy(run_time: datetime, exclude_job_id: str) -> int:
+    """
+    Scheduled interviews whose call would overlap one starting at `run_time`,
+    counted with a range query on the job store's indexed next_run_time.
+    """
+    start = datetime_to_utc_timestamp(run_time)
+    window = INTERVIEW_SLOT_MINUTES * 60
+    jobs = interview_job_store.jobs_t
+    query = (
+        select(func.count())
+        .select_from(jobs)
+        .where(
+            jobs.c.next_run_time > start - window,
+            jobs.c.next_run_time < start + window,
+            jobs.c.id != exclude_job_id,
+            not_(jobs.c.id.endswith("_prewarm", autoescape=True)),
+        )
+    )
+    with interview_job_store.engine.connect() as conn:
+        return conn.execute(query).scalar_one()
+
+
+def admit_booking(job_id: str, scheduled_time: datetime) -> tuple[datetime, bool]:
+    """
+    Check the slot against SLOT_CAPACITY. A booking over capacity is still
+    accepted but flagged, and its dial is shifted by a random jitter so it
+    lands behind the slot's on-time calls instead of in the same burst.
+    """
+    occupancy = slot_occupancy(scheduled_time, job_id)
+    if occupancy < SLOT_CAPACITY:
+        INTERVIEW_BOOKINGS.inc(outcome="accepted")
+        return scheduled_time, False
+
+    INTERVIEW_BOOKINGS.inc(outcome="over_capacity")
+    run_time = scheduled_time + timedelta(
+        seconds=random.uniform(0, BOOKING_OVERFLOW_JITTER_SECONDS)
+    )
+    logger.warning(
+        f"[Scheduler] Slot {scheduled_time} over capacity ({occupancy}/{SLOT_CAPACITY} interviews), {job_id} starts at {run_time}"
+    )
+    return run_time, True
+
+
 def schedule_interview(candidate_id: str, event: str, scheduled_time: datetime):
     job_id = f"{event}_{candidate_id}"
+    if isinstance(scheduled_time, str):
+        # the Calendly handler returns the slot as an ISO string
+        scheduled_time = datetime.fromisoformat(scheduled_time)
+
+    run_time, over_capacity = admit_booking(job_id, scheduled_time)
+
+    prewarm_time = scheduled_time - timedelta(minutes=RESUME_PREWARM_MINUTES)
+    # booked too close to the slot, run_interview summarizes inline instead
+    if RESUME_PREWARM_MINUTES > 0 and prewarm_time > datetime.now(timezone.utc):
+        scheduler.add_job(
+            func=trigger_prewarm,
+            trigger="date",
+            run_date=prewarm_time,
+            id=f"{job_id}_prewarm",
+            args=[candidate_id],
+            replace_existing=True,
+        )
+        logger.info(
+            f"[Scheduler] Resume pre-warm {event} scheduled for candidate {candidate_id} at {prewarm_time}"
+        )
+
     scheduler.add_job(
         func=trigger_interview,
         trigger="date",
-        run_date=scheduled_time,
+        run_date=run_time,
         id=job_id,
         args=[candidate_id],
+        # start lag is measured against the booked slot, jitter included
+        kwargs={"scheduled_time": scheduled_time.isoformat()},
         replace_existing=True,
     )
     logger.info(
-        f"[Scheduler] Interview {event} scheduled for candidate {candidate_id} at {scheduled_time}"
+        f"[Scheduler] Interview {event} scheduled for candidate {candidate_id} at {run_time}"
     )
+    return {"run_time": run_time.isoformat(), "over_capacity": over_capacity}
 
 
 def cancel_interview(candidate_id: str, event: str):
     job_id = f"{event}_{candidate_id}"
-    try:
-        scheduler.remove_job(job_id=job_id)
+    removed, prewarm_removed = remove_interview_jobs(job_id)
+    if removed:
         logger.info(
             f"[Scheduler] Removed interview {event} for candidate {candidate_id} due to cancellation."
         )
-    except JobLookupError:
+    else:
         logger.warning(
             f"[Scheduler] No interview {event} found for candidate {candidate_id} — may have already been removed."
         )
+    if prewarm_removed:
+        logger.info(
+            f"[Scheduler] Removed resume pre-warm {event} for candidate {candidate_id}."
+        )
+
+
+def remove_interview_jobs(job_id: str) -> tuple[bool, bool]:
+    """
+    Remove an interview job together with its resume pre-warm job.
+
+    Returns whether each of the two jobs was found.
+    """
+    return _remove_job(job_id), _remove_job(f"{job_id}_prewarm")
+
+
+def _remove_job(job_id: str) -> bool:
+    try:
+        scheduler.remove_job(job_id=job_id)
+        return True
+    except JobLookupError:
+        # already ran, or was never scheduled
+        return False
@@ -1,4 +1,10 @@
+import asyncio
 import logging
+import random
+import time
+from contextlib import asynccontextmanager
+from dataclasses import asdict, dataclass
+from typing import AsyncIterator, Optional
 
 import httpx
 
@@ -8,116 +14,270 @@ from config import (
     VAPI_API_KEY,
     VAPI_CALL_WEBHOOK_URL,
     VAPI_INTERVIEW_WEBHOOK_URL,
+    VAPI_MAX_CONNECTIONS,
+    VAPI_MAX_KEEPALIVE_CONNECTIONS,
+    VAPI_MAX_RETRIES,
     VAPI_PHONE_NUMBER_ID,
     VAPI_RECRUITER_ASSISTANT_ID,
+    VAPI_RETRY_BACKOFF_SECONDS,
+    VAPI_TIMEOUT_SECONDS,
 )
+from utils.metrics import VAPI_CALL_SECONDS, VAPI_RETRIES
 
 logger = logging.getLogger(__name__)
 
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
 
-async def start_vapi_call(
-    candidate_id: str,
-    phone_number: str,
-    greeting: str,
-) -> dict:
+
+@dataclass
+class EndpointLatency:
+    count: int = 0
+    errors: int = 0
+    retries: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+
+    def record(self, elapsed: float, failed: bool):
+        self.count += 1
+        self.total_seconds += elapsed
+        self.max_seconds = max(self.max_seconds, elapsed)
+        if failed:
+            self.errors += 1
+
+
+class VapiClient:
     """
-    Asynchronously initiates a voice call to the given phone number using a VAPI assistant.
+    Long-lived VAPI API client sharing one keep-alive connection pool.
+
+    `start()` and `aclose()` are driven by the FastAPI app lifespan. Calls made
+    from a different event loop (e.g. a standalone script running
+    `asyncio.run`) cannot use the pool and fall back to a one-off client.
     """
-    url = f"{VAPI_API_BASE_URL}/call"
-    headers = {
-        "Authorization": f"Bearer {VAPI_API_KEY}",
-        "Content-Type": "application/json",
-    }
-    payload = {
-        "phoneNumberId": VAPI_PHONE_NUMBER_ID,
-        "customer": {"number": phone_number},
-        "assistantId": VAPI_RECRUITER_ASSISTANT_ID,
-        "assistantOverrides": {
-            "firstMessage": greeting,
-            "model": {
-                "provider": "custom-llm",
-                "model": "recruiter-agent",
-                "url": f"{APPLICATION_BASE_URL}/{VAPI_INTERVIEW_WEBHOOK_URL}",
-            },
-            "server": {
-                "timeoutSeconds": 30,
-                "url": f"{APPLICATION_BASE_URL}/{VAPI_CALL_WEBHOOK_URL}",
+
+    def __init__(
+        self,
+        base_url: str,
+        api_key: str,
+        max_connections: int,
+        max_keepalive_connections: int,
+        timeout_seconds: float,
+        max_retries: int,
+        retry_backoff_seconds: float,
+    ):
+        self.base_url = base_url
+        self.headers = {
+            "Authorization": f"Bearer {api_key}",
+            "Content-Type": "application/json",
+        }
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+        )
+        self.timeout = httpx.Timeout(timeout_seconds)
+        self.max_retries = max_retries
+        self.retry_backoff_seconds = retry_backoff_seconds
+        self.latency: dict[str, EndpointLatency] = {}
+        self._client: Optional[httpx.AsyncClient] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    async def start(self):
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                headers=self.headers, limits=self.limits, timeout=self.timeout
+            )
+            self._loop = asyncio.get_running_loop()
+
+    async def aclose(self):
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            self._loop = None
+
+    @asynccontextmanager
+    async def _http(self) -> AsyncIterator[httpx.AsyncClient]:
+        if self._client is not None and self._loop is asyncio.get_running_loop():
+            yield self._client
+            return
+
+        async with httpx.AsyncClient(
+            headers=self.headers, timeout=self.timeout
+        ) as client:
+            yield client
+
+    async def _request(
+        self,
+        endpoint: str,
+        method: str,
+        url: str,
+        json: Optional[dict] = None,
+        idempotent: bool = False,
+    ) -> httpx.Response:
+        """
+        Send a request and record its latency under `endpoint`. Idempotent
+        requests are retried on transport errors and 429/5xx responses with
+        jittered exponential backoff.
+        """
+        stats = self.latency.setdefault(endpoint, EndpointLatency())
+        attempts = self.max_retries + 1 if idempotent else 1
+
+        async with self._http() as client:
+            for attempt in range(attempts):
+                started = time.perf_counter()
+                try:
+                    response = await client.request(method, url, json=json)
+                except httpx.TransportError:
+                    elapsed = time.perf_counter() - started
+                    stats.record(elapsed, failed=True)
+                    VAPI_CALL_SECONDS.observe(
+                        elapsed, endpoint=endpoint, outcome="transport_error"
+                    )
+                    if attempt == attempts - 1:
+                        raise
+                else:
+                    elapsed = time.perf_counter() - started
+                    failed = response.status_code not in (200, 201)
+                    stats.record(elapsed, failed=failed)
+                    VAPI_CALL_SECONDS.observe(
+                        elapsed, endpoint=endpoint, outcome=str(response.status_code)
+                    )
+                    if (
+                        response.status_code not in RETRYABLE_STATUS_CODES
+                        or attempt == attempts - 1
+                    ):
+                        return response
+
+                stats.retries += 1
+                VAPI_RETRIES.inc(endpoint=endpoint)
+                backoff = random.uniform(0, self.retry_backoff_seconds * 2**attempt)
+                logger.warning(
+                    f"[VAPI] {endpoint} attempt {attempt + 1} failed, retrying in {backoff:.2f}s"
+                )
+                await asyncio.sleep(backoff)
+
+    def stats(self) -> dict:
+        return {
+            endpoint: {
+                **asdict(latency),
+                "avg_seconds": (
+                    latency.total_seconds / latency.count if latency.count else 0.0
+                ),
+            }
+            for endpoint, latency in self.latency.items()
+        }
+
+    async def start_call(
+        self,
+        candidate_id: str,
+        phone_number: str,
+        greeting: str,
+    ) -> dict:
+        """
+        Asynchronously initiates a voice call to the given phone number using a VAPI assistant.
+        Not retried, a repeated request would dial the candidate twice.
+        """
+        url = f"{self.base_url}/call"
+        payload = {
+            "phoneNumberId": VAPI_PHONE_NUMBER_ID,
+            "customer": {"number": phone_number},
+            "assistantId": VAPI_RECRUITER_ASSISTANT_ID,
+            "assistantOverrides": {
+                "firstMessage": greeting,
+                "model": {
+                    "provider": "custom-llm",
+                    "model": "recruiter-agent",
+                    "url": f"{APPLICATION_BASE_URL}/{VAPI_INTERVIEW_WEBHOOK_URL}",
+                },
+                "server": {
+                    "timeoutSeconds": 30,
+                    "url": f"{APPLICATION_BASE_URL}/{VAPI_CALL_WEBHOOK_URL}",
+                },
+                "metadata": {"candidate_id": candidate_id},
             },
-            "metadata": {"candidate_id": candidate_id},
-        },
-    }
+        }
 
-    logger.info(
-        f"Starting VAPI call to {phone_number} with assistant {VAPI_RECRUITER_ASSISTANT_ID}"
-    )
+        logger.info(
+            f"Starting VAPI call to {phone_number} with assistant {VAPI_RECRUITER_ASSISTANT_ID}"
+        )
 
-    async with httpx.AsyncClient() as client:
-        response = await client.post(url, headers=headers, json=payload)
+        response = await self._request("start_call", "POST", url, json=payload)
 
-    if response.status_code not in (200, 201):
-        logger.error(f"Failed to start VAPI call: {response.text}")
-        response.raise_for_status()
-    else:
-        logger.info(f"VAPI call started successfully: {response.json().get('id')}")
+        if response.status_code not in (200, 201):
+            logger.error(f"Failed to start VAPI call: {response.text}")
+            response.raise_for_status()
+        else:
+            logger.info(f"VAPI call started successfully: {response.json().get('id')}")
 
-    return response.json()
+        return response.json()
 
+    async def end_call(self, call_id: str, control_url: str):
+        """
+        Ends an active VAPI call by sending the “end-call” control message.
+        - call_id: the UUID/SID for the call
+        - control_url: the call's monitor.controlUrl
+        """
+        url = f"{control_url}/{call_id}/control"
+        payload = {"type": "end-call"}
 
-async def end_vapi_call(call_id: str, control_url: str):
-    """
-    Ends an active VAPI call by sending the “end-call” control message.
-    - call_id: the UUID/SID for the call
-    - api_key: if your VAPI endpoint requires auth, pass it here
-    """
+        logger.info(
+            f"Ending VAPI call {call_id} with assistant {VAPI_RECRUITER_ASSISTANT_ID}"
+        )
 
-    url = f"{control_url}/{call_id}/control"
-    headers = {
-        "Authorization": f"Bearer {VAPI_API_KEY}",
-        "Content-Type": "application/json",
-    }
+        # ending an already ended call is harmless, so this is safe to retry
+        response = await self._request(
+            "end_call", "POST", url, json=payload, idempotent=True
+        )
 
-    payload = {"type": "end-call"}
+        if response.status_code not in (200, 201):
+            logger.error(f"Failed to end VAPI call: {response.text}")
+            response.raise_for_status()
+        else:
+            logger.info(f"VAPI ended successfully: {response.json().get('id')}")
 
-    logger.info(
-        f"Ending VAPI call {call_id} with assistant {VAPI_RECRUITER_ASSISTANT_ID}"
-    )
+    async def get_call(self, call_id: str) -> dict:
+        """
+        Fetch the VAPI call by its ID.
 
-    async with httpx.AsyncClient() as client:
-        response = await client.post(url, headers=headers, json=payload)
+        Args:
+            call_id: the VAPI call UUID
 
-    if response.status_code not in (200, 201):
-        logger.error(f"Failed to end VAPI call: {response.text}")
-        response.raise_for_status()
-    else:
-        logger.info(f"VAPI ended successfully: {response.json().get('id')}")
+        Returns:
+            The call JSON, including monitor.controlUrl and assistantOverrides.
+        """
+        url = f"{self.base_url}/call/{call_id}"
 
+        response = await self._request("get_call", "GET", url, idempotent=True)
 
-async def get_vapi_call(call_id: str) -> str:
-    """
-    Fetch the VAPI call by its ID, extract the controlUrl, and
-    initialize a SessionState stored in session_store.
+        if response.status_code not in (200, 201):
+            logger.error(f"Failed to fetch VAPI call: {response.text}")
+            response.raise_for_status()
+        else:
+            logger.info(f"VAPI call fetched successfully: {response.json().get('id')}")
 
-    Args:
-        call_id: the VAPI call UUID
-        api_key: your VAPI Bearer token
+        return response.json()
 
-    Returns:
-        The newly created SessionState for this call_id.
-    """
-    # 1. Fetch call metadata from VAPI
-    url = f"{VAPI_API_BASE_URL}/call/{call_id}"
-    headers = {
-        "Authorization": f"Bearer {VAPI_API_KEY}",
-        "Content-Type": "application/json",
-    }
-
-    async with httpx.AsyncClient() as client:
-        response = await client.get(url, headers=headers)
-
-    if response.status_code not in (200, 201):
-        logger.error(f"Failed to fetch VAPI call: {response.text}")
-        response.raise_for_status()
-    else:
-        logger.info(f"VAPI call fetched successfully: {response.json().get('id')}")
-
-    return response.json()
+
+vapi_client = VapiClient(
+    base_url=VAPI_API_BASE_URL,
+    api_key=VAPI_API_KEY,
+    max_connections=VAPI_MAX_CONNECTIONS,
+    max_keepalive_connections=VAPI_MAX_KEEPALIVE_CONNECTIONS,
+    timeout_seconds=VAPI_TIMEOUT_SECONDS,
+    max_retries=VAPI_MAX_RETRIES,
+    retry_backoff_seconds=VAPI_RETRY_BACKOFF_SECONDS,
+)
+
+
+async def start_vapi_call(
+    candidate_id: str,
+    phone_number: str,
+    greeting: str,
+) -> dict:
+    return await vapi_client.start_call(candidate_id, phone_number, greeting)
+
+
+async def end_vapi_call(call_id: str, control_url: str):
+    await vapi_client.end_call(call_id=call_id, control_url=control_url)
+
+
+async def get_vapi_call(call_id: str) -> dict:
+    return await vapi_client.get_call(call_id)
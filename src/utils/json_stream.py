@@ -0,0 +1,101 @@
+import json
+import re
+
+_ESCAPES = {
+    '"': '"',
+    "\\": "\\",
+    "/": "/",
+    "b": "\b",
+    "f": "\f",
+    "n": "\n",
+    "r": "\r",
+    "t": "\t",
+}
+
+
+class JsonStringFieldStream:
+    """
+    Incrementally extracts the value of one top-level string field from a JSON
+    object that arrives in chunks (e.g. streamed LLM output).
+
+    Feed raw chunks with `feed()`; it returns the newly decoded characters of
+    the field's value (possibly ""). `done` flips to True once the closing quote
+    has been seen. Escape sequences split across chunk boundaries are held back
+    until complete.
+    """
+
+    def __init__(self, field_name: str):
+        self._key_pattern = re.compile(rf'"{re.escape(field_name)}"\s*:\s*"')
+        self._buffer = ""
+        self._pos = -1  # index of the next unread value char; -1 until key is seen
+        self.done = False
+
+    def feed(self, chunk: str) -> str:
+        self._buffer += chunk
+        if self.done:
+            return ""
+
+        if self._pos < 0:
+            match = self._key_pattern.search(self._buffer)
+            if not match:
+                return ""
+            self._pos = match.end()
+
+        out = []
+        buf = self._buffer
+        pos = self._pos
+        while pos < len(buf):
+            ch = buf[pos]
+            if ch == '"':
+                self.done = True
+                pos += 1
+                break
+            if ch != "\\":
+                out.append(ch)
+                pos += 1
+                continue
+
+            # escape sequence: wait until it is complete
+            if pos + 1 >= len(buf):
+                break
+            esc = buf[pos + 1]
+            if esc == "u":
+                if pos + 6 > len(buf):
+                    break
+                try:
+                    out.append(json.loads(f'"{buf[pos:pos + 6]}"'))
+                except json.JSONDecodeError:
+                    pass
+                pos += 6
+            else:
+                out.append(_ESCAPES.get(esc, esc))
+                pos += 2
+
+        self._pos = pos
+        return "".join(out)
+
+    @property
+    def raw(self) -> str:
+        """Everything fed so far."""
+        return self._buffer
+
+
+def sanitize_llm_json(raw: str) -> str:
+    """
+    1. Strip Markdown code fences (```json …```)
+    2. Extract the first {...} block
+    3. Remove any trailing commas before ] or }
+    """
+    # 1. Remove markdown fences
+    raw = re.sub(r"```(?:json)?\s*", "", raw)
+    raw = raw.replace("```", "")
+
+    # 2. Extract the first {...} substring
+    match = re.search(r"\{.*\}", raw, flags=re.DOTALL)
+    if match:
+        raw = match.group(0)
+
+    # 3. Remove trailing commas:  "item", ]  →  "item" ]
+    raw = re.sub(r",\s*(?=[}\]])", "", raw)
+
+    return raw
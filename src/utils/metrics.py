@@ -0,0 +1,263 @@
+"""
+In-process metrics registry rendered in the Prometheus text exposition format
+at /interview/metrics.
+
+Metrics are per process; with several workers each one reports its own values.
+"""
+
+import bisect
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional, Sequence, Tuple
+
+# seconds, tuned for turn latencies from a few ms to a slow LLM call
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+# seconds, scheduler jobs run from sub-second late to minutes late
+LAG_BUCKETS = (0.1, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 600)
+
+LabelValues = Tuple[str, ...]
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(f'{name}="{_escape(value)}"' for name, value in zip(names, values))
+    return "{" + pairs + "}"
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_float(value: float) -> str:
+    return "+Inf" if value == float("inf") else repr(float(value))
+
+
+class Metric:
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str]):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _label_values(self, labels: Dict[str, str]) -> LabelValues:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(
+                f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}"
+            )
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def render(self) -> str:
+        header = (
+            f"# HELP {self.name} {self.documentation}\n# TYPE {self.name} {self.kind}\n"
+        )
+        return header + "".join(self._samples())
+
+    def _samples(self) -> Iterator[str]:
+        raise NotImplementedError
+
+
+class Counter(Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1, **labels: str):
+        key = self._label_values(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def _samples(self) -> Iterator[str]:
+        with self._lock:
+            values = dict(self._values)
+        for key, value in sorted(values.items()):
+            labels = _format_labels(self.labelnames, key)
+            yield f"{self.name}_total{labels} {_format_float(value)}\n"
+
+
+class Histogram(Metric):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets)) + (float("inf"),)
+        # label values -> (per-bucket counts, sum, count)
+        self._values: Dict[LabelValues, Tuple[list, float, int]] = {}
+
+    def observe(self, value: float, **labels: str):
+        key = self._label_values(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            counts, total, count = self._values.get(
+                key, ([0] * len(self.buckets), 0.0, 0)
+            )
+            counts[index] += 1
+            self._values[key] = (counts, total + value, count + 1)
+
+    @contextmanager
+    def time(self, **labels: str):
+        """Observe the duration of the block, also when it raises."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, **labels)
+
+    def _samples(self) -> Iterator[str]:
+        with self._lock:
+            values = {k: (list(c), s, n) for k, (c, s, n) in self._values.items()}
+        names = (*self.labelnames, "le")
+        for key, (counts, total, count) in sorted(values.items()):
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, counts):
+                cumulative += bucket_count
+                labels = _format_labels(names, (*key, _format_float(bound)))
+                yield f"{self.name}_bucket{labels} {cumulative}\n"
+            labels = _format_labels(self.labelnames, key)
+            yield f"{self.name}_sum{labels} {_format_float(total)}\n"
+            yield f"{self.name}_count{labels} {count}\n"
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self._metrics: Dict[str, Metric] = {}
+
+    def _register(self, metric: Metric) -> Metric:
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} is already registered")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(
+        self, name: str, documentation: str, labelnames: Sequence[str] = ()
+    ) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Optional[Sequence[float]] = None,
+    ) -> Histogram:
+        return self._register(
+            Histogram(name, documentation, labelnames, buckets or DEFAULT_BUCKETS)
+        )
+
+    def render(self) -> str:
+        return "".join(metric.render() for metric in self._metrics.values())
+
+
+registry = MetricsRegistry()
+
+HTTP_REQUEST_SECONDS = registry.histogram(
+    "recruiter_http_request_duration_seconds",
+    "HTTP request latency by route.",
+    ("method", "route", "status"),
+)
+CHAT_STAGE_SECONDS = registry.histogram(
+    "recruiter_chat_completion_stage_seconds",
+    "Latency of each stage of a /chat/completions turn.",
+    ("stage",),
+)
+SCRIPTED_TURNS = registry.counter(
+    "recruiter_scripted_turns",
+    "Scripted opening turns by phase and outcome (scripted, handoff).",
+    ("phase", "outcome"),
+)
+AGENT_RUN_SECONDS = registry.histogram(
+    "recruiter_agent_run_duration_seconds",
+    "Agent run latency by agent and model.",
+    ("agent", "model"),
+)
+AGENT_RUNS = registry.counter(
+    "recruiter_agent_runs",
+    "Agent runs by agent, model and outcome.",
+    ("agent", "model", "outcome"),
+)
+REPOSITORY_CALL_SECONDS = registry.histogram(
+    "recruiter_repository_call_duration_seconds",
+    "Candidate repository (Supabase) call latency by operation.",
+    ("operation",),
+)
+VAPI_CALL_SECONDS = registry.histogram(
+    "recruiter_vapi_call_duration_seconds",
+    "VAPI API request latency by endpoint and outcome, one sample per attempt.",
+    ("endpoint", "outcome"),
+)
+VAPI_RETRIES = registry.counter(
+    "recruiter_vapi_retries",
+    "Retried VAPI API requests by endpoint.",
+    ("endpoint",),
+)
+RESUME_STAGE_SECONDS = registry.histogram(
+    "recruiter_resume_stage_seconds",
+    "Resume download and text extraction latency.",
+    ("stage",),
+)
+POST_INTERVIEW_STAGE_SECONDS = registry.histogram(
+    "recruiter_post_interview_stage_seconds",
+    "Latency of each post-interview task stage.",
+    ("stage",),
+)
+SCHEDULER_JOB_LAG_SECONDS = registry.histogram(
+    "recruiter_scheduler_job_lag_seconds",
+    "Delay between a job's scheduled run time and its submission to the executor.",
+    ("job",),
+    buckets=LAG_BUCKETS,
+)
+SCHEDULER_JOBS_MISSED = registry.counter(
+    "recruiter_scheduler_jobs_missed",
+    "Scheduled jobs skipped for running later than the misfire grace time.",
+    ("job",),
+)
+INTERVIEW_CAPACITY_WAIT_SECONDS = registry.histogram(
+    "recruiter_interview_capacity_wait_seconds",
+    "Time a due interview waited for a free call slot and the dial stagger.",
+    buckets=LAG_BUCKETS,
+)
+INTERVIEW_START_LAG_SECONDS = registry.histogram(
+    "recruiter_interview_start_lag_seconds",
+    "Delay between an interview's booked slot and its outbound dial.",
+    buckets=LAG_BUCKETS,
+)
+INTERVIEW_BOOKINGS = registry.counter(
+    "recruiter_interview_bookings",
+    "Scheduled interviews by slot admission outcome (accepted, over_capacity).",
+    ("outcome",),
+)
+
+JOB_QUEUE_JOBS = registry.counter(
+    "recruiter_job_queue_jobs",
+    "Processed queue jobs by queue and outcome (done, retry, failed).",
+    ("queue", "outcome"),
+)
+JOB_QUEUE_WAIT_SECONDS = registry.histogram(
+    "recruiter_job_queue_wait_seconds",
+    "Delay between a job becoming runnable and a worker claiming it.",
+    ("queue",),
+    buckets=LAG_BUCKETS,
+)
+
+
+@contextmanager
+def track_agent_run(agent: str, model: str):
+    """Time an agent run and count it by outcome."""
+    outcome = "error"
+    try:
+        with AGENT_RUN_SECONDS.time(agent=agent, model=model):
+            yield
+        outcome = "ok"
+    finally:
+        AGENT_RUNS.inc(agent=agent, model=model, outcome=outcome)
@@ -0,0 +1,149 @@
+"""
+Pronunciation fixes applied to interviewer replies before they reach TTS.
+
+Terms come from `tts_lexicon.json` (bundled) and, optionally, the file at
+TTS_LEXICON_PATH, whose entries are added to or override the bundled ones.
+All terms are compiled once into a single case-insensitive regex, built as a
+trie so matching cost depends on term length rather than lexicon size.
+"""
+
+import json
+import logging
+import os
+import re
+from typing import Dict, Optional
+
+from config import TTS_LEXICON_PATH
+
+logger = logging.getLogger(__name__)
+
+BUNDLED_LEXICON_PATH = os.path.join(os.path.dirname(__file__), "tts_lexicon.json")
+
+
+def load_lexicon() -> Dict[str, str]:
+    with open(BUNDLED_LEXICON_PATH, encoding="utf-8") as f:
+        terms = dict(json.load(f)["terms"])
+
+    if TTS_LEXICON_PATH:
+        with open(TTS_LEXICON_PATH, encoding="utf-8") as f:
+            extra = json.load(f)
+        terms.update(extra["terms"])
+        logger.info(
+            f"Loaded {len(extra['terms'])} TTS lexicon terms from {TTS_LEXICON_PATH}"
+        )
+
+    return terms
+
+
+def _trie_pattern(node: dict) -> str:
+    branches = [
+        re.escape(char) + _trie_pattern(child)
+        for char, child in sorted(node.items())
+        if char
+    ]
+    if not branches:
+        return ""
+    pattern = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+    # a term ends here: the longer terms are tried first, greedy
+    return f"(?:{pattern})?" if "" in node else pattern
+
+
+def compile_lexicon(terms: Dict[str, str]) -> Optional[re.Pattern]:
+    if not terms:
+        return None
+
+    trie: dict = {}
+    for term in terms:
+        node = trie
+        for char in term:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    # a term only matches as a whole token, "SQL" but not "SQLite"
+    return re.compile(rf"(?<!\w){_trie_pattern(trie)}(?!\w)", re.IGNORECASE)
+
+
+class TtsNormalizer:
+    def __init__(self, lexicon: Dict[str, str]):
+        self.replacements = {
+            term.strip().lower(): spoken for term, spoken in lexicon.items()
+        }
+        self.pattern = compile_lexicon(self.replacements)
+        # a term spanning several words can only be matched once all are in
+        self.max_words = max((len(t.split()) for t in self.replacements), default=1)
+
+    def replace(self, match: re.Match) -> str:
+        return self.replacements[match.group(0).lower()]
+
+    def normalize(self, text: str) -> str:
+        if self.pattern is None:
+            return text
+        return self.pattern.sub(self.replace, text)
+
+    def stream(self) -> "TtsStream":
+        return TtsStream(self)
+
+
+class TtsStream:
+    """
+    Incrementally normalizes text that arrives in chunks (e.g. a streamed
+    reply).
+
+    `feed()` returns the newly complete text and its normalized form, holding
+    back the trailing words a lexicon term could still extend into, so a term
+    is never split across two chunks. `flush()` returns the rest at the end.
+    """
+
+    def __init__(self, normalizer: TtsNormalizer):
+        self._normalizer = normalizer
+        self._buffer = ""
+
+    def _held_back_from(self) -> int:
+        buf = self._buffer
+        i = len(buf)
+        for word in range(self._normalizer.max_words):
+            if word:
+                while i > 0 and buf[i - 1].isspace():
+                    i -= 1
+            while i > 0 and not buf[i - 1].isspace():
+                i -= 1
+            if i == 0:
+                break
+        return i
+
+    def feed(self, chunk: str) -> tuple[str, str]:
+        self._buffer += chunk
+        cut = self._held_back_from()
+        if cut == 0:
+            return "", ""
+
+        buf = self._buffer
+        spoken = []
+        pos = 0
+        if self._normalizer.pattern is not None:
+            for match in self._normalizer.pattern.finditer(buf):
+                if match.start() >= cut:
+                    break
+                if match.end() > cut:
+                    # a term reaching into the held back words waits for them
+                    cut = match.start()
+                    break
+                spoken.append(buf[pos : match.start()])
+                spoken.append(self._normalizer.replace(match))
+                pos = match.end()
+        spoken.append(buf[pos:cut])
+
+        self._buffer = buf[cut:]
+        return buf[:cut], "".join(spoken)
+
+    def flush(self) -> tuple[str, str]:
+        text, self._buffer = self._buffer, ""
+        return text, self._normalizer.normalize(text)
+
+
+tts_normalizer = TtsNormalizer(load_lexicon())
+
+
+def normalize_for_tts(text: str) -> str:
+    """Replace tokens that TTS mispronounces, e.g. C# -> CSharp."""
+    return tts_normalizer.normalize(text)
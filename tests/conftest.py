@@ -0,0 +1,22 @@
+import os
+
+from dotenv import load_dotenv
+
+# values from .env win; the defaults only let the offline tests import the app
+# modules without a configured environment, no LLM or Supabase call is made
+load_dotenv()
+
+OFFLINE_ENV = {
+    "APPLICATION_PORT": "8000",
+    "RESUME_LLM_MODEL": "test",
+    "INTERVIEW_LLM_MODEL": "test",
+    "EVALUATION_LLM_MODEL": "test",
+    "OPENAI_API_KEY": "test",
+    "SUPABASE_URL": "https://example.supabase.co",
+    "SUPABASE_KEY": "eyJhbGciOiJIUzI1NiJ9.e30.test",
+    "SUPABASE_DB_URL": "sqlite://",
+    "APSCHEDULER_DB_NAME": "apscheduler_jobs",
+}
+
+for name, value in OFFLINE_ENV.items():
+    os.environ.setdefault(name, value)
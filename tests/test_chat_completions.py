@@ -0,0 +1,190 @@
+import json
+from datetime import datetime, timezone
+
+import httpx
+import pytest
+from fastapi import BackgroundTasks, FastAPI
+from pydantic_ai.messages import ModelResponse, TextPart
+from pydantic_ai.models.function import FunctionModel
+from pydantic_ai.usage import Usage
+
+from agents.interview_agent import interview_agent
+from api import interview_routes
+from db.job_queue import JobQueue
+from db.session_store import session_store
+from models.agent_dependencies import AgentDependencies
+from models.candidate import Candidate, CandidateProfile
+from models.session_state import SessionState
+from models.vapi_request import VAPIRequest
+
+ENVELOPE = json.dumps(
+    {
+        "agent_response": "Thanks. Tell me about your last project.",
+        "turn_outcome": "NORMAL",
+        "turn_outcome_reasoning": "ok",
+    }
+)
+
+app = FastAPI()
+app.include_router(interview_routes.router, prefix="/interview")
+
+
+def make_session() -> SessionState:
+    candidate = Candidate(
+        profile=CandidateProfile(
+            candidate_id="c1", name="Jane Doe", email="jane@example.com", phone="1"
+        )
+    )
+    return SessionState(
+        agent=interview_agent,
+        agent_dependencies=AgentDependencies(candidate=candidate),
+        resume_agent_usage=Usage(),
+        interview_agent_usage=Usage(),
+        evaluation_agent_usage=Usage(),
+        message_history=[],
+        start_time=datetime.now(timezone.utc),
+        control_url="https://example.com/control",
+    )
+
+
+def chat_request(call_id: str) -> dict:
+    return {
+        "model": "test",
+        "call": {"id": call_id, "type": "outboundPhoneCall"},
+        "messages": [{"role": "user", "content": "I worked on payments."}],
+        "temperature": 0.2,
+        "max_tokens": 250,
+        "metadata": {},
+        "timestamp": 1760000000000,
+        "stream": True,
+    }
+
+
+async def stream_envelope(messages, info):
+    # cut the envelope into small deltas, some of them inside words
+    for i in range(0, len(ENVELOPE), 7):
+        yield ENVELOPE[i : i + 7]
+
+
+def parse_events(body: str) -> list:
+    assert body.endswith("\n\n")
+    events = body[:-2].split("\n\n")
+    assert all(event.startswith("data: ") for event in events)
+    return [event[len("data: ") :] for event in events]
+
+
+@pytest.fixture
+def streaming(monkeypatch, tmp_path):
+    monkeypatch.setattr(interview_routes, "INTERVIEW_STREAMING_ENABLED", True)
+    monkeypatch.setattr(interview_routes, "INTERVIEW_FILLER_ENABLED", False)
+    queue = JobQueue(
+        name="test",
+        url=f"sqlite:///{tmp_path / 'jobs.db'}",
+        workers=1,
+        max_attempts=1,
+        retry_backoff_seconds=0.0,
+        lease_seconds=60,
+        poll_interval_seconds=30,
+    )
+    queue.metadata.create_all(queue.engine)
+    monkeypatch.setattr(interview_routes, "post_interview_queue", queue)
+    return queue
+
+
+@pytest.mark.asyncio
+async def test_reply_is_streamed_as_completion_chunks(streaming):
+    await session_store.put("call-stream", make_session())
+    transport = httpx.ASGITransport(app=app)
+    try:
+        with interview_agent.override(
+            model=FunctionModel(stream_function=stream_envelope)
+        ):
+            async with httpx.AsyncClient(
+                transport=transport, base_url="http://test"
+            ) as client:
+                response = await client.post(
+                    "/interview/chat/completions", json=chat_request("call-stream")
+                )
+        session = await session_store.get("call-stream")
+    finally:
+        await session_store.delete("call-stream")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+
+    *chunks, done = parse_events(response.text)
+    assert done == "[DONE]"
+    chunks = [json.loads(chunk) for chunk in chunks]
+    assert {chunk["object"] for chunk in chunks} == {"chat.completion.chunk"}
+    assert {chunk["id"] for chunk in chunks} == {"chatcmpl-call-stream"}
+    assert {chunk["created"] for chunk in chunks} == {1760000000}
+
+    *deltas, last = [chunk["choices"][0] for chunk in chunks]
+    assert last == {"delta": {}, "index": 0, "finish_reason": "stop"}
+    assert all(delta["finish_reason"] is None for delta in deltas)
+    # only the spoken field is streamed, in more than one piece
+    assert len(deltas) > 1
+    spoken = "".join(delta["delta"]["content"] for delta in deltas)
+    assert spoken == "Thanks. Tell me about your last project."
+
+    assert session.transcript == [
+        {"role": "candidate", "content": "I worked on payments."},
+        {"role": "interviewer", "content": spoken},
+    ]
+    request, reply = session.message_history
+    assert request.parts[-1].content.endswith('Candidate: "I worked on payments."')
+    assert isinstance(reply, ModelResponse)
+    assert reply.parts == [TextPart(content=ENVELOPE)]
+
+
+@pytest.mark.asyncio
+async def test_interrupted_reply_keeps_what_was_said(streaming):
+    session = make_session()
+    req = VAPIRequest(**chat_request("call-interrupted"))
+    reply = interview_routes.stream_agent_reply(
+        req, session, 'Candidate: "I worked on payments."', BackgroundTasks(), 0.0
+    )
+    try:
+        with interview_agent.override(
+            model=FunctionModel(stream_function=stream_envelope)
+        ):
+            heard = [await anext(reply), await anext(reply)]
+            # the candidate barges in, VAPI drops the response
+            await reply.aclose()
+        stored = await session_store.get("call-interrupted")
+    finally:
+        await session_store.delete("call-interrupted")
+
+    spoken = "".join(
+        json.loads(parse_events(chunk)[0])["choices"][0]["delta"]["content"]
+        for chunk in heard
+    )
+    assert spoken and spoken != "Thanks. Tell me about your last project."
+    assert stored.transcript == [{"role": "interviewer", "content": spoken.strip()}]
+
+    request, response = stored.message_history
+    assert request.parts[-1].content == 'Candidate: "I worked on payments."'
+    assert json.loads(response.parts[0].content)["agent_response"] == spoken.strip()
+
+
+@pytest.mark.asyncio
+async def test_session_ended_during_the_turn_stays_deleted(streaming):
+    session = make_session()
+    req = VAPIRequest(**chat_request("call-ended"))
+    await session_store.put("call-ended", session)
+    reply = interview_routes.stream_agent_reply(
+        req, session, 'Candidate: "I worked on payments."', BackgroundTasks(), 0.0
+    )
+    try:
+        with interview_agent.override(
+            model=FunctionModel(stream_function=stream_envelope)
+        ):
+            await anext(reply)
+            # the end-of-call webhook arrives mid-turn, see post_interview_tasks
+            await streaming.enqueue("call-ended", b"session")
+            await session_store.delete("call-ended")
+            async for _ in reply:
+                pass
+        assert await session_store.get("call-ended") is None
+    finally:
+        await session_store.delete("call-ended")
@@ -0,0 +1,133 @@
+from datetime import datetime, timezone
+
+import pytest
+from pydantic_ai.messages import (
+    ModelRequest,
+    ModelResponse,
+    SystemPromptPart,
+    TextPart,
+    UserPromptPart,
+)
+from pydantic_ai.models.function import FunctionModel
+from pydantic_ai.usage import Usage
+
+from agents.history_agent import history_agent
+from agents.interview_agent import interview_agent
+from config import HISTORY_KEEP_TURNS
+from db.session_store import session_store
+from models.agent_dependencies import AgentDependencies
+from models.candidate import Candidate, CandidateProfile
+from models.session_state import SessionState
+from services.history import (
+    build_agent_history,
+    compact_session_history,
+    needs_compaction,
+    split_turns,
+    token_budget,
+)
+
+TURNS = HISTORY_KEEP_TURNS + 4
+
+
+def make_history(turns: int) -> list:
+    messages = []
+    for i in range(turns):
+        parts = [UserPromptPart(content=f'Candidate: "answer {i}"')]
+        if i == 0:
+            parts.insert(0, SystemPromptPart(content="system prompt"))
+        messages.append(ModelRequest(parts=parts))
+        messages.append(
+            ModelResponse(
+                parts=[TextPart(content=f'{{"agent_response": "question {i}"}}')]
+            )
+        )
+    return messages
+
+
+def make_session(turns: int = TURNS) -> SessionState:
+    candidate = Candidate(
+        profile=CandidateProfile(
+            candidate_id="c1", name="Jane Doe", email="jane@example.com", phone="1"
+        )
+    )
+    return SessionState(
+        agent=interview_agent,
+        agent_dependencies=AgentDependencies(candidate=candidate),
+        resume_agent_usage=Usage(),
+        interview_agent_usage=Usage(),
+        evaluation_agent_usage=Usage(),
+        message_history=make_history(turns),
+        start_time=datetime.now(timezone.utc),
+        control_url="https://example.com/control",
+    )
+
+
+def test_split_turns_starts_a_turn_at_each_candidate_request():
+    turns = split_turns(make_history(3))
+    assert [len(turn) for turn in turns] == [2, 2, 2]
+    assert isinstance(turns[0][0].parts[0], SystemPromptPart)
+
+
+def test_history_is_sent_as_is_without_summary():
+    session = make_session()
+    assert build_agent_history(session) is session.message_history
+
+
+def test_summary_replaces_the_summarized_turns():
+    session = make_session()
+    session.history_summary = "Candidate has 5 years of Java."
+    session.summarized_turns = 3
+
+    history = build_agent_history(session)
+    turns = split_turns(history)
+
+    # the first turn, then the turns after the summarized ones
+    assert len(turns) == TURNS - 3
+    assert turns[0] == split_turns(session.message_history)[0]
+    summary, answer = turns[1][0].parts
+    assert isinstance(summary, SystemPromptPart)
+    assert "5 years of Java" in summary.content
+    assert answer.content == 'Candidate: "answer 4"'
+    # the stored history is left untouched
+    assert len(session.message_history) == 2 * TURNS
+
+
+def test_needs_compaction_only_over_budget_with_turns_to_fold():
+    session = make_session()
+    budget = token_budget("test")
+
+    session.turn_input_tokens = [budget]
+    assert not needs_compaction(session, "test")
+
+    session.turn_input_tokens = [budget + 1]
+    assert needs_compaction(session, "test")
+
+    session.summarized_turns = TURNS - 1 - HISTORY_KEEP_TURNS
+    assert not needs_compaction(session, "test")
+
+
+@pytest.mark.asyncio
+async def test_compact_session_history_folds_the_older_turns():
+    prompts = []
+
+    def summarize(messages, info):
+        prompts.append(messages[-1].parts[-1].content)
+        return ModelResponse(parts=[TextPart(content=" Summary of early turns. ")])
+
+    session = make_session()
+    await session_store.put("call-compact", session)
+    try:
+        with history_agent.override(model=FunctionModel(summarize)):
+            await compact_session_history("call-compact")
+        session = await session_store.get("call-compact")
+    finally:
+        await session_store.delete("call-compact")
+
+    folded = TURNS - 1 - HISTORY_KEEP_TURNS
+    assert session.history_summary == "Summary of early turns."
+    assert session.summarized_turns == folded
+    assert session.history_agent_usage.requests == 1
+    # only the turns after the intro and before the kept ones are summarized
+    assert "answer 1" in prompts[0] and f"answer {folded}" in prompts[0]
+    assert "answer 0" not in prompts[0]
+    assert f"answer {folded + 1}" not in prompts[0]
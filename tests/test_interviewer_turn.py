@@ -0,0 +1,51 @@
+from api.interview_routes import parse_agent_output, parse_interviewer_turn
+from models.interviewer_turn import FALLBACK_AGENT_RESPONSE, TurnOutcome
+
+
+def test_well_formed_envelope():
+    turn = parse_interviewer_turn(
+        '{"agent_response": "Tell me about your project.", '
+        '"turn_outcome": "NORMAL", "turn_outcome_reasoning": "deep dive"}'
+    )
+    assert turn.agent_response == "Tell me about your project."
+    assert turn.turn_outcome is TurnOutcome.NORMAL
+    assert turn.turn_outcome_reasoning == "deep dive"
+
+
+def test_fenced_envelope_with_trailing_comma():
+    turn = parse_interviewer_turn(
+        '```json\n{"agent_response": "Thanks, bye!", "turn_outcome": "wrap_up",}\n```'
+    )
+    assert turn.agent_response == "Thanks, bye!"
+    assert turn.turn_outcome is TurnOutcome.WRAP_UP
+
+
+def test_unknown_outcome_and_empty_response_get_defaults():
+    turn = parse_interviewer_turn('{"agent_response": " ", "turn_outcome": "DONE"}')
+    assert turn.agent_response == FALLBACK_AGENT_RESPONSE
+    assert turn.turn_outcome is TurnOutcome.NORMAL
+
+
+def test_truncated_envelope_keeps_the_reply():
+    turn = parse_interviewer_turn('{"agent_response": "Which database did you use')
+    assert turn.agent_response == "Which database did you use"
+    assert turn.turn_outcome is TurnOutcome.NORMAL
+
+
+def test_plain_text_is_spoken_as_is():
+    turn = parse_interviewer_turn("Could you say that again?")
+    assert turn.agent_response == "Could you say that again?"
+
+
+def test_broken_json_without_a_reply_falls_back():
+    turn = parse_interviewer_turn('{"turn_outcome": ')
+    assert turn.agent_response == FALLBACK_AGENT_RESPONSE
+
+
+def test_terminal_outcome_overrides_the_reply():
+    turn = parse_agent_output(
+        '{"agent_response": "ok", '
+        '"turn_outcome": "GATEKEEPER_FAILURE_ALREADY_INTERVIEWED"}'
+    )
+    assert turn.turn_outcome.ends_call
+    assert "already interviewed" in turn.agent_response
@@ -0,0 +1,91 @@
+import asyncio
+
+import pytest
+from sqlalchemy import select
+
+from db.job_queue import JobQueue
+
+
+def make_queue(tmp_path, **overrides) -> JobQueue:
+    options = {
+        "workers": 2,
+        "max_attempts": 2,
+        "retry_backoff_seconds": 0.0,
+        "lease_seconds": 60,
+        # long enough that the tests only pass if enqueue wakes a worker
+        "poll_interval_seconds": 30,
+        **overrides,
+    }
+    queue = JobQueue(name="test", url=f"sqlite:///{tmp_path / 'jobs.db'}", **options)
+    queue.metadata.create_all(queue.engine)
+    return queue
+
+
+def status_of(queue: JobQueue, job_id: str) -> str:
+    with queue.engine.connect() as conn:
+        return conn.execute(
+            select(queue.jobs.c.status).where(queue.jobs.c.job_id == job_id)
+        ).scalar_one()
+
+
+def test_job_is_claimed_once(tmp_path):
+    queue = make_queue(tmp_path)
+    assert queue._insert("call-1", b"payload")
+    assert not queue._insert("call-1", b"again")
+
+    assert queue._claim() == ("call-1", b"payload", 1)
+    assert queue._claim() is None
+    assert status_of(queue, "call-1") == "running"
+
+
+def test_failed_job_is_retried_then_given_up(tmp_path):
+    queue = make_queue(tmp_path)
+    queue._insert("call-1", b"payload")
+
+    job_id, _, attempts = queue._claim()
+    queue._fail(job_id, attempts, "boom")
+    assert status_of(queue, "call-1") == "pending"
+
+    job_id, _, attempts = queue._claim()
+    assert attempts == 2
+    queue._fail(job_id, attempts, "boom")
+    assert status_of(queue, "call-1") == "failed"
+    assert queue._claim() is None
+
+
+def test_job_of_a_dead_worker_is_reclaimed_after_its_lease(tmp_path):
+    queue = make_queue(tmp_path, lease_seconds=0)
+    queue._insert("call-1", b"payload")
+
+    assert queue._claim()[2] == 1
+    # the worker that claimed it never completed it
+    assert queue._claim() == ("call-1", b"payload", 2)
+
+
+async def wait_for_done(queue: JobQueue, count: int):
+    while (await queue.stats()).get("done", 0) < count:
+        await asyncio.sleep(0.01)
+
+
+@pytest.mark.asyncio
+async def test_workers_run_enqueued_jobs(tmp_path):
+    queue = make_queue(tmp_path, workers=3)
+    handled = []
+
+    async def handler(job_id: str, payload: bytes):
+        handled.append(job_id)
+        if handled.count("call-0") == 1 and job_id == "call-0":
+            raise RuntimeError("first attempt fails")
+
+    await queue.start(handler)
+    try:
+        for i in range(5):
+            assert await queue.enqueue(f"call-{i}", b"payload")
+        assert not await queue.enqueue("call-0", b"payload")
+        await asyncio.wait_for(wait_for_done(queue, 5), timeout=5)
+    finally:
+        await queue.aclose()
+
+    assert sorted(handled) == sorted(["call-0", *(f"call-{i}" for i in range(5))])
+    assert await queue.has_job("call-3")
+    assert not await queue.has_job("call-9")
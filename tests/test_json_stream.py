@@ -0,0 +1,49 @@
+import json
+
+from utils.json_stream import JsonStringFieldStream, sanitize_llm_json
+
+ENVELOPE = json.dumps(
+    {
+        "agent_response": 'Great, "C#" and\nSQL \\ both é fine.',
+        "turn_outcome": "NORMAL",
+    }
+)
+
+
+def feed_in_chunks(raw: str, size: int) -> tuple[str, JsonStringFieldStream]:
+    stream = JsonStringFieldStream("agent_response")
+    out = "".join(stream.feed(raw[i : i + size]) for i in range(0, len(raw), size))
+    return out, stream
+
+
+def test_field_is_decoded_whatever_the_chunking():
+    expected = json.loads(ENVELOPE)["agent_response"]
+    for size in range(1, len(ENVELOPE) + 1):
+        out, stream = feed_in_chunks(ENVELOPE, size)
+        assert out == expected, f"chunk size {size}"
+        assert stream.done
+
+
+def test_unicode_escape_split_across_chunks():
+    raw = '{"agent_response": "caf\\u00e9"}'
+    stream = JsonStringFieldStream("agent_response")
+    assert stream.feed(raw[:-6]) == "caf"
+    assert stream.feed(raw[-6:-3]) == ""
+    assert stream.feed(raw[-3:]) == "é"
+    assert stream.done
+
+
+def test_nothing_before_the_field_and_nothing_after_it():
+    stream = JsonStringFieldStream("agent_response")
+    assert stream.feed('{"turn_outcome": "NORMAL", ') == ""
+    assert stream.feed('"agent_response": "Hi"') == "Hi"
+    assert stream.feed(', "turn_outcome_reasoning": "x"}') == ""
+    assert stream.raw.endswith('"x"}')
+
+
+def test_sanitize_llm_json():
+    raw = '```json\n{"agent_response": "Hi", "tags": ["a", ],}\n```'
+    assert json.loads(sanitize_llm_json(raw)) == {
+        "agent_response": "Hi",
+        "tags": ["a"],
+    }
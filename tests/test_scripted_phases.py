@@ -0,0 +1,40 @@
+import pytest
+
+from services.scripted_phases import classify_yes_no
+
+
+@pytest.mark.parametrize(
+    "utterance",
+    ["Yes", "yeah, speaking", "Sure, that works.", "I’m ready", "no problem"],
+)
+def test_yes(utterance):
+    assert classify_yes_no(utterance) == "yes"
+
+
+@pytest.mark.parametrize(
+    "utterance", ["No", "Nope, not yet.", "I haven't", "no, never"]
+)
+def test_no(utterance):
+    assert classify_yes_no(utterance) == "no"
+
+
+@pytest.mark.parametrize(
+    "utterance",
+    [
+        "",
+        "Can you repeat that?",
+        "yes and no",
+        "maybe",
+        "I don't think so",
+        "I can't remember",
+        # refusals are not the "no" that answers a question
+        "I'm busy",
+        "I can't",
+        "won't work",
+        "not right now",
+        # longer answers are left to the agent
+        "yes I have five years of experience with Java and Spring and some AWS",
+    ],
+)
+def test_unclear_answers_are_not_classified(utterance):
+    assert classify_yes_no(utterance) is None
@@ -0,0 +1,60 @@
+from datetime import datetime, timezone
+
+import pytest
+from pydantic_ai.usage import Usage
+
+from agents.interview_agent import interview_agent
+from models.agent_dependencies import AgentDependencies
+from models.candidate import Candidate, CandidateProfile
+from models.session_state import SessionState
+
+
+def make_session(candidate: Candidate) -> SessionState:
+    return SessionState(
+        agent=interview_agent,
+        agent_dependencies=AgentDependencies(candidate=candidate),
+        resume_agent_usage=Usage(),
+        interview_agent_usage=Usage(),
+        evaluation_agent_usage=Usage(),
+        message_history=[],
+        start_time=datetime.now(timezone.utc),
+        control_url="https://example.com/control",
+    )
+
+
+def round_trip(candidate: Candidate) -> Candidate:
+    raw = make_session(candidate).to_json()
+    return SessionState.from_json(raw, interview_agent).agent_dependencies.candidate
+
+
+def make_candidate(unloaded_fields: list[str]) -> Candidate:
+    return Candidate.with_unloaded_fields(
+        unloaded_fields,
+        profile=CandidateProfile(
+            candidate_id="c1", name="Jane Doe", email="jane@example.com", phone="1"
+        ),
+        parsed_resume="resume text",
+        status="scheduled",
+    )
+
+
+def test_unloaded_fields_stay_unloaded():
+    candidate = round_trip(make_candidate(["evaluation", "interview_transcript"]))
+
+    assert not candidate.is_loaded("evaluation")
+    assert not candidate.is_loaded("interview_transcript")
+    assert candidate.status == "scheduled"
+    assert not candidate.dirty_fields
+    with pytest.raises(AttributeError):
+        candidate.evaluation
+
+
+def test_parsed_resume_is_only_carried_until_written():
+    candidate = round_trip(make_candidate([]))
+    assert not candidate.is_loaded("parsed_resume")
+
+    candidate = make_candidate([])
+    candidate.parsed_resume = "new resume text"
+    candidate = round_trip(candidate)
+    assert candidate.parsed_resume == "new resume text"
+    assert candidate.dirty_fields == {"parsed_resume"}
@@ -0,0 +1,53 @@
+import random
+
+from utils.tts import TtsNormalizer
+
+LEXICON = {
+    "C#": "C Sharp",
+    "SQL": "sequel",
+    "SQL Server": "sequel server",
+    "ASP.NET Core": "A S P dot net core",
+}
+
+REPLY = (
+    "Have you used C# with SQL Server or ASP.NET Core? SQLite is fine too, "
+    "and plain sql works, but not MySQL."
+)
+
+
+def test_normalize_replaces_whole_terms_only():
+    normalizer = TtsNormalizer(LEXICON)
+    assert normalizer.normalize(REPLY) == (
+        "Have you used C Sharp with sequel server or A S P dot net core? SQLite is "
+        "fine too, and plain sequel works, but not MySQL."
+    )
+
+
+def test_stream_matches_one_shot_for_any_chunking():
+    normalizer = TtsNormalizer(LEXICON)
+    expected = normalizer.normalize(REPLY)
+    rng = random.Random(0)
+
+    for _ in range(500):
+        cuts = sorted(rng.sample(range(1, len(REPLY)), rng.randint(1, 20)))
+        chunks = [REPLY[i:j] for i, j in zip([0, *cuts], [*cuts, len(REPLY)])]
+
+        stream = normalizer.stream()
+        raw, spoken = [], []
+        for chunk in chunks:
+            text, tts_text = stream.feed(chunk)
+            raw.append(text)
+            spoken.append(tts_text)
+        text, tts_text = stream.flush()
+        raw.append(text)
+        spoken.append(tts_text)
+
+        assert "".join(raw) == REPLY, chunks
+        assert "".join(spoken) == expected, chunks
+
+
+def test_empty_lexicon_passes_text_through():
+    normalizer = TtsNormalizer({})
+    stream = normalizer.stream()
+    assert stream.feed("hello wor") == ("hello ", "hello ")
+    assert stream.flush() == ("wor", "wor")